@@ -1,5 +1,10 @@
+import argparse
+import copy
+import hashlib
 import json
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import MutableMapping
 
 import ujson
@@ -1020,6 +1025,7 @@ invalid_records = {
     },
     "tags": {},
     "new_accessory": {},
+    "remove_accessory": {},
     "weight": [],
     "injury": {
         "cats": {},
@@ -1090,21 +1096,38 @@ type_subtype = {
 }
 
 
-def event_analysis(directory: str = None, blacklist: list[str] = None):
+# pristine copies of the record dicts, so every file can be analysed on its own and merged afterwards
+valid_template = copy.deepcopy(valid_records)
+invalid_template = copy.deepcopy(invalid_records)
+
+# per-file results are kept here between runs, and only files whose contents changed are analysed again
+cache_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".event_analyzer_cache.json")
+
+
+def event_analysis(directory: str = None, blacklist: list[str] = None, jobs: int = None, use_cache=True,
+                   report: str = None, interactive=True):
     global all_ids
     ea_header("Event analyzer\nv0.1", "For finding gaps in our current offering", trailing_newline=False)
     if directory is None:
         directory = "../resources/dicts/events/"
 
     if blacklist is None:
-        blacklist = ["ceremonies", "death\\death_reactions", "death\\murder",
+        blacklist = ["ceremonies", "death/death_reactions", "death/murder",
                      "disaster", "leader_den", "nutrition", "war.json"]
 
-    events = ea_init(directory, blacklist)
-    valid, all_ids = ea_split(events)
+    results = ea_init(directory, blacklist, jobs, use_cache)
+    ea_merge(results)
 
     event_flat = flatten(valid_records)
 
+    if report is not None:
+        ea_write_report(report, results)
+        print(f"Report written to {report}")
+
+    if not interactive:
+        ea_problems()
+        return
+
     # pa_problem_report()
     # ea_overview(len(all_ids))
 
@@ -1161,7 +1184,7 @@ def event_analysis(directory: str = None, blacklist: list[str] = None):
             print("Command not recognised.")
 
 
-def ea_init(directory, blacklist) -> list:
+def ea_init(directory, blacklist, jobs=None, use_cache=True) -> list:
     print("Preparing...")
     with open("../resources/dicts/conditions/injuries.json", "r") as f:
         data = ujson.loads(f.read())
@@ -1171,24 +1194,157 @@ def ea_init(directory, blacklist) -> list:
     print("OK\n")
 
     print("Gathering events...")
-    all_data = []
+    files = []
 
     # used to hide/ignore invalid or undesirable json files
-    for root, _, files in os.walk(directory):
-        for filename in files:
+    for root, dirs, filenames in os.walk(directory):
+        dirs.sort()
+        for filename in sorted(filenames):
             if not filename.endswith('.json'):
                 continue
 
             filepath = os.path.join(root, filename)
-            relative_path = os.path.relpath(str(filepath), directory)
+            relative_path = os.path.relpath(str(filepath), directory).replace("\\", "/")
 
             if relative_path.startswith(tuple(blacklist)):
                 continue
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-                all_data.extend(data)
-    print(f"OK\n")
-    return all_data
+            files.append((filepath, relative_path))
+
+    cache = ea_load_cache() if use_cache else {}
+    results = {}
+    pending = []
+    for filepath, relative_path in files:
+        with open(filepath, "rb") as f:
+            file_hash = hashlib.sha1(f.read()).hexdigest()
+        cached = cache.get(relative_path)
+        if cached is not None and cached["hash"] == file_hash:
+            results[relative_path] = dict(cached, cached=True)
+        else:
+            pending.append((filepath, relative_path, file_hash))
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for result in executor.map(ea_analyze_file, *zip(*pending)):
+                results[result["path"]] = result
+
+    if use_cache:
+        ea_save_cache(results)
+    print(f"OK ({len(files) - len(pending)} of {len(files)} files unchanged since the last run)\n")
+    return [results[relative_path] for _, relative_path in files]
+
+
+def ea_analyze_file(filepath, relative_path, file_hash) -> dict:
+    """Runs in a worker process. Splits the events of a single file into fresh record dicts."""
+    global valid_records, invalid_records, all_ids, dupe_ids
+    valid_records = copy.deepcopy(valid_template)
+    invalid_records = copy.deepcopy(invalid_template)
+    all_ids = {}
+    dupe_ids = []
+
+    start = time.perf_counter()
+    error = None
+    try:
+        with open(filepath, "r") as f:
+            ea_split(json.load(f))
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    result = {
+        "path": relative_path,
+        "hash": file_hash,
+        "event_ids": list(all_ids),
+        "dupe_ids": dupe_ids,
+        "valid": valid_records,
+        "invalid": invalid_records,
+        "error": error,
+        "seconds": time.perf_counter() - start,
+        "cached": False
+    }
+    # round trip through JSON so fresh results look exactly like cached ones (e.g. keys are always strings)
+    return ujson.loads(ujson.dumps(result))
+
+
+def ea_merge(results):
+    """Combines the per-file results, in file order. Events reusing an earlier file's ID are dropped as dupes."""
+    global valid_records, invalid_records, all_ids, dupe_ids
+    valid_records = copy.deepcopy(valid_template)
+    invalid_records = copy.deepcopy(invalid_template)
+    all_ids = {}
+    dupe_ids = []
+
+    for result in results:
+        repeated = {event_id for event_id in result["event_ids"] if event_id in all_ids}
+        dupe_ids.extend(result["dupe_ids"])
+        dupe_ids.extend(event_id for event_id in result["event_ids"] if event_id in repeated)
+        for event_id in result["event_ids"]:
+            all_ids.setdefault(event_id, True)
+
+        ea_merge_records(valid_records, result["valid"], repeated)
+        ea_merge_records(invalid_records, result["invalid"], repeated)
+
+
+def ea_merge_records(target, source, skip):
+    for key, value in source.items():
+        if isinstance(value, dict):
+            ea_merge_records(target.setdefault(key, {}), value, skip)
+        else:
+            target.setdefault(key, []).extend(record for record in value if record not in skip)
+
+
+def ea_load_cache() -> dict:
+    try:
+        with open(cache_path, "r") as f:
+            cache = ujson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+    # any change to the analyzer itself can change the results, so start over
+    if cache.get("analyzer") != ea_analyzer_hash():
+        return {}
+    return cache.get("files", {})
+
+
+def ea_save_cache(results):
+    try:
+        with open(cache_path, "w") as f:
+            f.write(ujson.dumps({"analyzer": ea_analyzer_hash(), "files": results}))
+    except OSError as e:
+        print(f"Could not save the analyzer cache: {e}")
+
+
+def ea_analyzer_hash() -> str:
+    with open(os.path.abspath(__file__), "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def ea_write_report(path, results):
+    # every "[tag missing]" list, keyed by where it was missing from
+    missing_tags = {
+        key[:-len(missing) - 1]: records
+        for key, records in flatten(invalid_records).items()
+        if key.endswith(missing) and records
+    }
+    if invalid_records["weight"]:
+        missing_tags["weight"] = invalid_records["weight"]
+
+    report = {
+        "event_count": len(all_ids),
+        "duplicate_ids": dupe_ids,
+        "missing_tags": missing_tags,
+        "invalid_records": invalid_records,
+        "files": [
+            {
+                "path": result["path"],
+                "events": len(result["event_ids"]),
+                "seconds": round(result["seconds"], 4),
+                "cached": result["cached"],
+                "error": result["error"]
+            }
+            for result in results
+        ]
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=4)
 
 
 # -------------------------------------------------
@@ -1243,7 +1399,7 @@ def ea_split(events):
             ea_add_records_with_subtype(event_id, event["tags"], valid_records["tags"], invalid_records["tags"])
 
         if "new_accessory" in event:
-            if not ("accessory" in e for e in event["sub_type"]):
+            if not ("accessory" in e for e in event.get("sub_type", [])):
                 ea_invalid_record(event_id, "[no accessory tag]", invalid_records["new_accessory"])
             ea_add_records(event_id, event["new_accessory"],
                            valid_records["new_accessory"], invalid_records["new_accessory"],
@@ -1805,4 +1961,11 @@ def ea_help():
     print('"quit"/"q": Quit the tool.')
 
 if __name__ == "__main__":
-    event_analysis()
+    parser = argparse.ArgumentParser(description="For finding gaps in our current offering")
+    parser.add_argument("--report", help="also write the results to this file as JSON")
+    parser.add_argument("--jobs", type=int, help="number of worker processes (default: one per CPU)")
+    parser.add_argument("--no-cache", action="store_true", help="analyse every file again and leave the cache alone")
+    parser.add_argument("--batch", action="store_true", help="print the problems report and exit without prompting")
+    args = parser.parse_args()
+
+    event_analysis(jobs=args.jobs, use_cache=not args.no_cache, report=args.report, interactive=not args.batch)
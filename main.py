@@ -16,6 +16,7 @@ It then loads the settings, and then loads the start screen.
 
 """  # pylint: enable=line-too-long
 from random import randrange
+import atexit
 import os
 import shutil
 import sys
@@ -23,6 +24,8 @@ import threading
 import time
 from importlib.util import find_spec
 
+launch_started = time.perf_counter()
+
 if not getattr(sys, "frozen", False):
     requiredModules = [
         "ujson",
@@ -59,8 +62,9 @@ if not getattr(sys, "frozen", False):
 del find_spec
 
 from scripts.housekeeping.log_cleanup import prune_logs
-from scripts.housekeeping.stream_duplexer import UnbufferedStreamDuplexer
-from scripts.housekeeping.datadir import get_log_dir, setup_data_dir
+from scripts.housekeeping.stream_duplexer import QueuedStreamDuplexer
+from scripts.housekeeping.datadir import get_cache_dir, get_log_dir, get_save_dir, setup_data_dir
+from scripts.housekeeping.task_graph import TaskGraph
 from scripts.housekeeping.version import get_version_info, VERSION_NAME
 
 
@@ -83,8 +87,11 @@ timestr = time.strftime("%Y%m%d_%H%M%S")
 
 stdout_file = open(get_log_dir() + f"/stdout_{timestr}.log", "a")
 stderr_file = open(get_log_dir() + f"/stderr_{timestr}.log", "a")
-sys.stdout = UnbufferedStreamDuplexer(sys.stdout, stdout_file)
-sys.stderr = UnbufferedStreamDuplexer(sys.stderr, stderr_file)
+# written from a background thread, so printing in the middle of a moon doesn't wait on the disk
+sys.stdout = QueuedStreamDuplexer(sys.stdout, stdout_file, dedupe=True)
+sys.stderr = QueuedStreamDuplexer(sys.stderr, stderr_file)
+atexit.register(sys.stdout.drain)
+atexit.register(sys.stderr.drain)
 
 # Setup logging
 import logging
@@ -117,7 +124,10 @@ def log_crash(logtype, value, tb):
     Log uncaught exceptions to file
     """
     logging.critical("Uncaught exception", exc_info=(logtype, value, tb))
-    sys.__excepthook__(type, value, tb)
+    sys.__excepthook__(logtype, value, tb)
+    # make sure the crash reaches the log files before the game closes
+    sys.stdout.drain()
+    sys.stderr.drain()
 
 
 sys.excepthook = log_crash
@@ -158,11 +168,16 @@ print("Running on commit " + get_version_info().version_number)
 
 # Load game
 from scripts.game_structure.load_cat import load_cats, version_convert
+from scripts.game_structure.save_prefetch import clear_prefetched, peek_json, prefetch_json, prefetch_json_dir
+from scripts.game_structure.frame_scheduler import frame_scheduler
+from scripts.game_structure import image_cache
 from scripts.game_structure.windows import SaveCheck
 from scripts.game_structure.game_essentials import game, MANAGER, screen
 from scripts.game_structure.discord_rpc import _DiscordRPC
+from scripts.cat.cats import Cat
 from scripts.cat.sprites import sprites
 from scripts.clan import clan_class
+from scripts.patrol.patrol import Patrol
 from scripts.utility import (
     get_text_box_theme,
     quit,
@@ -173,13 +188,17 @@ import pygame_gui
 import pygame
 
 
-# import all screens for initialization (Note - must be done after pygame_gui manager is created)
+# the images each screen used last time, so they can be loaded before the screen is opened
+image_cache.load_manifest(get_cache_dir() + "/image_manifest.json")
+atexit.register(image_cache.save_manifest, get_cache_dir() + "/image_manifest.json")
+
+# set up the screens, which are made as they are first needed (Note - must be done after pygame_gui manager is created)
 from scripts.screens.all_screens import (
     start_screen,
 )  # pylint: disable=ungrouped-imports
 
 # P Y G A M E
-clock = pygame.time.Clock()
+clock = frame_scheduler.clock
 pygame.display.set_icon(pygame.image.load("resources/images/icon.png"))
 
 game.rpc = _DiscordRPC("1076277970060185701", daemon=True)
@@ -193,26 +212,111 @@ finished_loading = False
 def load_data():
     global finished_loading
 
-    # load in the spritesheets
-    sprites.load_all()
+    # Steps that don't wait on each other run at the same time: the spritesheets are decoded while the save files
+    # are read and the cats are made.
+    startup = TaskGraph()
+    startup.add_task("sprites", sprites.load_all)
+    startup.add_task("clan list", read_clan_list)
+    startup.add_task("clan cats file", lambda: prefetch_save_files("clan_cats.json"), after=["clan list"])
+    startup.add_task("relationship files", prefetch_relationship_files, after=["clan cats file"])
+    startup.add_task("condition files", lambda: prefetch_save_files("conditions/"), after=["clan list"])
+    startup.add_task(
+        "cats", load_clan_cats, after=["clan cats file", "relationship files", "condition files"]
+    )
+    startup.add_task("clan", load_clan, after=["cats"])
+    startup.add_task("events", load_clan_events, after=["clan"])
+    startup.add_task("patrols", warm_patrols, after=["clan"])
+    startup.add_task("cat sprites", prewarm_clan_sprites, after=["sprites", "clan"])
+
+    try:
+        startup.run()
+    except Exception as e:
+        logging.exception("File failed to load")
+        if not game.switches["error_message"]:
+            game.switches[
+                "error_message"
+            ] = "There was an error loading the cats file!"
+            game.switches["traceback"] = e
+
+    print("Startup timeline:")
+    for line in startup.timeline():
+        print("    " + line)
+
+    finished_loading = True
+
 
+def read_clan_list():
     clan_list = game.read_clans()
     if clan_list:
         game.switches["clan_list"] = clan_list
-        try:
+
+
+def prefetch_save_files(path):
+    """Reads a file or directory of json files of the Clan that is about to be loaded, see save_prefetch."""
+    if not game.switches["clan_list"]:
+        return
+    path = f"{get_save_dir()}/{game.switches['clan_list'][0]}/{path}"
+    if path.endswith("/"):
+        prefetch_json_dir(path)
+    else:
+        prefetch_json([path])
+
+
+def prefetch_relationship_files():
+    """Only living cats load their relationships, see load_cats."""
+    if not game.switches["clan_list"]:
+        return
+    clan_dir = f"{get_save_dir()}/{game.switches['clan_list'][0]}"
+    cat_data = peek_json(f"{clan_dir}/clan_cats.json")
+    if not isinstance(cat_data, list):
+        return
+    prefetch_json(
+        [
+            f"{clan_dir}/relationships/{cat['ID']}_relations.json"
+            for cat in cat_data
+            if isinstance(cat, dict) and "ID" in cat and not cat.get("dead")
+        ]
+    )
+
+
+# The rest of the steps only have something to do if there is a Clan to load.
+def load_clan_cats():
+    try:
+        if game.switches["clan_list"]:
             load_cats()
-            version_info = clan_class.load_clan()
-            version_convert(version_info)
-            game.load_events()
-        except Exception as e:
-            logging.exception("File failed to load")
-            if not game.switches["error_message"]:
-                game.switches[
-                    "error_message"
-                ] = "There was an error loading the cats file!"
-                game.switches["traceback"] = e
+    finally:
+        # whatever load_cats didn't ask for won't be asked for later on
+        clear_prefetched()
+
+
+def load_clan():
+    if game.switches["clan_list"]:
+        version_info = clan_class.load_clan()
+        version_convert(version_info)
+
+
+def load_clan_events():
+    if game.switches["clan_list"]:
+        game.load_events()
+
+
+def warm_patrols():
+    """Loads the patrols of the Clan's biome and season ahead of the first patrol."""
+    if not game.switches["clan_list"] or not game.clan:
+        return
+    try:
+        Patrol().update_resources(f"{game.clan.biome.lower()}/", game.clan.current_season.lower())
+    except Exception:
+        # not needed to start the game, the patrol screen runs into the same problem later on
+        logging.exception("Patrols failed to load")
+
+
+def prewarm_clan_sprites():
+    if game.switches["clan_list"]:
+        Cat.prewarm_sprites(
+            [i for i in Cat.all_cats_list if not i.dead and not i.outside]
+        )
 
-    finished_loading = True
 
 def loading_animation():
     global finished_loading
@@ -311,7 +415,9 @@ del finished_loading
 del loading_animation
 del load_data
 
+image_cache.set_screen("start screen")
 start_screen.screen_switches()
+game.all_screens.prewarm_likely_next("start screen")
 
 if game.settings["fullscreen"]:
     version_number = pygame_gui.elements.UILabel(
@@ -352,9 +458,13 @@ cursor_img = pygame.image.load("resources/images/cursor.png").convert_alpha()
 cursor = pygame.cursors.Cursor((9, 0), cursor_img)
 disabled_cursor = pygame.cursors.Cursor(pygame.SYSTEM_CURSOR_ARROW)
 
+print(f"Start screen ready {time.perf_counter() - launch_started:.2f}s after launch")
+del launch_started
+
 
 while True:
-    time_delta = clock.tick(game.switches["fps"]) / 1000.0
+    # runs at a lower frame rate while nothing is happening, see frame_scheduler
+    time_delta = frame_scheduler.wait_for_next_frame()
     if game.switches["cur_screen"] not in ["start screen"]:
         if game.settings["dark mode"]:
             screen.fill(game.config["theme"]["dark_mode_background"])
@@ -371,7 +481,7 @@ while True:
     game.all_screens[game.current_screen].on_use()
 
     # EVENTS
-    for event in pygame.event.get():
+    for event in frame_scheduler.get_events():
         game.all_screens[game.current_screen].handle_event(event)
 
         if event.type == pygame.QUIT:
@@ -418,8 +528,10 @@ while True:
     game.update_game()
     if game.switch_screens:
         game.all_screens[game.last_screen_forupdate].exit_screen()
+        image_cache.set_screen(game.current_screen)
         game.all_screens[game.current_screen].screen_switches()
         game.switch_screens = False
+        game.all_screens.prewarm_likely_next(game.current_screen)
 
     debugmode.update1(clock)
     # END FRAME
@@ -427,3 +539,7 @@ while True:
     debugmode.update2(screen)
 
     pygame.display.update()
+
+    # sprites of cats that will likely be shown soon, a few each frame
+    if Cat.warm_sprites():
+        frame_scheduler.wake()
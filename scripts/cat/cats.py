@@ -8,6 +8,8 @@ import bisect
 import itertools
 import os.path
 import sys
+import threading
+import time
 from random import choice, randint, sample, random, choices, getrandbits, randrange
 from typing import Dict, List, Any
 
@@ -18,6 +20,7 @@ from scripts.cat.names import Name
 from scripts.cat.pelts import Pelt
 from scripts.cat.skills import CatSkills
 from scripts.cat.thoughts import Thoughts
+from scripts.cat_relations import incoming
 from scripts.cat_relations.inheritance import Inheritance
 from scripts.cat_relations.relationship import Relationship
 from scripts.conditions import (
@@ -31,12 +34,14 @@ from scripts.event_class import Single_Event
 from scripts.events_module.generate_events import GenerateEvents
 from scripts.game_structure import image_cache
 from scripts.game_structure.game_essentials import game, screen
+from scripts.game_structure.save_prefetch import read_json
 from scripts.housekeeping.datadir import get_save_dir
 from scripts.utility import (
     get_alive_status_cats,
     get_personality_compatibility,
     event_text_adjust,
     update_sprite,
+    generate_sprite,
     leader_ceremony_text_adjust,
 )
 
@@ -47,6 +52,10 @@ class Cat:
     dead_cats = []
     used_screen = screen
 
+    sprite_warmup_queue = []
+    # seconds of each frame that can be spent on the sprites waiting in sprite_warmup_queue
+    sprite_warmup_frame_time = 0.004
+
     ages = [
         "newborn",
         "kitten",
@@ -130,7 +139,24 @@ class Cat:
     all_cats_list: List[Cat] = []
     ordered_cat_list: List[Cat] = []
 
+    # mate eligibility is cached per pair of cats, and cats are bucketed by (age, dead, outside)
+    # so mate searches only need to check cats that could be eligible at all
+    potential_mate_cache = {}  # cat ID: {key: result}, each result is kept under the IDs of both cats
+    mate_buckets = None
+    mate_positions = {}  # cat ID: the cat's position in all_cats_list when the buckets were built, or between two
+    age_restricted_mate_ages = ("newborn", "kitten", "adolescent")
+
     grief_strings = {}
+    # the lowest values towards a dead cat that can make a cat react to the death, see grief
+    grief_thresholds = {
+        "romantic_love": 40,
+        "platonic_like": 30,
+        "admiration": 50,
+        "comfortable": 40,
+        "trust": 50,
+        "dislike": 50,
+        "jealousy": 50,
+    }
 
     def __init__(
         self,
@@ -149,6 +175,7 @@ class Cat:
         skill_dict=None,
         pelt: Pelt = None,
         loading_cat=False,  # Set to true if you are loading a cat at start-up.
+        register=True,
         **kwargs,
     ):
         """Initialise the cat.
@@ -168,6 +195,8 @@ class Cat:
         :param skill_dict: TODO find a good definition for this
         :param pelt: Body details, default None
         :param loading_cat: If loading a cat rather than generating a new one, default False
+        :param register: If the cat is added to all_cats and all_cats_list right away, default True. Cats made
+            ahead of time, like the pooled example cats, are added with register_cat() once they are used.
         :param kwargs: TODO what are the possible args here? ["biome", ]
         """
 
@@ -209,9 +238,9 @@ class Cat:
         self.pronouns = [self.default_pronouns[0].copy()]
         self.placement = None
         self.example = example
-        self.dead = False
+        self._dead = False
+        self._outside = False
         self.exiled = False
-        self.outside = False
         self.driven_out = False
         self.dead_for = 0  # moons
         self.thought = ""
@@ -250,16 +279,7 @@ class Cat:
 
         # setting ID
         if ID is None:
-            potential_id = str(next(Cat.id_iter))
-
-            if game.clan:
-                faded_cats = game.clan.faded_ids
-            else:
-                faded_cats = []
-
-            while potential_id in self.all_cats or potential_id in faded_cats:
-                potential_id = str(next(Cat.id_iter))
-            self.ID = potential_id
+            self.ID = Cat.get_new_id()
         else:
             self.ID = ID
 
@@ -343,12 +363,39 @@ class Cat:
 
         # Private Sprite
         self._sprite = None
+        self._sprite_state = None
+
+        if register:
+            self.register_cat()
+
+    @staticmethod
+    def get_new_id() -> str:
+        """Returns an ID that no cat, faded or not, has yet."""
+        potential_id = str(next(Cat.id_iter))
+
+        if game.clan:
+            faded_cats = game.clan.faded_ids
+        else:
+            faded_cats = []
+
+        while potential_id in Cat.all_cats or potential_id in faded_cats:
+            potential_id = str(next(Cat.id_iter))
+        return potential_id
+
+    def register_cat(self):
+        """Adds the cat to all_cats and all_cats_list. Only needed for cats made with register=False."""
+        if Cat.all_cats.get(self.ID, self) is not self:
+            # another cat got this ID while this one was waiting to be used
+            self.ID = Cat.get_new_id()
 
         # SAVE CAT INTO ALL_CATS DICTIONARY IN CATS-CLASS
         self.all_cats[self.ID] = self
+        # anything still cached under this ID belonged to a cat that had it before
+        self.mate_index_changed()
 
         if self.ID not in ["0", None]:
             Cat.insert_cat(self)
+            self.add_to_mate_buckets()
 
     def init_faded(self, ID, status, prefix, suffix, moons, **kwargs):
         """Perform faded-specific initialisation
@@ -626,13 +673,16 @@ class Cat:
         body_treated = False
         text = None
 
-        # apply grief to cats with high positive relationships to dead cat
-        for cat in Cat.all_cats.values():
-            if cat.dead or cat.outside or cat.moons < 1:
-                continue
+        # apply grief to cats with high positive relationships to dead cat. cats whose values are all below
+        # the lowest thresholds used below don't react, so only those above one of them are looked at
+        grieving = {}
+        for value_name, threshold in Cat.grief_thresholds.items():
+            for relationship in incoming.get_incoming(self, value_name, minimum=threshold):
+                grieving[relationship] = None
 
-            to_self = cat.relationships.get(self.ID)
-            if not isinstance(to_self, Relationship):
+        for to_self in grieving:
+            cat = to_self.cat_from
+            if cat.dead or cat.outside or cat.moons < 1:
                 continue
 
             family_relation = self.familial_grief(living_cat=cat)
@@ -1038,42 +1088,41 @@ class Cat:
             )
             return
         try:
-            with open(cat_history_directory, "r", encoding="utf-8") as read_file:
-                history_data = ujson.loads(read_file.read())
-                self.history = History(
-                    beginning=(
-                        history_data["beginning"] if "beginning" in history_data else {}
-                    ),
-                    mentor_influence=(
-                        history_data["mentor_influence"]
-                        if "mentor_influence" in history_data
-                        else {}
-                    ),
-                    app_ceremony=(
-                        history_data["app_ceremony"]
-                        if "app_ceremony" in history_data
-                        else {}
-                    ),
-                    lead_ceremony=(
-                        history_data["lead_ceremony"]
-                        if "lead_ceremony" in history_data
-                        else None
-                    ),
-                    possible_history=(
-                        history_data["possible_history"]
-                        if "possible_history" in history_data
-                        else {}
-                    ),
-                    died_by=(
-                        history_data["died_by"] if "died_by" in history_data else []
-                    ),
-                    scar_events=(
-                        history_data["scar_events"]
-                        if "scar_events" in history_data
-                        else []
-                    ),
-                    murder=history_data["murder"] if "murder" in history_data else {},
-                )
+            history_data = read_json(cat_history_directory)
+            self.history = History(
+                beginning=(
+                    history_data["beginning"] if "beginning" in history_data else {}
+                ),
+                mentor_influence=(
+                    history_data["mentor_influence"]
+                    if "mentor_influence" in history_data
+                    else {}
+                ),
+                app_ceremony=(
+                    history_data["app_ceremony"]
+                    if "app_ceremony" in history_data
+                    else {}
+                ),
+                lead_ceremony=(
+                    history_data["lead_ceremony"]
+                    if "lead_ceremony" in history_data
+                    else None
+                ),
+                possible_history=(
+                    history_data["possible_history"]
+                    if "possible_history" in history_data
+                    else {}
+                ),
+                died_by=(
+                    history_data["died_by"] if "died_by" in history_data else []
+                ),
+                scar_events=(
+                    history_data["scar_events"]
+                    if "scar_events" in history_data
+                    else []
+                ),
+                murder=history_data["murder"] if "murder" in history_data else {},
+            )
         except:
             self.history = None
             print(
@@ -1782,15 +1831,16 @@ class Cat:
         return other_cat.ID in self.inheritance.cousins.keys()
 
     def is_related(self, other_cat, cousin_allowed):
-        """Checks if the given cat is related to the current cat, according to the inheritance."""
+        """Checks if the given cat is related to the current cat, according to the inheritance.
+        Relatives are kept in sets, so this is a constant time lookup."""
         if not self.inheritance:
             self.inheritance = Inheritance(self)
         if cousin_allowed:
             return other_cat.ID in self.inheritance.all_but_cousins
         return other_cat.ID in self.inheritance.all_involved
 
-    def get_relatives(self, cousin_allowed=True) -> list:
-        """Returns a list of ids of all nearly related ancestors."""
+    def get_relatives(self, cousin_allowed=True) -> set:
+        """Returns a set of ids of all nearly related ancestors."""
         if not self.inheritance:
             self.inheritance = Inheritance(self)
         if cousin_allowed:
@@ -2257,11 +2307,10 @@ class Cat:
             return
 
         try:
-            with open(condition_cat_directory, "r", encoding="utf-8") as read_file:
-                rel_data = ujson.loads(read_file.read())
-                self.illnesses = rel_data.get("illnesses", {})
-                self.injuries = rel_data.get("injuries", {})
-                self.permanent_condition = rel_data.get("permanent conditions", {})
+            rel_data = read_json(condition_cat_directory)
+            self.illnesses = rel_data.get("illnesses", {})
+            self.injuries = rel_data.get("injuries", {})
+            self.permanent_condition = rel_data.get("permanent conditions", {})
 
             if "paralyzed" in self.permanent_condition and not self.pelt.paralyzed:
                 self.pelt.paralyzed = True
@@ -2315,6 +2364,8 @@ class Cat:
             return
         if self.ID in mentor_cat.apprentice:
             mentor_cat.apprentice.remove(self.ID)
+        self.mate_index_changed()
+        mentor_cat.mate_index_changed()
         if self.moons > 6 and self.ID not in mentor_cat.former_apprentices:
             mentor_cat.former_apprentices.append(self.ID)
         if self.moons > 6 and mentor_cat.ID not in self.former_mentor:
@@ -2331,6 +2382,8 @@ class Cat:
             return
         if self.ID not in mentor_cat.apprentice:
             mentor_cat.apprentice.append(self.ID)
+        self.mate_index_changed()
+        mentor_cat.mate_index_changed()
 
     def update_mentor(self, new_mentor: Any = None):
         """Takes mentor's ID as argument, mentor could just be set via this function."""
@@ -2393,14 +2446,51 @@ class Cat:
         """
         Checks if this cat is potential mate for the other cat.
         There are no restrictions if the current cat already has a mate or not (this allows poly-mates).
+        The result is cached until the cats' relatives, mentors, age groups or dead/outside state change.
         """
 
+        former_mentor_mates = None
         try:
             first_cousin_mates = game.clan.clan_settings["first cousin mates"]
+            former_mentor_mates = game.clan.clan_settings["romantic with former mentor"]
         except:
             if "unittest" not in sys.modules:
                 raise
 
+        # the moons are part of the key, since the allowed age gap can change while the age group doesn't
+        key = (
+            self.ID,
+            other_cat.ID,
+            for_love_interest,
+            age_restriction,
+            first_cousin_mates,
+            ignore_no_mates,
+            former_mentor_mates,
+            self.moons,
+            other_cat.moons,
+            self.no_mates,
+            other_cat.no_mates,
+        )
+        cached = Cat.potential_mate_cache.get(self.ID)
+        if cached is not None and key in cached:
+            return cached[key]
+
+        result = self._check_potential_mate(
+            other_cat, for_love_interest, age_restriction, first_cousin_mates, ignore_no_mates
+        )
+        Cat.potential_mate_cache.setdefault(self.ID, {})[key] = result
+        Cat.potential_mate_cache.setdefault(other_cat.ID, {})[key] = result
+        return result
+
+    def _check_potential_mate(
+        self,
+        other_cat: Cat,
+        for_love_interest: bool,
+        age_restriction: bool,
+        first_cousin_mates: bool,
+        ignore_no_mates: bool,
+    ):
+        """Does the actual checks for is_potential_mate."""
         # just to be sure, check if it is not the same cat
         if self.ID == other_cat.ID:
             return False
@@ -2435,8 +2525,7 @@ class Cat:
                 ):
                     return False
 
-        age_restricted_ages = ["newborn", "kitten", "adolescent"]
-        if self.age in age_restricted_ages or other_cat.age in age_restricted_ages:
+        if self.age in Cat.age_restricted_mate_ages or other_cat.age in Cat.age_restricted_mate_ages:
             if self.age != other_cat.age:
                 return False
 
@@ -2463,6 +2552,154 @@ class Cat:
 
         return True
 
+    def get_potential_mates(
+        self,
+        for_love_interest: bool = False,
+        age_restriction: bool = True,
+        ignore_no_mates: bool = False,
+    ) -> list:
+        """
+        Returns all cats that are potential mates for this cat (see is_potential_mate), in the order of
+        all_cats_list. Only cats with a matching dead/outside state and a compatible age group are checked.
+        """
+        if self.outside:
+            return []
+
+        self_restricted = self.age in Cat.age_restricted_mate_ages
+        potential_mates = []
+        for (age, dead, outside), cats in Cat.get_mate_buckets().items():
+            if dead != self.dead or outside:
+                continue
+            # kits and adolescents can only be potential mates of cats in the same age group
+            if (self_restricted or age in Cat.age_restricted_mate_ages) and age != self.age:
+                continue
+            potential_mates.extend(
+                (position, other_cat)
+                for position, other_cat in cats
+                if self.is_potential_mate(
+                    other_cat,
+                    for_love_interest=for_love_interest,
+                    age_restriction=age_restriction,
+                    ignore_no_mates=ignore_no_mates,
+                )
+            )
+        potential_mates.sort(key=lambda x: x[0])
+        return [other_cat for _, other_cat in potential_mates]
+
+    @staticmethod
+    def get_mate_buckets() -> dict:
+        """Returns the cats of all_cats_list grouped by (age, dead, outside), building the groups if needed.
+        Each cat is stored with its position in all_cats_list, so results can be kept in the list's order."""
+        mate_buckets = Cat.mate_buckets
+        if mate_buckets is None:
+            # built on the side and set in one go, so Cat.mate_buckets is never half-built
+            mate_buckets = {}
+            mate_positions = {}
+            for position, inter_cat in enumerate(Cat.all_cats_list):
+                mate_buckets.setdefault(inter_cat.get_mate_bucket(), []).append(
+                    (position, inter_cat)
+                )
+                mate_positions[inter_cat.ID] = position
+            Cat.mate_positions = mate_positions
+            Cat.mate_buckets = mate_buckets
+        return mate_buckets
+
+    def get_mate_bucket(self) -> tuple:
+        """Returns the key of the mate bucket the cat belongs in."""
+        return self.age, self.dead, self.outside
+
+    @staticmethod
+    def living_cat_count() -> int:
+        """Returns the number of cats which are neither dead nor outside the clan, using the mate buckets."""
+        return sum(
+            len(cats)
+            for (_, dead, outside), cats in Cat.get_mate_buckets().items()
+            if not (dead or outside)
+        )
+
+    def mate_index_changed(self, old_bucket=None):
+        """
+        Drops the cached mate eligibility of this cat after something is_potential_mate reads of it has changed.
+        If its age, dead or outside state changed, pass the mate bucket it was in before, so it is moved.
+        """
+        if Cat.all_cats.get(getattr(self, "ID", None)) is not self:
+            # cats that aren't registered, like the example cats made in the background, aren't in the index
+            return
+
+        for key in Cat.potential_mate_cache.pop(self.ID, {}):
+            other_id = key[1] if key[0] == self.ID else key[0]
+            Cat.potential_mate_cache.get(other_id, {}).pop(key, None)
+
+        if old_bucket is not None and old_bucket != self.get_mate_bucket():
+            position = self.remove_from_mate_buckets(old_bucket)
+            if position is not None:
+                Cat.mate_positions[self.ID] = position
+                bisect.insort(
+                    Cat.mate_buckets.setdefault(self.get_mate_bucket(), []),
+                    (position, self),
+                    key=lambda x: x[0],
+                )
+
+    def add_to_mate_buckets(self):
+        """Adds a cat that was just put into all_cats_list to the mate buckets, if they have been built."""
+        if Cat.mate_buckets is None:
+            return
+        index = Cat.all_cats_list.index(self)
+        before = (
+            Cat.mate_positions.get(Cat.all_cats_list[index - 1].ID) if index > 0 else None
+        )
+        after = (
+            Cat.mate_positions.get(Cat.all_cats_list[index + 1].ID)
+            if index + 1 < len(Cat.all_cats_list)
+            else None
+        )
+        # the positions only need to keep the order of all_cats_list, so the new cat goes between its neighbours
+        if before is not None and after is not None:
+            position = (before + after) / 2
+        elif before is not None:
+            position = before + 1
+        elif after is not None:
+            position = after - 1
+        else:
+            position = 0
+        missing_neighbour = (index > 0 and before is None) or (
+            index + 1 < len(Cat.all_cats_list) and after is None
+        )
+        if missing_neighbour or position in (before, after):
+            # a neighbour isn't in the buckets, or there is no room left between them
+            Cat.invalidate_mate_index()
+            return
+
+        Cat.mate_positions[self.ID] = position
+        bisect.insort(
+            Cat.mate_buckets.setdefault(self.get_mate_bucket(), []),
+            (position, self),
+            key=lambda x: x[0],
+        )
+
+    def remove_from_mate_buckets(self, bucket=None):
+        """Takes the cat out of the mate buckets, e.g. when it is removed from all_cats_list.
+        Returns its position, or None if it wasn't in them."""
+        if Cat.mate_buckets is None:
+            return None
+        position = Cat.mate_positions.pop(self.ID, None)
+        cats = Cat.mate_buckets.get(bucket or self.get_mate_bucket(), [])
+        index = bisect.bisect_left(cats, position, key=lambda x: x[0]) if position is not None else len(cats)
+        if index < len(cats) and cats[index][1] is self:
+            del cats[index]
+            return position
+        # not where it should be, so the buckets are out of date
+        Cat.invalidate_mate_index()
+        return None
+
+    @staticmethod
+    def invalidate_mate_index():
+        """Drops all cached mate eligibility and the mate buckets, e.g. after all_cats_list was sorted.
+        For changes to a single cat, use mate_index_changed instead."""
+        Cat.potential_mate_cache.clear()
+        Cat.mate_buckets = None
+        Cat.mate_positions = {}
+
     def unset_mate(self, other_cat: Cat, breakup: bool = False, fight: bool = False):
         """Unset the mate from both self and other_cat"""
         if not other_cat:
@@ -2522,8 +2759,9 @@ class Cat:
         if self.inheritance:
             self.inheritance.update_all_mates()
 
-    def set_mate(self, other_cat: Cat):
-        """Sets up a mate relationship between self and other_cat."""
+    def set_mate(self, other_cat: Cat, update_inheritance=True):
+        """Sets up a mate relationship between self and other_cat.
+        Set update_inheritance to False when setting many mates at once, and update the inheritances afterwards."""
         if other_cat.ID not in self.mate:
             self.mate.append(other_cat.ID)
         if self.ID not in other_cat.mate:
@@ -2535,10 +2773,11 @@ class Cat:
         if self.ID in other_cat.previous_mates:
             other_cat.previous_mates.remove(self.ID)
 
-        if other_cat.inheritance:
-            other_cat.inheritance.update_all_mates()
-        if self.inheritance:
-            self.inheritance.update_all_mates()
+        if update_inheritance:
+            if other_cat.inheritance:
+                other_cat.inheritance.update_all_mates()
+            if self.inheritance:
+                self.inheritance.update_all_mates()
 
         # Set starting relationship values
         if not self.dead:
@@ -2566,6 +2805,30 @@ class Cat:
         # set the born status to true, just for safety
         self.inheritance = Inheritance(self, True)
 
+    @staticmethod
+    def create_inheritance_new_cats(cats):
+        """
+        Creates the inheritance class for a batch of new cats, e.g. a litter. All cats of the batch must be in
+        all_cats already. Their relatives are updated once for the whole batch, instead of once per new cat.
+        """
+        for cat in cats:
+            cat.inheritance = Inheritance(cat)
+        Cat.update_related_inheritance(cats)
+
+    @staticmethod
+    def update_related_inheritance(cats):
+        """Updates the inheritances of all the cats related to any of the given cats, once each."""
+        batch_ids = {cat.ID for cat in cats}
+        related = set()
+        for cat in cats:
+            related.update(cat.inheritance.all_involved)
+
+        for cat_id in related - batch_ids:
+            # Don't update the inheritance of faded cats
+            related_cat = Cat.fetch_cat(cat_id)
+            if cat_id in Inheritance.all_inheritances and related_cat and not related_cat.faded:
+                Inheritance.all_inheritances[cat_id].update_inheritance()
+
     def create_one_relationship(self, other_cat: Cat):
         """Create a new relationship between current cat and other cat. Returns: Relationship"""
         if other_cat.ID in self.relationships:
@@ -2582,26 +2845,30 @@ class Cat:
 
     def create_relationships_new_cat(self):
         """Create relationships for a new generated cat."""
-        for inter_cat in Cat.all_cats.values():
-            # the inter_cat is the same as the current cat
-            if inter_cat.ID == self.ID:
-                continue
-            # if the cat already has (somehow) a relationship with the inter cat
-            if inter_cat.ID in self.relationships:
-                continue
-            # if they dead (dead cats have no relationships)
-            if self.dead or inter_cat.dead:
-                continue
-            # if they are not outside of the Clan at the same time
-            if (
-                self.outside
-                and not inter_cat.outside
-                or not self.outside
-                and inter_cat.outside
-            ):
+        Cat.create_relationships_new_cats([self])
+
+    @staticmethod
+    def create_relationships_new_cats(cats):
+        """
+        Create relationships for a batch of new generated cats, e.g. a litter, in one pass over the Clan.
+        Gives the same relationships as calling create_relationships_new_cat for each cat in turn.
+        """
+        # dead cats have no relationships, and cats only know the cats on the same side of the Clan border
+        new_cats = {True: [], False: []}
+        for new_cat in cats:
+            if not new_cat.dead:
+                new_cats[bool(new_cat.outside)].append(new_cat)
+
+        for inter_cat in list(Cat.all_cats.values()):
+            if inter_cat.dead:
                 continue
-            inter_cat.relationships[self.ID] = Relationship(inter_cat, self)
-            self.relationships[inter_cat.ID] = Relationship(self, inter_cat)
+            for new_cat in new_cats[bool(inter_cat.outside)]:
+                # the inter_cat is the same as the current cat, or the cat already has (somehow)
+                # a relationship with the inter cat - this includes cats of the same batch
+                if inter_cat.ID == new_cat.ID or inter_cat.ID in new_cat.relationships:
+                    continue
+                inter_cat.relationships[new_cat.ID] = Relationship(inter_cat, new_cat)
+                new_cat.relationships[inter_cat.ID] = Relationship(new_cat, inter_cat)
 
     def init_all_relationships(self):
         """Create Relationships to all current Clancats."""
@@ -2741,31 +3008,30 @@ class Cat:
                     cat.create_one_relationship(self)
                 return
             try:
-                with open(relation_cat_directory, "r", encoding="utf-8") as read_file:
-                    rel_data = ujson.loads(read_file.read())
-                    for rel in rel_data:
-                        cat_to = self.all_cats.get(rel["cat_to_id"])
-                        if cat_to is None or rel["cat_to_id"] == self.ID:
-                            continue
-                        new_rel = Relationship(
-                            cat_from=self,
-                            cat_to=cat_to,
-                            mates=rel["mates"] if rel["mates"] else False,
-                            family=rel["family"] if rel["family"] else False,
-                            romantic_love=(
-                                rel["romantic_love"] if rel["romantic_love"] else 0
-                            ),
-                            platonic_like=(
-                                rel["platonic_like"] if rel["platonic_like"] else 0
-                            ),
-                            dislike=rel["dislike"] if rel["dislike"] else 0,
-                            admiration=rel["admiration"] if rel["admiration"] else 0,
-                            comfortable=rel["comfortable"] if rel["comfortable"] else 0,
-                            jealousy=rel["jealousy"] if rel["jealousy"] else 0,
-                            trust=rel["trust"] if rel["trust"] else 0,
-                            log=rel["log"],
-                        )
-                        self.relationships[rel["cat_to_id"]] = new_rel
+                rel_data = read_json(relation_cat_directory)
+                for rel in rel_data:
+                    cat_to = self.all_cats.get(rel["cat_to_id"])
+                    if cat_to is None or rel["cat_to_id"] == self.ID:
+                        continue
+                    new_rel = Relationship(
+                        cat_from=self,
+                        cat_to=cat_to,
+                        mates=rel["mates"] if rel["mates"] else False,
+                        family=rel["family"] if rel["family"] else False,
+                        romantic_love=(
+                            rel["romantic_love"] if rel["romantic_love"] else 0
+                        ),
+                        platonic_like=(
+                            rel["platonic_like"] if rel["platonic_like"] else 0
+                        ),
+                        dislike=rel["dislike"] if rel["dislike"] else 0,
+                        admiration=rel["admiration"] if rel["admiration"] else 0,
+                        comfortable=rel["comfortable"] if rel["comfortable"] else 0,
+                        jealousy=rel["jealousy"] if rel["jealousy"] else 0,
+                        trust=rel["trust"] if rel["trust"] else 0,
+                        log=rel["log"],
+                    )
+                    self.relationships[rel["cat_to_id"]] = new_rel
             except:
                 print(
                     f"WARNING: There was an error reading the relationship file of cat #{self}."
@@ -3102,9 +3368,7 @@ class Cat:
 
         file_name += ".png"
 
-        self.sprite = image_cache.load_image(
-            f"sprites/faded/{file_name}"
-        ).convert_alpha()
+        self.sprite = image_cache.load_image(f"sprites/faded/{file_name}")
 
     @staticmethod
     def fetch_cat(ID: str):
@@ -3195,6 +3459,8 @@ class Cat:
             given_list = []
         if not given_list:
             given_list = Cat.all_cats_list
+            # the mate buckets remember positions in all_cats_list
+            Cat.invalidate_mate_index()
         if game.sort_type == "age":
             given_list.sort(key=lambda x: Cat.get_adjusted_age(x))
         elif game.sort_type == "reverse_age":
@@ -3306,6 +3572,7 @@ class Cat:
     @moons.setter
     def moons(self, value: int):
         self._moons = value
+        old_age = getattr(self, "age", None)
 
         updated_age = False
         for key_age in self.age_moons.keys():
@@ -3320,16 +3587,103 @@ class Cat:
         except AttributeError:
             print("ERROR: cat has no age attribute! Cat ID: " + self.ID)
 
+        if self.age != old_age:
+            self.mate_index_changed((old_age, self.dead, self.outside))
+
+    @property
+    def dead(self):
+        return self._dead
+
+    @dead.setter
+    def dead(self, value: bool):
+        old_dead = getattr(self, "_dead", None)
+        self._dead = value
+        if value != old_dead:
+            self.mate_index_changed((self.age, old_dead, self.outside))
+
+    @property
+    def outside(self):
+        return self._outside
+
+    @outside.setter
+    def outside(self, value: bool):
+        old_outside = getattr(self, "_outside", None)
+        self._outside = value
+        if value != old_outside:
+            self.mate_index_changed((self.age, self.dead, old_outside))
+
     @property
     def sprite(self):
-        # Update the sprite
-        update_sprite(self)
+        """The cat's sprite. It is generated on first read and regenerated only once something it
+        depends on (pelt, age, status, conditions, fading or sprite settings) has changed."""
+        if not self.faded:
+            sprite_state = self.get_sprite_state()
+            if self._sprite is None or sprite_state != self._sprite_state:
+                update_sprite(self)
+                self._sprite_state = sprite_state
         return self._sprite
 
     @sprite.setter
     def sprite(self, new_sprite):
         self._sprite = new_sprite
 
+    def mark_sprite_stale(self):
+        """Forces the sprite to be regenerated the next time it is read."""
+        self._sprite_state = None
+
+    def get_sprite_state(self) -> tuple:
+        """Returns everything generate_sprite reads, in a form that can be compared cheaply."""
+        return (
+            self.age,
+            self.status,
+            self.dead,
+            self.df,
+            self.not_working(),
+            self.prevent_fading,
+            # the pelt notes down when any of its attributes is set, only the lists can change without that
+            self.pelt.last_change,
+            tuple(self.pelt.scars),
+            tuple(self.pelt.accessories),
+            game.clan.clan_settings["fading"] if game.clan else None,
+            game.settings["shaders"],
+            game.settings["new accessories"],
+        )
+
+    @staticmethod
+    def update_sprites(cats):
+        """Regenerates the sprites of all the given cats that are out of date. Unlike reading cat.sprite,
+        this doesn't put the cats into all_cats."""
+        for cat in cats:
+            if cat.faded:
+                continue
+            sprite_state = cat.get_sprite_state()
+            if cat._sprite is None or sprite_state != cat._sprite_state:
+                cat._sprite = generate_sprite(cat)
+                cat._sprite_state = sprite_state
+
+    @staticmethod
+    def prewarm_sprites(cats):
+        """Queues up the sprites of cats that are likely to be shown soon, so warm_sprites generates them a few
+        at a time before they are first drawn. Replaces any cats still waiting from an earlier call."""
+        Cat.sprite_warmup_queue = [i for i in cats if not i.faded]
+
+    @staticmethod
+    def warm_sprites() -> bool:
+        """
+        Generates queued sprites for up to sprite_warmup_frame_time seconds. Called once a frame by the main loop,
+        since pygame surfaces can't be drawn from two threads at once. Returns True if there are cats left.
+        """
+        queue = Cat.sprite_warmup_queue
+        stop_at = time.perf_counter() + Cat.sprite_warmup_frame_time
+        while queue and time.perf_counter() < stop_at:
+            cat = queue.pop(0)
+            try:
+                Cat.update_sprites([cat])
+            except Exception:
+                # the sprite will be generated again, with its error, when it is actually drawn
+                cat.mark_sprite_stale()
+        return bool(queue)
+
     # ---------------------------------------------------------------------------- #
     #                                  other                                       #
     # ---------------------------------------------------------------------------- #
@@ -3718,9 +4072,18 @@ class Personality:
             # This will only trigger if they have the same personality.
             return None
 
+def _freeze(value):
+    """Converts nested lists and dicts into tuples, so they can be compared and stored."""
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 # Creates a random cat
-def create_cat(status, moons=None, biome=None):
-    new_cat = Cat(status=status, biome=biome)
+def create_cat(status, moons=None, biome=None, register=True):
+    new_cat = Cat(status=status, biome=biome, register=register)
     
     if moons is not None:
         new_cat.moons = moons
@@ -3747,10 +4110,74 @@ def create_example_cats():
     
     for cat_index in range(12):
         if cat_index in warrior_indices:
-            game.choose_cats[cat_index] = create_cat(status='warrior')
+            game.choose_cats[cat_index] = example_cat_pool.take('warrior')
         else:
             random_status = choice(['kitten', 'apprentice', 'warrior', 'warrior', 'elder'])
-            game.choose_cats[cat_index] = create_cat(status=random_status)
+            game.choose_cats[cat_index] = example_cat_pool.take(random_status)
+
+    # get the next roll ready
+    example_cat_pool.fill()
+
+
+class ExampleCatPool:
+    """
+    Example cats for clan creation, made ahead of time on a background thread so a reroll doesn't have to wait for
+    twelve new cats. The pool is filled after each roll on the clan creation screen, for the next reroll. The cats in the pool aren't in any cat list yet - they are only registered once taken, so
+    the cats that are never used don't have to be cleaned up again.
+    """
+
+    # how many ready cats of each status to keep, enough for a full roll
+    targets = {"kitten": 3, "apprentice": 3, "warrior": 9, "elder": 3}
+
+    def __init__(self):
+        self.ready = {status: [] for status in self.targets}
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def fill(self):
+        """Starts filling the pool up on a background thread, if it isn't already."""
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._fill, daemon=True)
+                self.thread.start()
+
+    def _fill(self):
+        while True:
+            with self.lock:
+                missing = {
+                    status: target - len(self.ready[status])
+                    for status, target in self.targets.items()
+                    if len(self.ready[status]) < target
+                }
+                if not missing:
+                    self.thread = None
+                    return
+                status = max(missing, key=missing.get)
+
+            try:
+                # the sprite is left for the main thread, pygame surfaces can't be drawn from two threads at once
+                new_cat = create_cat(status=status, register=False)
+            except Exception:
+                # take() will make the cats itself instead
+                with self.lock:
+                    self.thread = None
+                return
+
+            with self.lock:
+                self.ready[status].append(new_cat)
+
+    def take(self, status):
+        """Returns a registered example cat of the given status, from the pool if there is one ready."""
+        with self.lock:
+            new_cat = self.ready[status].pop(0) if self.ready.get(status) else None
+
+        if new_cat is None:
+            return create_cat(status=status)
+        new_cat.register_cat()
+        return new_cat
+
+
+example_cat_pool = ExampleCatPool()
 
 
 # CAT CLASS ITEMS
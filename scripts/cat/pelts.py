@@ -1,3 +1,4 @@
+import itertools
 import random
 from random import choice
 from re import sub
@@ -362,6 +363,14 @@ class Pelt():
     
     """Holds all appearance information for a cat. """
 
+    # numbers handed out to last_change, they never repeat so no two changes look the same
+    _changes = itertools.count()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # lets Cat.get_sprite_state notice changes without comparing every attribute
+        super().__setattr__("last_change", next(Pelt._changes))
+
     def __init__(self,
                  name: str = "SingleColour",
                  length: str = "short",
@@ -0,0 +1,124 @@
+"""
+Cache for the tinted layers cat sprites are composed from.
+
+generate_sprite used to copy and tint the pelt, tortie patches, white patches, points and eyes for every single
+render. There are only so many combinations of sprite, tint and pose though, so each of those layers is made once
+here and then just blitted. Layers are shared, so never draw onto them - copy them first.
+
+The cache is only touched with _lock held, so it can be used from more than one thread.
+"""
+
+import threading
+
+import pygame
+
+from scripts.cat.sprites import sprites
+
+# roughly 10 KB per layer at the default sprite size. Once full, the oldest layers are dropped.
+MAX_LAYERS = 2000
+
+_layers = {}
+_lock = threading.Lock()
+
+
+def base_coat(pelt, cat_sprite) -> pygame.Surface:
+    """
+    Returns the pelt for the given pose, including tortie patches, with the pelt tint and dilute tint applied.
+    """
+    if pelt.name not in ["Tortie", "Calico"]:
+        patches = None
+        base = pelt.get_sprites_name() + pelt.colour
+    else:
+        if pelt.tortiepattern == "Single":
+            tortie_pattern = "SingleColour"
+        else:
+            tortie_pattern = pelt.tortiepattern
+        patches = (tortie_pattern + pelt.tortiecolour, pelt.pattern)
+        base = pelt.tortiebase + pelt.colour
+
+    key = ("base", base, patches, pelt.tint, cat_sprite)
+    layer = _lookup(key)
+    if layer is not None:
+        return layer
+
+    layer = pygame.Surface((sprites.size, sprites.size), pygame.HWSURFACE | pygame.SRCALPHA)
+    layer.blit(sprites.sprites[base + cat_sprite], (0, 0))
+    if patches:
+        layer.blit(tortie_patches(patches[0], patches[1], cat_sprite), (0, 0))
+
+    if pelt.tint != "none" and pelt.tint in sprites.cat_tints["tint_colours"]:
+        # Multiply with alpha does not work as you would expect - it just lowers the alpha of the
+        # entire surface. To get around this, we first blit the tint onto a white background to dull it,
+        # then blit the surface onto the sprite with pygame.BLEND_RGB_MULT
+        tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
+        tint.fill(tuple(sprites.cat_tints["tint_colours"][pelt.tint]))
+        layer.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+    if pelt.tint != "none" and pelt.tint in sprites.cat_tints["dilute_tint_colours"]:
+        tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
+        tint.fill(tuple(sprites.cat_tints["dilute_tint_colours"][pelt.tint]))
+        layer.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+
+    return _store(key, layer)
+
+
+def tortie_patches(patch_sprite, mask, cat_sprite) -> pygame.Surface:
+    """Returns the tortie patch colour, cut to the shape of the tortie mask."""
+    key = ("tortie", patch_sprite, mask, cat_sprite)
+    layer = _lookup(key)
+    if layer is not None:
+        return layer
+
+    layer = sprites.sprites[patch_sprite + cat_sprite].copy()
+    layer.blit(
+        sprites.sprites["tortiemask" + mask + cat_sprite],
+        (0, 0),
+        special_flags=pygame.BLEND_RGBA_MULT,
+    )
+    return _store(key, layer)
+
+
+def white(white_sprite, tint, cat_sprite) -> pygame.Surface:
+    """Returns white patches or points with the white patches tint applied."""
+    key = ("white", white_sprite, tint, cat_sprite)
+    layer = _lookup(key)
+    if layer is not None:
+        return layer
+
+    layer = sprites.sprites["white" + white_sprite + cat_sprite]
+    if tint != "none" and tint in sprites.white_patches_tints["tint_colours"]:
+        layer = layer.copy()
+        tint_layer = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
+        tint_layer.fill(tuple(sprites.white_patches_tints["tint_colours"][tint]))
+        layer.blit(tint_layer, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+    return _store(key, layer)
+
+
+def eyes(eye_colour, eye_colour2, cat_sprite) -> pygame.Surface:
+    """Returns the eyes, including heterochromia."""
+    key = ("eyes", eye_colour, eye_colour2, cat_sprite)
+    layer = _lookup(key)
+    if layer is not None:
+        return layer
+
+    layer = sprites.sprites["eyes" + eye_colour + cat_sprite]
+    if eye_colour2 is not None:
+        layer = layer.copy()
+        layer.blit(sprites.sprites["eyes2" + eye_colour2 + cat_sprite], (0, 0))
+    return _store(key, layer)
+
+
+def _lookup(key):
+    with _lock:
+        return _layers.get(key)
+
+
+def _store(key, layer):
+    with _lock:
+        # another thread may have made the same layer in the meantime, hand out the same one as it did
+        if key in _layers:
+            return _layers[key]
+        if len(_layers) >= MAX_LAYERS:
+            # dicts keep insertion order, so this is the oldest layer
+            del _layers[next(iter(_layers))]
+        _layers[key] = layer
+    return layer
@@ -3,8 +3,13 @@ from random import choice
 
 import ujson
 
+from scripts.game_structure.weighted_choice import AliasTable
+
 
 class Thoughts:
+    # thought file paths: AliasTable of all the thoughts in those files (None if there are none), loaded once
+    thought_pools = {}
+
     @staticmethod
     def thought_fulfill_rel_constraints(main_cat, random_cat, constraint) -> bool:
         """Check if the relationship fulfills the interaction relationship constraints."""
@@ -269,7 +274,9 @@ class Thoughts:
         return created_list
 
     @staticmethod
-    def load_thoughts(main_cat, other_cat, game_mode, biome, season, camp):
+    def get_thought_pool(main_cat):
+        """Returns an AliasTable of all the thoughts the cat could have, before checking any constraints.
+        The thought files are only read the first time they are needed."""
         base_path = f"resources/dicts/thoughts/"
         status = main_cat.status
 
@@ -301,17 +308,24 @@ class Thoughts:
             spec_dir = ""
 
         # newborns only pull from their status thoughts. this is done for convenience
+        if main_cat.age == 'newborn':
+            paths = (f"{base_path}{life_dir}{spec_dir}/newborn.json",)
+        else:
+            paths = (f"{base_path}{life_dir}{spec_dir}/{status}.json", f"{base_path}{life_dir}{spec_dir}/general.json")
+
+        if paths not in Thoughts.thought_pools:
+            loaded_thoughts = []
+            for path in paths:
+                with open(path, 'r') as read_file:
+                    loaded_thoughts += ujson.loads(read_file.read())
+            Thoughts.thought_pools[paths] = AliasTable(loaded_thoughts) if loaded_thoughts else None
+        return Thoughts.thought_pools[paths]
+
+    @staticmethod
+    def load_thoughts(main_cat, other_cat, game_mode, biome, season, camp):
         try:
-            if main_cat.age == 'newborn':
-                with open(f"{base_path}{life_dir}{spec_dir}/newborn.json", 'r') as read_file:
-                    thoughts = ujson.loads(read_file.read())
-                loaded_thoughts = thoughts
-            else:
-                with open(f"{base_path}{life_dir}{spec_dir}/{status}.json", 'r') as read_file:
-                    thoughts = ujson.loads(read_file.read())
-                with open(f"{base_path}{life_dir}{spec_dir}/general.json", 'r') as read_file:
-                    genthoughts = ujson.loads(read_file.read())
-                loaded_thoughts = thoughts + genthoughts
+            pool = Thoughts.get_thought_pool(main_cat)
+            loaded_thoughts = pool.items if pool else []
 
             final_thoughts = Thoughts.create_thoughts(loaded_thoughts, main_cat, other_cat, game_mode, biome,
                                                       season, camp)
@@ -323,7 +337,12 @@ class Thoughts:
     def get_chosen_thought(main_cat, other_cat, game_mode, biome, season, camp):
         # get possible thoughts
         try:
-            chosen_thought_group = choice(Thoughts.load_thoughts(main_cat, other_cat, game_mode, biome, season, camp))
+            # only the picked thoughts are checked against the constraints, instead of every thought in the files
+            chosen_thought_group = Thoughts.get_thought_pool(main_cat).choice_where(
+                lambda thought: Thoughts.cats_fulfill_thought_constraints(
+                    main_cat, other_cat, thought, game_mode, biome, season, camp
+                )
+            )
             chosen_thought = choice(chosen_thought_group["thoughts"])
         except Exception:
             traceback.print_exc()
@@ -0,0 +1,225 @@
+"""
+Relationship constraints, like "siblings", "not_mates" or "romantic_50", as they are written in the interactions,
+events and patrols.
+
+compile_constraints reads a list of them once and returns a RelationshipConstraints, which checks them without
+going through the strings again. Compiled lists are kept, so the same list is only read once, and mistakes in it are
+reported when it is read, which is when the resources are loaded.
+
+Value constraints are "<value>_<threshold>", which needs the value to be at least the threshold, or
+"<value>_<threshold>_lower", which needs it to be at most the threshold.
+"""
+
+# the value constraints and the relationship attribute they check
+value_attributes = {
+    "romantic": "romantic_love",
+    "platonic": "platonic_like",
+    "dislike": "dislike",
+    "admiration": "admiration",
+    "comfortable": "comfortable",
+    "jealousy": "jealousy",
+    "trust": "trust",
+}
+
+# the constraints without a value. mates_with_pl can only be checked for patrols, where there is a patrol leader
+relation_types = (
+    "siblings",
+    "mates",
+    "mates_with_pl",
+    "not_mates",
+    "parent/child",
+    "child/parent",
+    "mentor/app",
+    "app/mentor",
+)
+
+_compiled = {}  # tuple of the constraints: RelationshipConstraints
+
+
+class RelationshipConstraints:
+    """A list of relationship constraints which has been read already. Use compile_constraints to get one."""
+
+    def __init__(self, relation_types=(), values=(), valid=True):
+        self.relation_types = frozenset(relation_types)
+        # (relationship attribute, threshold, True if the value has to be at most the threshold)
+        self.values = tuple(values)
+        # lists with a mistake in them are never fulfilled
+        self.valid = valid
+
+    def check_relationship(self, relationship) -> bool:
+        """Returns if the relationship fulfills the constraints, as seen from relationship.cat_from."""
+        if not self.valid:
+            return False
+
+        cat_from = relationship.cat_from
+        cat_to = relationship.cat_to
+        types = self.relation_types
+        if types:
+            if "siblings" in types and not cat_from.is_sibling(cat_to):
+                return False
+            if "mates" in types and (
+                cat_from.ID not in cat_to.mate or cat_to.ID not in cat_from.mate
+            ):
+                return False
+            if "not_mates" in types and (
+                cat_from.ID in cat_to.mate or cat_to.ID in cat_from.mate
+            ):
+                return False
+            if "parent/child" in types and not cat_from.is_parent(cat_to):
+                return False
+            if "child/parent" in types and not cat_to.is_parent(cat_from):
+                return False
+            if "mentor/app" in types and cat_to.ID not in cat_from.apprentice:
+                return False
+            if "app/mentor" in types and cat_from.ID not in cat_to.apprentice:
+                return False
+
+        for attribute, threshold, lower_than in self.values:
+            value = getattr(relationship, attribute)
+            if value > threshold if lower_than else value < threshold:
+                return False
+        return True
+
+    def check_group(self, group: list, patrol_leader=None) -> bool:
+        """
+        Returns if the constraints are fulfilled between all cats of the group. For parent/child, child/parent,
+        mentor/app and app/mentor, the patrol leader is moved to the front of the group, the other ones expect the
+        cat being tested as parent or mentor at index 0.
+        """
+        if not self.valid:
+            return False
+
+        types = self.relation_types
+        if "siblings" in types:
+            test_cat = group[0]
+            if not all(test_cat.is_sibling(cat) for cat in group if cat.ID != test_cat.ID):
+                return False
+
+        if "mates" in types:
+            if len(group) == 1:
+                return False
+            # cheap test first, everyone needs enough mates to be mates with everyone else
+            if not all(len(cat.mate) >= len(group) - 1 for cat in group):
+                return False
+            for index, cat in enumerate(group):
+                if any(cat.ID not in other.mate for other in group[index + 1:]):
+                    return False
+
+        # the cats only have to be mates with the patrol leader, not with each other
+        if "mates_with_pl" in types:
+            if len(group) == 1:
+                return False
+            for cat in group:
+                if cat.ID != patrol_leader.ID and cat.ID not in patrol_leader.mate:
+                    return False
+
+        if "not_mates" in types:
+            for index, cat in enumerate(group):
+                if any(cat.ID in other.mate for other in group[index + 1:]):
+                    return False
+
+        for pair_type in ("parent/child", "child/parent", "mentor/app", "app/mentor"):
+            if pair_type not in types:
+                continue
+            if patrol_leader:
+                if patrol_leader in group:
+                    group.remove(patrol_leader)
+                group.insert(0, patrol_leader)
+            # these are always between exactly two cats
+            if len(group) != 2:
+                return False
+            if pair_type == "parent/child" and not group[0].is_parent(group[1]):
+                return False
+            if pair_type == "child/parent" and not group[1].is_parent(group[0]):
+                return False
+            if pair_type == "mentor/app" and group[1].ID not in group[0].apprentice:
+                return False
+            if pair_type == "app/mentor" and group[0].ID not in group[1].apprentice:
+                return False
+
+        # every cat needs the value towards every other cat of the group
+        for attribute, threshold, lower_than in self.values:
+            for cat in group:
+                for other in group:
+                    if other.ID == cat.ID:
+                        continue
+                    relationship = cat.relationships.get(other.ID)
+                    if relationship is None:
+                        return False
+                    value = getattr(relationship, attribute)
+                    if value > threshold if lower_than else value < threshold:
+                        return False
+        return True
+
+
+_no_constraints = RelationshipConstraints()
+
+
+def compile_constraints(constraints, source="a resource") -> RelationshipConstraints:
+    """
+    Returns the compiled constraints for a list of constraint strings. Mistakes are printed the first time a list
+    is compiled, naming the source, e.g. "patrol <id>". Constraints that aren't known are left out.
+    """
+    if not constraints:
+        return _no_constraints
+
+    key = tuple(constraints)
+    compiled = _compiled.get(key)
+    if compiled is None:
+        compiled = _compile(key, source)
+        _compiled[key] = compiled
+    return compiled
+
+
+def _compile(constraints, source):
+    types = []
+    values = {}
+    valid = True
+
+    for constraint in constraints:
+        if constraint in relation_types:
+            types.append(constraint)
+            continue
+
+        parts = constraint.split("_")
+        if parts[0] not in value_attributes:
+            print(f"WARNING: {source} has the unknown relationship constraint {constraint}, it is ignored.")
+            continue
+
+        v_type = parts[0]
+        if v_type in values:
+            print(f"ERROR: {source} has multiple relationship constraints for the value {v_type}.")
+            valid = False
+            continue
+
+        try:
+            threshold = int(parts[1])
+        except (IndexError, ValueError):
+            threshold = None
+        if threshold is None or len(parts) > 3 or (len(parts) == 3 and parts[2] != "lower"):
+            print(
+                f"ERROR: {source} with the relationship constraint for the value {v_type} "
+                f"doesn't follow the formatting guidelines."
+            )
+            valid = False
+            continue
+
+        if threshold > 100:
+            print(
+                f"ERROR: {source} has a relationship constraint for the value {v_type}, "
+                f"which is higher than the max value of a relationship (100)."
+            )
+            valid = False
+            continue
+
+        if threshold <= 0:
+            print(
+                f"ERROR: {source} has a relationship constraint for the value {v_type}, "
+                f"which is lower than the min value of a relationship or 0."
+            )
+            valid = False
+            continue
+
+        values[v_type] = (value_attributes[v_type], threshold, len(parts) == 3)
+
+    return RelationshipConstraints(types, values.values(), valid)
@@ -0,0 +1,107 @@
+"""
+
+This file contains the family groups of the clan, used to find the biggest family for the inbreeding
+counters of the pregnancy events.
+Cats which are connected through (blood or adoptive) parents belong to the same family group. The groups
+are kept in a disjoint-set, which births and adoptions update as they happen, so the size of the biggest
+family and whether a cat is part of it can be answered without looking at every cat's inheritance.
+
+"""
+
+
+class FamilyGroups:
+    def __init__(self):
+        self.built = False
+        self._parent = {}  # ID: ID of the next cat towards the root of its group
+        self._size = {}  # root ID: number of counted cats in the group
+        self._counted = set()  # IDs of the cats which count towards the size of their group
+        self._biggest = None  # root of the biggest group, None if it needs to be looked up again
+
+    def reset(self):
+        """Forget all groups. They are built again on the next build()."""
+        self.__init__()
+
+    def build(self, all_cats):
+        """Build the groups from scratch, from the given ID: cat dictionary."""
+        self.reset()
+        self.built = True
+        for cat in all_cats.values():
+            self.add_cat(cat)
+
+    def add_cat(self, cat):
+        """Count the cat and join its group with the groups of its parents. Safe to call more than once,
+        e.g. after an adoption. Does nothing until the groups are built."""
+        if not self.built:
+            return
+
+        if cat.ID not in self._counted:
+            self._counted.add(cat.ID)
+            root = self.find(cat.ID)
+            self._size[root] += 1
+            self._check_biggest(root)
+
+        parent_ids = [cat.parent1, cat.parent2] + list(cat.adoptive_parents)
+        for parent_id in parent_ids:
+            if parent_id:
+                self._union(cat.ID, parent_id)
+
+    def remove_cat(self, cat_id):
+        """The cat is no longer counted, e.g. once faded. It still connects its relatives, though."""
+        if not self.built or cat_id not in self._counted:
+            return
+
+        self._counted.remove(cat_id)
+        root = self.find(cat_id)
+        self._size[root] -= 1
+        if root == self._biggest:
+            self._biggest = None
+
+    def find(self, cat_id):
+        """Returns the ID of the root of the cat's group."""
+        if cat_id not in self._parent:
+            self._parent[cat_id] = cat_id
+            self._size[cat_id] = 0
+            return cat_id
+
+        # path halving, to keep the trees flat
+        while self._parent[cat_id] != cat_id:
+            self._parent[cat_id] = self._parent[self._parent[cat_id]]
+            cat_id = self._parent[cat_id]
+        return cat_id
+
+    def biggest_family_size(self) -> int:
+        """Returns the number of counted cats in the biggest family."""
+        root = self._get_biggest()
+        return self._size[root] if root is not None else 0
+
+    def in_biggest_family(self, cat_id) -> bool:
+        """Returns if the cat belongs to the biggest family."""
+        root = self._get_biggest()
+        return root is not None and cat_id in self._parent and self.find(cat_id) == root
+
+    def _union(self, cat_id, other_id):
+        root = self.find(cat_id)
+        other_root = self.find(other_id)
+        if root == other_root:
+            return
+
+        # hang the smaller tree below the bigger one
+        if self._size[root] < self._size[other_root]:
+            root, other_root = other_root, root
+        self._parent[other_root] = root
+        self._size[root] += self._size.pop(other_root)
+        if self._biggest == other_root:
+            self._biggest = root
+        self._check_biggest(root)
+
+    def _check_biggest(self, root):
+        if self._biggest is not None and self._size[root] > self._size[self._biggest]:
+            self._biggest = root
+
+    def _get_biggest(self):
+        if self._biggest is None and self._size:
+            self._biggest = max(self._size, key=lambda root: self._size[root])
+        return self._biggest
+
+
+family_groups = FamilyGroups()
@@ -0,0 +1,59 @@
+"""
+Index of the relationships towards each cat, so questions like "which cats love this cat" don't have to go through
+every cat in the Clan. Relationship keeps it up to date whenever one of its values is set.
+
+The relationships towards a cat are sorted into steps of 10 points for every value, so a query only looks at the
+relationships that are close to the range asked for.
+"""
+
+# cat ID: {value name: [relationships towards the cat whose value is 0-9, 10-19, ..., 100]}
+# dicts are used as sets that keep their order, so the order of the results doesn't change between runs
+_incoming = {}
+
+
+def get_incoming(cat, value_name=None, minimum=0, maximum=100):
+    """
+    Returns the relationships other cats have towards the cat. If value_name is given, e.g. "romantic_love",
+    only the ones where that value is between minimum and maximum, both included.
+    """
+    values = _incoming.get(cat.ID)
+    if not values:
+        return []
+
+    if value_name is None:
+        # every relationship has a romantic_love value, so this finds all of them
+        steps = values["romantic_love"]
+        minimum, maximum = 0, 100
+    else:
+        steps = values[value_name]
+
+    found = []
+    for step in steps[max(int(minimum), 0) // 10 : min(int(maximum), 100) // 10 + 1]:
+        for relationship in list(step):
+            # relationships that were replaced or removed since are dropped here
+            if relationship.cat_from.relationships.get(cat.ID) is not relationship:
+                del step[relationship]
+                continue
+            if value_name is None or minimum <= getattr(relationship, value_name) <= maximum:
+                found.append(relationship)
+    return found
+
+
+def update(relationship, value_name, old_value, new_value):
+    """Moves the relationship to the right step for the value, if it changed enough. old_value is None for
+    new relationships."""
+    new_step = int(new_value) // 10
+    if old_value is not None and int(old_value) // 10 == new_step:
+        return
+
+    values = _incoming.get(relationship.cat_to.ID)
+    if values is None:
+        values = _incoming[relationship.cat_to.ID] = {}
+    steps = values.get(value_name)
+    if steps is None:
+        steps = values[value_name] = [{} for _ in range(11)]
+
+    if old_value is not None:
+        steps[int(old_value) // 10].pop(relationship, None)
+    steps[new_step][relationship] = None
+
@@ -10,6 +10,8 @@ while mating and for the display of the family tree screen.
 
 from strenum import StrEnum  # pylint: disable=no-name-in-module
 
+from scripts.cat_relations.family_groups import family_groups
+
 
 class RelationType(StrEnum):
     """An enum representing the possible relationships of a cat"""
@@ -45,8 +47,10 @@ class Inheritance:
         self.cousins = {}
         self.grand_parents = {}
         self.grand_kits = {}
-        self.all_involved = []
-        self.all_but_cousins = []
+        self.all_involved = set()
+        self.all_but_cousins = set()
+        # goes up every time the relatives change, so anything worked out from them knows to work it out again
+        self.version = 0
 
         self.cat = cat
         self.update_inheritance()
@@ -71,13 +75,16 @@ class Inheritance:
         self.cousins = {}
         self.grand_parents = {}
         self.grand_kits = {}
-        self.all_involved = []
-        self.all_but_cousins = []
+        self.all_involved = set()
+        self.all_but_cousins = set()
         self.other_mates = []
 
         # helping variables
         self.need_update = []
 
+        # relatives can't be mates, so cached mate eligibility is out of date now
+        self.cat.mate_index_changed()
+
         # parents
         self.init_parents()
 
@@ -130,6 +137,8 @@ class Inheritance:
                     # if the inheritance is updated, remove the id of the need_update list
                     self.need_update.remove(update_id)
 
+        self.version += 1
+
     def update_all_related_inheritance(self):
         """Update all the inheritances of the cats, which are related to the current cat."""
         # only adding/removing parents or kits will use this function, because all inheritances are based on parents
@@ -201,6 +210,7 @@ class Inheritance:
         """Remove the cat the parent dictionary - used to 'update' the adoptive parents."""
         if cat.ID in self.parents:
             del self.parents[cat.ID]
+            self.version += 1
             self.update_all_related_inheritance()
 
     def add_parent(self, parent, rel_type=RelationType.ADOPTIVE):
@@ -218,8 +228,10 @@ class Inheritance:
             and parent.ID not in self.cat.adoptive_parents
         ):
             self.cat.adoptive_parents.append(parent.ID)
-        self.all_involved.append(parent.ID)
-        self.all_but_cousins.append(parent.ID)
+            family_groups.add_cat(self.cat)
+        self.all_involved.add(parent.ID)
+        self.all_but_cousins.add(parent.ID)
+        self.version += 1
         self.update_all_related_inheritance()
 
     # ---------------------------------------------------------------------------- #
@@ -281,6 +293,8 @@ class Inheritance:
 
     def init_parents(self):
         """Create parent relationships"""
+        family_groups.add_cat(self.cat)
+
         # by blood
         current_parent_ids = self.get_blood_parents()
         for relevant_id in current_parent_ids:
@@ -288,8 +302,8 @@ class Inheritance:
             if not relevant_cat:
                 continue
             self.parents[relevant_id] = {"type": RelationType.BLOOD, "additional": []}
-            self.all_involved.append(relevant_id)
-            self.all_but_cousins.append(relevant_id)
+            self.all_involved.add(relevant_id)
+            self.all_but_cousins.add(relevant_id)
 
         # adoptive
         current_parent_ids = self.get_adoptive_parents()
@@ -301,8 +315,8 @@ class Inheritance:
                 "type": RelationType.ADOPTIVE,
                 "additional": [],
             }
-            self.all_involved.append(relevant_id)
-            self.all_but_cousins.append(relevant_id)
+            self.all_involved.add(relevant_id)
+            self.all_but_cousins.add(relevant_id)
 
     def init_mates(self):
         """Create a mate relationship"""
@@ -349,8 +363,8 @@ class Inheritance:
                         "type": grand_type,
                         "additional": [],
                     }
-                    self.all_involved.append(grand_id)
-                    self.all_but_cousins.append(grand_id)
+                    self.all_involved.add(grand_id)
+                    self.all_but_cousins.add(grand_id)
                 self.grand_parents[grand_id]["additional"].append(
                     f"parent of {str(parent_cat.name)}"
                 )
@@ -363,8 +377,8 @@ class Inheritance:
         inter_blood_parents = self.get_blood_parents(inter_cat)
         if self.cat.ID in inter_blood_parents:
             self.kits[inter_id] = {"type": RelationType.BLOOD, "additional": []}
-            self.all_involved.append(inter_id)
-            self.all_but_cousins.append(inter_id)
+            self.all_involved.add(inter_id)
+            self.all_but_cousins.add(inter_id)
             if len(inter_blood_parents) > 1:
                 inter_blood_parents.remove(self.cat.ID)
                 other_id = inter_blood_parents.pop()
@@ -376,8 +390,8 @@ class Inheritance:
         # kit - adoptive
         if self.cat.ID in inter_cat.adoptive_parents:
             self.kits[inter_id] = {"type": RelationType.ADOPTIVE, "additional": []}
-            self.all_involved.append(inter_id)
-            self.all_but_cousins.append(inter_id)
+            self.all_involved.add(inter_id)
+            self.all_but_cousins.add(inter_id)
             if len(inter_blood_parents) > 0:
                 name = []
                 for blood_parent_id in inter_blood_parents:
@@ -465,8 +479,8 @@ class Inheritance:
 
         if siblings:
             self.siblings[inter_id] = {"type": rel_type, "additional": additional_info}
-            self.all_involved.append(inter_id)
-            self.all_but_cousins.append(inter_id)
+            self.all_involved.add(inter_id)
+            self.all_but_cousins.add(inter_id)
 
             for mate_id in inter_cat.mate:
                 mate_rel = RelationType.NOT_BLOOD
@@ -504,8 +518,8 @@ class Inheritance:
                         "type": kit_rel_type,
                         "additional": [add_info],
                     }
-                    self.all_involved.append(_c.ID)
-                    self.all_but_cousins.append(_c.ID)
+                    self.all_involved.add(_c.ID)
+                    self.all_but_cousins.add(_c.ID)
 
     def init_parents_siblings(self, inter_id, inter_cat):
         """Create an aunt/uncle (pibling) relationship."""
@@ -529,8 +543,8 @@ class Inheritance:
                         "type": rel_type,
                         "additional": [],
                     }
-                    self.all_involved.append(inter_id)
-                    self.all_but_cousins.append(inter_id)
+                    self.all_involved.add(inter_id)
+                    self.all_but_cousins.add(inter_id)
 
                 grand_parent_cat = self.cat.fetch_cat(inter_parent_id)
                 if len(self.parents_siblings[inter_id]["additional"]) > 0:
@@ -566,7 +580,7 @@ class Inheritance:
                     add_info = f"child of " + ", ".join(parent_cats_names)
 
                 self.cousins[inter_id] = {"type": rel_type, "additional": [add_info]}
-                self.all_involved.append(inter_id)
+                self.all_involved.add(inter_id)
 
     def init_grand_kits(self, inter_id, inter_cat):
         """Create a grandkit relationship."""
@@ -595,8 +609,8 @@ class Inheritance:
                         "type": rel_type,
                         "additional": [add_info],
                     }
-                    self.all_but_cousins.append(inter_id)
-                    self.all_involved.append(inter_id)
+                    self.all_but_cousins.add(inter_id)
+                    self.all_involved.add(inter_id)
 
     # ---------------------------------------------------------------------------- #
     #                             all getter functions                             #
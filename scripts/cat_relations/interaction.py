@@ -2,6 +2,8 @@ import os
 
 import ujson
 
+from scripts.cat_relations.constraints import compile_constraints
+
 
 class SingleInteraction:
 
@@ -42,6 +44,7 @@ class SingleInteraction:
         self.relationship_constraint = (
             relationship_constraint if relationship_constraint else []
         )
+        compile_constraints(self.relationship_constraint, f"interaction {interact_id}")
         self.backstory_constraint = backstory_constraint if backstory_constraint else {}
         self.main_status_constraint = (
             main_status_constraint if main_status_constraint else []
@@ -103,6 +106,8 @@ class GroupInteraction:
         self.relationship_constraint = (
             relationship_constraint if relationship_constraint else {}
         )
+        for constraint in self.relationship_constraint.values():
+            compile_constraints(constraint, f"interaction {interact_id}")
         self.backstory_constraint = backstory_constraint if backstory_constraint else {}
         self.status_constraint = status_constraint if status_constraint else {}
         self.trait_constraint = trait_constraint if trait_constraint else {}
@@ -118,116 +123,9 @@ class GroupInteraction:
 
 def rel_fulfill_rel_constraints(relationship, constraint, interaction_id) -> bool:
     """Check if the relationship fulfills the interaction relationship constraints."""
-    # if the constraints are not existing, they are considered to be fulfilled
-    if not constraint:
-        return True
-    if len(constraint) == 0:
-        return True
-
-    if "siblings" in constraint and not relationship.cat_from.is_sibling(
-        relationship.cat_to
-    ):
-        return False
-
-    if "mates" in constraint and (
-        relationship.cat_from.ID not in relationship.cat_to.mate
-        or relationship.cat_to.ID not in relationship.cat_from.mate
-    ):
-        return False
-
-    if "not_mates" in constraint and (
-        relationship.cat_from.ID in relationship.cat_to.mate
-        or relationship.cat_to.ID in relationship.cat_from.mate
-    ):
-        return False
-
-    if "parent/child" in constraint and not relationship.cat_from.is_parent(
-        relationship.cat_to
-    ):
-        return False
-
-    if "child/parent" in constraint and not relationship.cat_to.is_parent(
-        relationship.cat_from
-    ):
-        return False
-
-    value_types = [
-        "romantic",
-        "platonic",
-        "dislike",
-        "admiration",
-        "comfortable",
-        "jealousy",
-        "trust",
-    ]
-    for v_type in value_types:
-        tags = [i for i in constraint if v_type in i]
-        if len(tags) < 1:
-            continue
-        lower_than = False
-        # try to extract the value/threshold from the text
-        try:
-            splitted = tags[0].split("_")
-            threshold = int(splitted[1])
-            if len(splitted) >= 3:
-                lower_than = True
-        except:  # TODO: find out what this try-except is protecting against and explicitly guard for it
-            print(
-                f"ERROR: interaction {interaction_id} with the relationship constraint for "
-                f"the value {v_type} doesn't follow the formatting guidelines."
-            )
-            break
-
-        if threshold > 100:
-            print(
-                f"ERROR: interaction {interaction_id} has a relationship constraint for the value {v_type}, "
-                f"which is higher than the max value of a relationship (100)."
-            )
-            break
-
-        if threshold <= 0:
-            print(
-                f"ERROR: patrol {interaction_id} has a relationship constraints for the value {v_type}, "
-                f"which is lower than the min value of a relationship or 0."
-            )
-            break
-
-        threshold_fulfilled = False
-        if v_type == "romantic":
-            if not lower_than and relationship.romantic_love >= threshold:
-                threshold_fulfilled = True
-            elif lower_than and relationship.romantic_love <= threshold:
-                threshold_fulfilled = True
-        if v_type == "platonic":
-            if not lower_than and relationship.platonic_like >= threshold:
-                threshold_fulfilled = True
-            elif lower_than and relationship.platonic_like <= threshold:
-                threshold_fulfilled = True
-        if v_type == "dislike":
-            if not lower_than and relationship.dislike >= threshold:
-                threshold_fulfilled = True
-            elif lower_than and relationship.dislike <= threshold:
-                threshold_fulfilled = True
-        if v_type == "comfortable":
-            if not lower_than and relationship.comfortable >= threshold:
-                threshold_fulfilled = True
-            elif lower_than and relationship.comfortable <= threshold:
-                threshold_fulfilled = True
-        if v_type == "jealousy":
-            if not lower_than and relationship.jealousy >= threshold:
-                threshold_fulfilled = True
-            elif lower_than and relationship.jealousy <= threshold:
-                threshold_fulfilled = True
-        if v_type == "trust":
-            if not lower_than and relationship.trust >= threshold:
-                threshold_fulfilled = True
-            elif lower_than and relationship.trust <= threshold:
-                threshold_fulfilled = True
-
-        if not threshold_fulfilled:
-            return False
-
-    return True
+    return compile_constraints(
+        constraint, f"interaction {interaction_id}"
+    ).check_relationship(relationship)
 
 
 def cats_fulfill_single_interaction_constraints(
@@ -2,6 +2,7 @@ import random
 from random import choice
 
 from scripts.cat.history import History
+from scripts.cat_relations import incoming
 from scripts.cat_relations.interaction import (
     SingleInteraction,
     NEUTRAL_INTERACTIONS,
@@ -629,6 +630,7 @@ class Relationship:
             value = 100
         if value < 0:
             value = 0
+        incoming.update(self, "romantic_love", getattr(self, "_romantic_love", None), value)
         self._romantic_love = value
 
     @property
@@ -641,6 +643,7 @@ class Relationship:
             value = 100
         if value < 0:
             value = 0
+        incoming.update(self, "platonic_like", getattr(self, "_platonic_like", None), value)
         self._platonic_like = value
 
     @property
@@ -653,6 +656,7 @@ class Relationship:
             value = 100
         if value < 0:
             value = 0
+        incoming.update(self, "dislike", getattr(self, "_dislike", None), value)
         self._dislike = value
 
     @property
@@ -665,6 +669,7 @@ class Relationship:
             value = 100
         if value < 0:
             value = 0
+        incoming.update(self, "admiration", getattr(self, "_admiration", None), value)
         self._admiration = value
 
     @property
@@ -677,6 +682,7 @@ class Relationship:
             value = 100
         if value < 0:
             value = 0
+        incoming.update(self, "comfortable", getattr(self, "_comfortable", None), value)
         self._comfortable = value
 
     @property
@@ -689,6 +695,7 @@ class Relationship:
             value = 100
         if value < 0:
             value = 0
+        incoming.update(self, "jealousy", getattr(self, "_jealousy", None), value)
         self._jealousy = value
 
     @property
@@ -701,4 +708,5 @@ class Relationship:
             value = 100
         if value < 0:
             value = 0
+        incoming.update(self, "trust", getattr(self, "_trust", None), value)
         self._trust = value
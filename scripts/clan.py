@@ -18,6 +18,7 @@ import ujson
 
 from scripts.cat.pelts import Pelt
 from scripts.cat.cats import Cat, cat_class
+from scripts.cat_relations.family_groups import family_groups
 from scripts.cat.history import History
 from scripts.cat.names import names
 from scripts.cat.sprites import sprites
@@ -203,6 +204,7 @@ class Clan:
         created in the 'clan created' screen, not every time
         the program starts
         """
+        family_groups.reset()
         self.instructor = Cat(
             status=choice(
                 [
@@ -224,31 +226,25 @@ class Clan:
         self.add_to_starclan(self.instructor)
         self.all_clans = []
 
+        starting_ids = {i.ID for i in self.starting_members}
+        kept_ids = starting_ids | {
+            i.ID for i in (self.leader, self.medicine_cat, self.deputy, self.instructor) if i
+        }
         key_copy = tuple(Cat.all_cats.keys())
         for i in key_copy:  # Going through all currently existing cats
-            # cat_class is a Cat-object
-            not_found = True
-            for x in self.starting_members:
-                if Cat.all_cats[i] == x:
-                    self.add_cat(Cat.all_cats[i])
-                    not_found = False
-            if (
-                Cat.all_cats[i] != self.leader
-                and Cat.all_cats[i] != self.medicine_cat
-                and Cat.all_cats[i] != self.deputy
-                and Cat.all_cats[i] != self.instructor
-                and not_found
-            ):
+            if i in starting_ids:
+                self.add_cat(Cat.all_cats[i])
+            if i not in kept_ids:
                 Cat.all_cats[i].example = True
-                self.remove_cat(Cat.all_cats[i].ID)
+                self.remove_cat(i)
 
         # give thoughts,actions and relationships to cats
-        for cat_id in Cat.all_cats:
-            Cat.all_cats.get(cat_id).init_all_relationships()
-            Cat.all_cats.get(cat_id).backstory = "clan_founder"
-            if Cat.all_cats.get(cat_id).status == "apprentice":
-                Cat.all_cats.get(cat_id).status_change("apprentice")
-            Cat.all_cats.get(cat_id).thoughts()
+        for the_cat in list(Cat.all_cats.values()):
+            the_cat.init_all_relationships()
+            the_cat.backstory = "clan_founder"
+            if the_cat.status == "apprentice":
+                the_cat.status_change("apprentice")
+            the_cat.thoughts()
 
         game.save_cats()
         number_other_clans = randint(3, 5)
@@ -374,10 +370,12 @@ class Clan:
         """
 
         if Cat.all_cats[ID] in Cat.all_cats_list:
+            Cat.all_cats[ID].remove_from_mate_buckets()
             Cat.all_cats_list.remove(Cat.all_cats[ID])
 
         if ID in Cat.all_cats:
             Cat.all_cats.pop(ID)
+        family_groups.remove_cat(ID)
 
         if ID in self.clan_cats:
             self.clan_cats.remove(ID)
@@ -572,6 +570,7 @@ class Clan:
         """
         TODO: DOCS
         """
+        family_groups.reset()
 
         version_info = None
         if os.path.exists(
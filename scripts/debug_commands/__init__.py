@@ -4,7 +4,9 @@ from scripts.debug_commands.cat import CatsCommand
 from scripts.debug_commands.command import Command
 from scripts.debug_commands.eval import EvalCommand
 from scripts.debug_commands.fps import FpsCommand
+from scripts.debug_commands.frames import FramesCommand
 from scripts.debug_commands.help import HelpCommand
+from scripts.debug_commands.images import ImagesCommand
 from scripts.debug_commands.settings import ToggleCommand, SetCommand, GetCommand
 
 commandList: List[Command] = [
@@ -13,6 +15,8 @@ commandList: List[Command] = [
     GetCommand(),
     EvalCommand(),
     FpsCommand(),
+    FramesCommand(),
+    ImagesCommand(),
     CatsCommand()
 ]
 
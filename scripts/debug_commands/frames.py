@@ -0,0 +1,22 @@
+from typing import List
+
+from scripts.debug_commands.command import Command
+from scripts.debug_commands.utils import add_output_line_to_log
+from scripts.game_structure.frame_scheduler import frame_scheduler
+
+
+class FramesCommand(Command):
+    name = "frames"
+    description = "Show frame times and CPU use of the last frames"
+
+    def callback(self, args: List[str]):
+        stats = frame_scheduler.get_stats()
+        add_output_line_to_log(
+            f"{'Idle' if stats['idle'] else 'Active'} at {stats['fps']:.1f} fps, "
+            f"frames take {stats['frame_ms']:.1f} ms (max {stats['max_frame_ms']:.1f} ms), "
+            f"CPU use {stats['cpu_percent']:.0f}%"
+        )
+        add_output_line_to_log(
+            f"Idle rate is {frame_scheduler.idle_fps} fps after {frame_scheduler.idle_after}s without input, "
+            "use 'toggle debug showframestats' to keep these on screen"
+        )
@@ -0,0 +1,29 @@
+from typing import List
+
+from scripts.debug_commands.command import Command
+from scripts.debug_commands.utils import add_output_line_to_log
+from scripts.game_structure import image_cache
+
+
+class ImagesCommand(Command):
+    name = "images"
+    description = "Show how well the image cache is doing"
+    usage = "[clear]"
+
+    def callback(self, args: List[str]):
+        if len(args) == 1 and args[0] == "clear":
+            image_cache.clear()
+            add_output_line_to_log("Image cache cleared")
+            return
+
+        stats = image_cache.get_stats()
+        lookups = stats["hits"] + stats["misses"]
+        hit_rate = stats["hits"] / lookups * 100 if lookups else 0
+        add_output_line_to_log(
+            f"{stats['hits']} hits, {stats['misses']} misses ({hit_rate:.0f}% hits), "
+            f"{stats['evictions']} evictions"
+        )
+        add_output_line_to_log(
+            f"{stats['images']} images using {stats['bytes'] / 1024 / 1024:.1f} MB "
+            f"of {stats['budget'] / 1024 / 1024:.0f} MB"
+        )
@@ -9,6 +9,7 @@ import pygame_gui
 
 from scripts.debug_commands import commandList
 from scripts.debug_commands.utils import set_debug_class
+from scripts.game_structure.frame_scheduler import frame_scheduler
 from scripts.game_structure.game_essentials import MANAGER, game
 from scripts.utility import get_text_box_theme
 
@@ -105,6 +106,11 @@ class debugMode:
             pygame.Rect((0, 0), (-1, -1)), "0 fps", object_id=get_text_box_theme()
         )
 
+        self.frame_stats_display = pygame_gui.elements.UILabel(
+            pygame.Rect((0, 25), (-1, -1)), "", object_id=get_text_box_theme()
+        )
+        self.frame_stats_display.hide()
+
         self.console = debugConsole(
             pygame.Rect(
                 (0, 0),
@@ -165,6 +171,20 @@ class debugMode:
                 self.fps_display.hide()
                 self.fps_display.set_text("(0, 0)")
 
+        if game.debug_settings["showframestats"]:
+            if self.frame_stats_display.visible == 0:
+                self.frame_stats_display.show()
+
+            stats = frame_scheduler.get_stats()
+            self.frame_stats_display.set_text(
+                f"{'idle' if stats['idle'] else 'active'}, "
+                f"frame {stats['frame_ms']:.1f} ms (max {stats['max_frame_ms']:.1f}), "
+                f"cpu {stats['cpu_percent']:.0f}%"
+            )
+        else:
+            if self.frame_stats_display.visible == 1:
+                self.frame_stats_display.hide()
+
         # Showbounds
 
         # visual_debug_mode
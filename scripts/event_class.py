@@ -61,3 +61,95 @@ class Single_Event:
             types=dict.get("types", None),
             cats_involved=dict.get("cats_involved", None),
         )
+
+
+class Event_List(list):
+    """
+    A list of Single_Events, e.g. the events of the current moon. Works like a normal list, but also keeps
+    track of the events of each type and of each involved cat as they are added, so those can be looked up
+    without going through the whole list. The lists it returns are shared, so don't change them.
+    """
+
+    def __init__(self, events=()):
+        super().__init__(events)
+        self._by_type = {}
+        self._by_cat = {}
+        self._without_type = {}
+        self._rebuild()
+
+    def get_events_of_type(self, event_type):
+        """Returns the events of the given type, in list order."""
+        return self._by_type.get(event_type, [])
+
+    def get_events_without_type(self, event_type):
+        """Returns the events which are not of the given type, in list order."""
+        if event_type not in self._without_type:
+            self._without_type[event_type] = [
+                event for event in self if event_type not in event.types
+            ]
+        return self._without_type[event_type]
+
+    def get_events_of_cat(self, cat_id):
+        """Returns the events the given cat is involved in, in list order."""
+        return self._by_cat.get(cat_id, [])
+
+    def append(self, event):
+        super().append(event)
+        self._add_to_index(event)
+
+    def extend(self, events):
+        for event in events:
+            self.append(event)
+
+    def __iadd__(self, events):
+        self.extend(events)
+        return self
+
+    def clear(self):
+        super().clear()
+        self._rebuild()
+
+    # Anything that doesn't add to the end can change the order, so the index is made again. That is rare,
+    # e.g. a few events per moon are put at the start of the list.
+    def insert(self, index, event):
+        super().insert(index, event)
+        self._rebuild()
+
+    def remove(self, event):
+        super().remove(event)
+        self._rebuild()
+
+    def pop(self, index=-1):
+        event = super().pop(index)
+        self._rebuild()
+        return event
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._rebuild()
+
+    def reverse(self):
+        super().reverse()
+        self._rebuild()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._rebuild()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._rebuild()
+
+    def _rebuild(self):
+        self._by_type = {}
+        self._by_cat = {}
+        self._without_type = {}
+        for event in self:
+            self._add_to_index(event)
+
+    def _add_to_index(self, event):
+        for event_type in dict.fromkeys(event.types):
+            self._by_type.setdefault(event_type, []).append(event)
+        for cat_id in dict.fromkeys(event.cats_involved):
+            self._by_cat.setdefault(cat_id, []).append(event)
+        self._without_type.clear()
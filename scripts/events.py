@@ -22,7 +22,7 @@ from scripts.conditions import (
     medical_cats_condition_fulfilled,
     get_amount_cat_for_one_medic,
 )
-from scripts.event_class import Single_Event
+from scripts.event_class import Single_Event, Event_List
 from scripts.events_module.condition_events import Condition_Events
 from scripts.events_module.generate_events import GenerateEvents, generate_events
 from scripts.events_module.handle_short_events import handle_short_events
@@ -68,7 +68,7 @@ class Events:
         """
         Handles the moon skipping of the whole Clan.
         """
-        game.cur_events_list = []
+        game.cur_events_list = Event_List()
         game.herb_events_list = []
         game.freshkill_events_list = []
         game.mediated = []
@@ -290,6 +290,11 @@ class Events:
         if game.sort_type != "id":
             Cat.sort_cats()
 
+        # Cats that aged or changed this moon will be shown in camp first
+        Cat.prewarm_sprites(
+            [i for i in Cat.all_cats_list if not i.dead and not i.outside]
+        )
+
         # Clear all the loaded event dicts.
         GenerateEvents.clear_loaded_events()
 
@@ -1,5 +1,4 @@
 import random
-from copy import deepcopy
 
 import ujson
 
@@ -11,6 +10,7 @@ from scripts.conditions import (
 )
 from scripts.clan_resources.freshkill import FRESHKILL_ACTIVE, MAL_PERCENTAGE, STARV_PERCENTAGE
 from scripts.event_class import Single_Event
+from scripts.events_module.condition_tables import ConditionTable, HERB_CHANCE
 from scripts.events_module.handle_short_events import handle_short_events
 from scripts.events_module.scar_events import Scar_Events
 from scripts.game_structure.game_essentials import game
@@ -125,6 +125,52 @@ class Condition_Events:
     with open(f"resources/dicts/conditions/healed_and_death_strings/illness_death_strings.json", 'r') as read_file:
         ILLNESS_DEATH_STRINGS = ujson.loads(read_file.read())
 
+    # ---------------------------------------------------------------------------- #
+    #                               COMPILED TABLES                                #
+    # ---------------------------------------------------------------------------- #
+
+    ILLNESS_PROGRESSION = {
+        "running nose": "whitecough",
+        "kittencough": "whitecough",
+        "whitecough": "greencough",
+        "greencough": "yellowcough",
+        "yellowcough": "redcough",
+        "an infected wound": "a festering wound",
+        "heat exhaustion": "heat stroke",
+        "stomachache": "diarrhea",
+        "grief stricken": "lasting grief",
+    }
+    INJURY_PROGRESSION = {
+        "poisoned": "redcough",
+        "shock": "lingering shock",
+        "rotsickness": "rotplague"
+    }
+    PERMANENT_PROGRESSION = {
+        "one bad eye": "failing eyesight",
+        "failing eyesight": "blind",
+        "partial hearing loss": "deaf",
+    }
+
+    ILLNESS_TABLE = ConditionTable(
+        ILLNESSES,
+        ILLNESS_PROGRESSION,
+        death_strings=ILLNESS_DEATH_STRINGS,
+        healed_strings=ILLNESS_HEALED_STRINGS,
+        risk_strings=ILLNESS_RISK_STRINGS,
+    )
+    INJURY_TABLE = ConditionTable(
+        INJURIES,
+        INJURY_PROGRESSION,
+        death_strings=INJURY_DEATH_STRINGS,
+        healed_strings=INJURY_HEALED_STRINGS,
+        risk_strings=INJURY_RISK_STRINGS,
+    )
+    PERMANENT_TABLE = ConditionTable(
+        PERMANENT,
+        PERMANENT_PROGRESSION,
+        risk_strings=PERM_CONDITION_RISK_STRINGS,
+    )
+
     @staticmethod
     def handle_nutrient(cat: Cat, nutrition_info: dict) -> None:
         """
@@ -503,31 +549,19 @@ class Condition_Events:
         starting_life_count = game.clan.leader_lives
         cat.healed_condition = False
         event_list = []
-        illness_progression = {
-            "running nose": "whitecough",
-            "kittencough": "whitecough",
-            "whitecough": "greencough",
-            "greencough": "yellowcough",
-            "yellowcough": "redcough",
-            "an infected wound": "a festering wound",
-            "heat exhaustion": "heat stroke",
-            "stomachache": "diarrhea",
-            "grief stricken": "lasting grief",
-        }
         # ---------------------------------------------------------------------------- #
         #                         handle currently sick cats                           #
         # ---------------------------------------------------------------------------- #
 
         # making a copy, so we can iterate through copy and modify the real dict at the same time
-        illnesses = deepcopy(cat.illnesses)
+        illnesses = Condition_Events.copy_conditions(cat.illnesses)
         for illness in illnesses:
             if illness in game.switches["skip_conditions"]:
                 continue
+            compiled = Condition_Events.ILLNESS_TABLE[illness]
 
             # use herbs
-            Condition_Events.use_herbs(
-                cat, illness, illnesses, Condition_Events.ILLNESSES
-            )
+            Condition_Events.use_herbs(cat, illness, illnesses, compiled)
 
             # moon skip to try and kill or heal cat
             skipped = cat.moon_skip_illness(illness)
@@ -538,12 +572,10 @@ class Condition_Events:
 
             # death event text and break bc any other illnesses no longer matter
             if cat.dead or (cat.status == 'leader' and starting_life_count != game.clan.leader_lives):
-                try:
-                    possible_string_list = Condition_Events.ILLNESS_DEATH_STRINGS[illness]
-                    event = random.choice(possible_string_list)
-                    # first event in string lists is always appropriate for history formatting
-                    history_event = possible_string_list[0]
-                except KeyError:
+                if compiled.death_strings is not None:
+                    event = random.choice(compiled.death_strings)
+                    history_event = compiled.death_history_text
+                else:
                     print(f"WARNING: {illness} does not have an injury death string, placeholder used.")
                     event = "m_c was killed by their illness."
                     history_event = "m_c died to an illness."
@@ -572,7 +604,7 @@ class Condition_Events:
                 History.remove_possible_history(cat, illness)
                 game.switches["skip_conditions"].append(illness)
                 # gather potential event strings for healed illness
-                possible_string_list = Condition_Events.ILLNESS_HEALED_STRINGS[illness]
+                possible_string_list = compiled.healed_strings
 
                 # choose event string
                 random_index = int(random.random() * len(possible_string_list))
@@ -598,7 +630,7 @@ class Condition_Events:
                 continue
 
             Condition_Events.give_risks(
-                cat, event_list, illness, illness_progression, illnesses, cat.illnesses
+                cat, event_list, illness, Condition_Events.ILLNESS_PROGRESSION, illnesses, cat.illnesses
             )
 
         # joining event list into one event string
@@ -616,24 +648,19 @@ class Condition_Events:
         triggered = False
         event_list = []
 
-        injury_progression = {
-            "poisoned": "redcough", 
-            "shock": "lingering shock",
-            "rotsickness": "rotplague"
-            }
-
         # need to hold this number so that we can check if the leader has died
         starting_life_count = game.clan.leader_lives
 
         if game.clan.game_mode == "classic":
             return triggered
 
-        injuries = deepcopy(cat.injuries)
+        injuries = Condition_Events.copy_conditions(cat.injuries)
         for injury in injuries:
             if injury in game.switches["skip_conditions"]:
                 continue
+            compiled = Condition_Events.INJURY_TABLE[injury]
 
-            Condition_Events.use_herbs(cat, injury, injuries, Condition_Events.INJURIES)
+            Condition_Events.use_herbs(cat, injury, injuries, compiled)
 
             skipped = cat.moon_skip_injury(injury)
             if skipped:
@@ -644,13 +671,10 @@ class Condition_Events:
             ):
                 triggered = True
 
-                try:
-                    possible_string_list = Condition_Events.INJURY_DEATH_STRINGS[injury]
-                    event = random.choice(possible_string_list)
-
-                    # first string in the list is always appropriate for history text
-                    history_text = possible_string_list[0]
-                except KeyError:
+                if compiled.death_strings is not None:
+                    event = random.choice(compiled.death_strings)
+                    history_text = compiled.death_history_text
+                else:
                     print(f'WARNING: {injury} does not have an injury death string, placeholder used')
 
                     event = "m_c was killed by their injuries."
@@ -680,11 +704,9 @@ class Condition_Events:
                 event, scar_given = Scar_Events.handle_scars(cat, injury)
                 # If a scar was not given, we need to grab a separate healed event
                 if not scar_given:
-                    try:
-                        event = random.choice(
-                            Condition_Events.INJURY_HEALED_STRINGS[injury]
-                        )
-                    except KeyError:
+                    if compiled.healed_strings is not None:
+                        event = random.choice(compiled.healed_strings)
+                    else:
                         print(
                             f"WARNING: {injury} couldn't be found in the healed strings dict! placeholder string was used.")
                         event = f"m_c's injury {injury} has healed"
@@ -737,7 +759,7 @@ class Condition_Events:
                 continue
 
             Condition_Events.give_risks(
-                cat, event_list, injury, injury_progression, injuries, cat.injuries
+                cat, event_list, injury, Condition_Events.INJURY_PROGRESSION, injuries, cat.injuries
             )
 
         if len(event_list) > 0:
@@ -766,13 +788,7 @@ class Condition_Events:
 
         event_list = []
 
-        condition_progression = {
-            "one bad eye": "failing eyesight",
-            "failing eyesight": "blind",
-            "partial hearing loss": "deaf",
-        }
-
-        conditions = deepcopy(cat.permanent_condition)
+        conditions = Condition_Events.copy_conditions(cat.permanent_condition)
         for condition in conditions:
 
             # checking if the cat has a congenital condition to reveal and handling duration and death
@@ -848,16 +864,10 @@ class Condition_Events:
                 continue
 
             # trying herbs
-            chance = 0
-            if conditions[condition]["severity"] == "minor":
-                chance = 10
-            elif conditions[condition]["severity"] == "major":
-                chance = 6
-            elif conditions[condition]["severity"] == "severe":
-                chance = 3
+            chance = HERB_CHANCE.get(conditions[condition]["severity"], 0)
             if not int(random.random() * chance):
                 Condition_Events.use_herbs(
-                    cat, condition, conditions, Condition_Events.PERMANENT
+                    cat, condition, conditions, Condition_Events.PERMANENT_TABLE[condition]
                 )
 
             # give risks
@@ -865,7 +875,7 @@ class Condition_Events:
                 cat,
                 event_list,
                 condition,
-                condition_progression,
+                Condition_Events.PERMANENT_PROGRESSION,
                 conditions,
                 cat.permanent_condition,
             )
@@ -973,8 +983,17 @@ class Condition_Events:
     @staticmethod
     def give_risks(cat, event_list, condition, progression, conditions, dictionary):
         event_triggered = False
-        if dictionary == cat.permanent_condition:
+        if dictionary is cat.illnesses:
+            compiled = Condition_Events.ILLNESS_TABLE[condition]
+        elif dictionary is cat.injuries:
+            compiled = Condition_Events.INJURY_TABLE[condition]
+        else:
+            compiled = Condition_Events.PERMANENT_TABLE[condition]
             event_triggered = True
+
+        # nothing the med check depends on changes until a risk is given, which ends the loop,
+        # so it only has to be worked out once
+        enough_meds = None
         for risk in conditions[condition]["risks"]:
             if risk["name"] in (cat.injuries or cat.illnesses):
                 continue
@@ -986,9 +1005,11 @@ class Condition_Events:
 
             # adjust chance of risk gain if Clan has enough meds
             chance = risk["chance"]
-            if medical_cats_condition_fulfilled(
-                Cat.all_cats.values(), get_amount_cat_for_one_medic(game.clan)
-            ):
+            if enough_meds is None:
+                enough_meds = medical_cats_condition_fulfilled(
+                    Cat.all_cats.values(), get_amount_cat_for_one_medic(game.clan)
+                )
+            if enough_meds:
                 chance += 10  # lower risk if enough meds
             if game.clan.medicine_cat is None and chance != 0:
                 chance = int(
@@ -1015,7 +1036,7 @@ class Condition_Events:
                 new_condition_name = risk["name"]
 
                 # lower risk of getting it again if not a perm condition
-                if dictionary != cat.permanent_condition:
+                if not event_triggered:
                     saved_condition = dictionary[condition]["risks"]
                     for old_risk in saved_condition:
                         if old_risk["name"] == risk["name"]:
@@ -1032,23 +1053,9 @@ class Condition_Events:
 
                 med_cat = None
                 removed_condition = False
-                try:
-                    # gather potential event strings for gotten condition
-                    if dictionary == cat.illnesses:
-                        possible_string_list = Condition_Events.ILLNESS_RISK_STRINGS[
-                            condition
-                        ][new_condition_name]
-                    elif dictionary == cat.injuries:
-                        possible_string_list = Condition_Events.INJURY_RISK_STRINGS[
-                            condition
-                        ][new_condition_name]
-                    else:
-                        possible_string_list = (
-                            Condition_Events.PERM_CONDITION_RISK_STRINGS[condition][
-                                new_condition_name
-                            ]
-                        )
-
+                # gather potential event strings for gotten condition
+                possible_string_list = compiled.risk_strings.get(new_condition_name)
+                if possible_string_list is not None:
                     # if it is a progressive condition, then remove the old condition and keep the new one
                     if (
                         condition in progression
@@ -1070,7 +1077,7 @@ class Condition_Events:
                         if med_cat == cat:
                             random_index = 1
                     event = possible_string_list[random_index]
-                except KeyError:
+                else:
                     print(
                         f"WARNING: {condition} couldn't be found in the risk strings! placeholder string was used"
                     )
@@ -1088,7 +1095,7 @@ class Condition_Events:
                     break
                 elif new_condition_name in Condition_Events.ILLNESSES:
                     cat.get_ill(new_condition_name, event_triggered=event_triggered)
-                    if dictionary == cat.illnesses or removed_condition:
+                    if dictionary is cat.illnesses or removed_condition:
                         break
                     keys = dictionary[condition].keys()
                     complication = None
@@ -1112,24 +1119,34 @@ class Condition_Events:
                 break
 
     @staticmethod
-    def use_herbs(cat, condition, conditions, source):
+    def copy_conditions(conditions):
+        """
+        Copies a cat's condition dict, so the copy can be iterated over while the real dict is changed.
+        Only the risk dicts are nested and changed in place, so they are the only part copied deeply.
+        """
+        copied = {}
+        for name, info in conditions.items():
+            copied[name] = info.copy()
+            if "risks" in info:
+                copied[name]["risks"] = [risk.copy() for risk in info["risks"]]
+        return copied
+
+    @staticmethod
+    def use_herbs(cat, condition, conditions, compiled):
         # herbs that can be used for the condition and the Clan has available
         clan_herbs = set()
-        needed_herbs = set()
         clan_herbs.update(game.clan.herbs.keys())
-        try:
-            needed_herbs.update(source[condition]["herbs"])
-        except KeyError:
+        if compiled.herbs is None:
             print(
                 f"WARNING: {condition} does not exist in it's condition dict! if the condition is 'thorn in paw' or "
                 "'splinter', disregard this! otherwise, check that your condition is in the correct dict or report "
                 "this as a bug."
             )
             return
-        herb_set = clan_herbs.intersection(needed_herbs)
+        herb_set = clan_herbs.intersection(compiled.needed_herbs)
         usable_herbs = list(herb_set)
 
-        if not source[condition]["herbs"]:
+        if not compiled.herbs:
             return
 
         if usable_herbs:
@@ -1170,12 +1187,7 @@ class Condition_Events:
                 game.clan.herbs.pop(herb_used)
 
             # applying a modifier for herb priority. herbs that are better for the condition will have stronger effects
-            count = 0
-            for herb in source[condition]["herbs"]:
-                count += 1
-                if herb == herb_used:
-                    break
-            modifier = count
+            modifier = compiled.herb_priority[herb_used]
             if cat.status in ["elder", "kitten"]:
                 modifier = modifier * 2
 
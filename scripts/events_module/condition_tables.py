@@ -0,0 +1,71 @@
+"""
+Precompiled lookup tables for the condition JSON.
+
+Condition_Events used to walk the illness, injury and permanent condition dicts (and the matching string
+dicts) for every afflicted cat, every moon. Everything that does not change per cat is worked out here once,
+so the per-cat code only has to do table lookups. Per-cat values, like the current mortality and risk
+chances, stay in the cat's own condition dicts, since herbs and treatment change them.
+"""
+
+# how likely a permanent condition is to be treated with herbs, by severity. Any other severity is always treated.
+HERB_CHANCE = {"minor": 10, "major": 6, "severe": 3}
+
+
+class CompiledCondition:
+    """All the static data Condition_Events needs for one condition."""
+
+    def __init__(self, name, info, progression, death_strings, healed_strings, risk_strings):
+        self.name = name
+        self.severity = info.get("severity") if info else None
+
+        # None means the condition can't be found in its condition dict, which use_herbs warns about
+        self.herbs = info.get("herbs") if info else None
+        self.needed_herbs = set()
+        self.herb_priority = {}
+        if self.herbs is not None:
+            self.needed_herbs.update(self.herbs)
+            # herbs earlier in the list are better for the condition and have a stronger effect
+            for priority, herb in enumerate(self.herbs, start=1):
+                self.herb_priority.setdefault(herb, priority)
+
+        self.progresses_to = progression.get(name)
+
+        # the first death string is always appropriate for history formatting
+        self.death_strings = death_strings
+        self.death_history_text = death_strings[0] if death_strings else None
+        self.healed_strings = healed_strings
+        self.risk_strings = risk_strings if risk_strings else {}
+
+
+class ConditionTable:
+    """
+    Compiled conditions of one kind (illnesses, injuries or permanent conditions). Conditions that appear in
+    a cat's save but not in the JSON are compiled on first use, so lookups never fail.
+    """
+
+    def __init__(self, conditions, progression, death_strings=None, healed_strings=None, risk_strings=None):
+        self.progression = progression
+        self._death_strings = death_strings if death_strings else {}
+        self._healed_strings = healed_strings if healed_strings else {}
+        self._risk_strings = risk_strings if risk_strings else {}
+        self._conditions = conditions
+        self._compiled = {}
+        for name in conditions:
+            self._compile(name)
+
+    def _compile(self, name):
+        self._compiled[name] = CompiledCondition(
+            name,
+            self._conditions.get(name),
+            self.progression,
+            self._death_strings.get(name),
+            self._healed_strings.get(name),
+            self._risk_strings.get(name),
+        )
+        return self._compiled[name]
+
+    def __getitem__(self, name) -> CompiledCondition:
+        compiled = self._compiled.get(name)
+        if compiled is None:
+            compiled = self._compile(name)
+        return compiled
@@ -5,6 +5,8 @@ import random
 import ujson
 
 from scripts.game_structure.game_essentials import game
+from scripts.game_structure.weighted_choice import AliasTable
+from scripts.cat_relations.constraints import compile_constraints
 from scripts.utility import filter_relationship_type, get_living_clan_cat_count,get_alive_status_cats
 
 resource_directory = "resources/dicts/events/"
@@ -17,9 +19,24 @@ resource_directory = "resources/dicts/events/"
 class GenerateEvents:
     loaded_events = {}
 
+    # the death reaction and leader den files don't change while the game runs, so unlike loaded_events these
+    # are kept between moons. (family relation, value): file contents
+    death_reaction_files = {}
+    # (family relation, value, trait, body status): list of death reactions
+    death_reactions = {}
+    # (event type, success): file contents
+    lead_den_files = {}
+    # (event type, success, interaction type, other Clan temper, player Clan temper, reputation): list of events
+    lead_den_events = {}
+
     INJURY_DISTRIBUTION = None
     with open(f"resources/dicts/conditions/event_injuries_distribution.json", 'r') as read_file:
         INJURY_DISTRIBUTION = ujson.loads(read_file.read())
+    # status: AliasTable of the injury severities for that status, picked from for every injury event
+    INJURY_SEVERITIES = {
+        status: AliasTable(["minor", "major", "severe"], [chances["minor"], chances["major"], chances["severe"]])
+        for status, chances in INJURY_DISTRIBUTION.items()
+    }
 
     INJURIES = None
     with open(f"resources/dicts/conditions/injuries.json", 'r') as read_file:
@@ -55,33 +72,39 @@ class GenerateEvents:
 
     @staticmethod
     def get_death_reaction_dicts(family_relation, rel_value):
-        try:
-            file_path = f"{resource_directory}/death/death_reactions/{family_relation}/{family_relation}_{rel_value}.json"
-            with open(
-                    file_path,
-                    "r",
-            ) as read_file:
-                events = ujson.loads(read_file.read())
-        except:
-            events = None
-            print(f"ERROR: Unable to load death reaction events for {family_relation}_{rel_value}.")
-        return events
+        """Returns the death reactions of the file for family_relation and rel_value. Each file is only read once."""
+        key = (family_relation, rel_value)
+        if key not in GenerateEvents.death_reaction_files:
+            try:
+                file_path = f"{resource_directory}/death/death_reactions/{family_relation}/{family_relation}_{rel_value}.json"
+                with open(
+                        file_path,
+                        "r",
+                ) as read_file:
+                    events = ujson.loads(read_file.read())
+            except:
+                events = None
+                print(f"ERROR: Unable to load death reaction events for {family_relation}_{rel_value}.")
+            GenerateEvents.death_reaction_files[key] = events
+        return GenerateEvents.death_reaction_files[key]
 
     @staticmethod
     def get_lead_den_event_dicts(event_type: str, success: bool):
-
-        try:
-            file_path = f"{resource_directory}/leader_den/{'success' if success else 'fail'}/{event_type}.json"
-            with open(
-                    file_path,
-                    "r"
-            ) as read_file:
-                events = ujson.loads(read_file.read())
-        except:
-            events = None
-            print(f"ERROR: Unable to load lead den events for {event_type} {'success' if success else 'fail'}.")
-
-        return events
+        """Returns the leader den events for event_type and success. Each file is only read once."""
+        key = (event_type, success)
+        if key not in GenerateEvents.lead_den_files:
+            try:
+                file_path = f"{resource_directory}/leader_den/{'success' if success else 'fail'}/{event_type}.json"
+                with open(
+                        file_path,
+                        "r"
+                ) as read_file:
+                    events = ujson.loads(read_file.read())
+            except:
+                events = None
+                print(f"ERROR: Unable to load lead den events for {event_type} {'success' if success else 'fail'}.")
+            GenerateEvents.lead_den_files[key] = events
+        return GenerateEvents.lead_den_files[key]
 
     @staticmethod
     def clear_loaded_events():
@@ -489,18 +512,8 @@ class GenerateEvents:
                 # determine which injury severity list will be used
                 allowed_severity = None
                 discard = False
-                if cat.status in GenerateEvents.INJURY_DISTRIBUTION:
-                    minor_chance = GenerateEvents.INJURY_DISTRIBUTION[cat.status]['minor']
-                    major_chance = GenerateEvents.INJURY_DISTRIBUTION[cat.status]['major']
-                    severe_chance = GenerateEvents.INJURY_DISTRIBUTION[cat.status]['severe']
-                    severity_chosen = random.choices(["minor", "major", "severe"],
-                                                     [minor_chance, major_chance, severe_chance], k=1)
-                    if severity_chosen[0] == 'minor':
-                        allowed_severity = "minor"
-                    elif severity_chosen[0] == 'major':
-                        allowed_severity = "major"
-                    else:
-                        allowed_severity = "severe"
+                if cat.status in GenerateEvents.INJURY_SEVERITIES:
+                    allowed_severity = GenerateEvents.INJURY_SEVERITIES[cat.status].choice()
 
                 for block in event.injury:
                     for injury in block["injuries"]:
@@ -742,6 +755,11 @@ class GenerateEvents:
 
     @staticmethod
     def possible_death_reactions(family_relation, rel_value, trait, body_status):
+        """Returns the death reactions that fit. The list is shared between calls, so it must not be changed."""
+        key = (family_relation, rel_value, trait, body_status)
+        if key in GenerateEvents.death_reactions:
+            return GenerateEvents.death_reactions[key]
+
         possible_events = []
         # grab general events first, since they'll always exist
         events = GenerateEvents.get_death_reaction_dicts("general", rel_value)
@@ -756,6 +774,7 @@ class GenerateEvents:
             if trait in events:
                 possible_events.extend(events[trait][body_status])
 
+        GenerateEvents.death_reactions[key] = possible_events
         return possible_events
 
     def possible_lead_den_events(self, cat, event_type: str, interaction_type: str, success: bool,
@@ -771,29 +790,8 @@ class GenerateEvents:
         """
         possible_events = []
 
-        events = GenerateEvents.get_lead_den_event_dicts(event_type, success)
-        for event in events:
-            if event["interaction_type"] != interaction_type:
-                continue
-
-            if "other_clan_temper" in event or "player_clan_temper" in event:
-                if other_clan_temper not in event["other_clan_temper"] and "any" not in event["other_clan_temper"]:
-                    continue
-                if player_clan_temper not in event["player_clan_temper"] and "any" not in event["player_clan_temper"]:
-                    continue
-
-            elif "reputation" in event:
-                reputation = game.clan.reputation
-                # hostile
-                if 1 <= reputation <= 30 and "hostile" not in event["reputation"] and "any" not in event["reputation"]:
-                    continue
-                # neutral
-                elif 31 <= reputation <= 70 and "neutral" not in event["reputation"] and "any" not in event["reputation"]:
-                    continue
-                # welcoming
-                elif 71 <= reputation <= 100 and "welcoming" not in event["reputation"] and "any" not in event["reputation"]:
-                    continue
-
+        for event in GenerateEvents.get_lead_den_events(event_type, success, interaction_type,
+                                                        other_clan_temper, player_clan_temper):
             cat_info = event["m_c"]
             if "status" in cat_info:
                 # special lost cat check
@@ -830,6 +828,49 @@ class GenerateEvents:
 
         return possible_events
 
+    @staticmethod
+    def get_lead_den_events(event_type: str, success: bool, interaction_type: str, other_clan_temper,
+                            player_clan_temper) -> list:
+        """
+        Returns the leader den events that fit the interaction, the tempers and the Clan's reputation. These don't
+        depend on the cat, so they are only worked out once for each combination.
+        The list is shared between calls, so it must not be changed.
+        """
+        reputation = game.clan.reputation
+        if 1 <= reputation <= 30:
+            reputation_band = "hostile"
+        elif 31 <= reputation <= 70:
+            reputation_band = "neutral"
+        elif 71 <= reputation <= 100:
+            reputation_band = "welcoming"
+        else:
+            reputation_band = None
+
+        key = (event_type, success, interaction_type, other_clan_temper, player_clan_temper, reputation_band)
+        if key in GenerateEvents.lead_den_events:
+            return GenerateEvents.lead_den_events[key]
+
+        fitting_events = []
+        for event in GenerateEvents.get_lead_den_event_dicts(event_type, success):
+            if event["interaction_type"] != interaction_type:
+                continue
+
+            if "other_clan_temper" in event or "player_clan_temper" in event:
+                if other_clan_temper not in event["other_clan_temper"] and "any" not in event["other_clan_temper"]:
+                    continue
+                if player_clan_temper not in event["player_clan_temper"] and "any" not in event["player_clan_temper"]:
+                    continue
+
+            elif "reputation" in event:
+                if (reputation_band is not None and reputation_band not in event["reputation"]
+                        and "any" not in event["reputation"]):
+                    continue
+
+            fitting_events.append(event)
+
+        GenerateEvents.lead_den_events[key] = fitting_events
+        return fitting_events
+
 
 generate_events = GenerateEvents()
 
@@ -918,6 +959,10 @@ class ShortEvent:
             if "dies" not in self.r_c:
                 self.r_c["dies"] = False
 
+        # read the relationship constraints now, so mistakes in them show up when the events are loaded
+        compile_constraints(self.m_c.get("relationship_status"), f"event {event_id}")
+        compile_constraints(self.r_c.get("relationship_status"), f"event {event_id}")
+
         self.new_cat = new_cat if new_cat else []
         self.injury = injury if injury else []
         self.history = history if history else []
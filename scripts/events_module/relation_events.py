@@ -5,6 +5,7 @@ from random import choice, randint
 import ujson
 
 from scripts.cat.cats import Cat
+from scripts.cat_relations.constraints import compile_constraints
 from scripts.events_module.relationship.group_events import GroupEvents
 from scripts.events_module.relationship.romantic_events import Romantic_Events
 from scripts.events_module.relationship.welcoming_events import Welcoming_Events
@@ -28,7 +29,9 @@ class Relation_Events:
     types_path = os.path.join(base_path, "group_interactions", "group_types.json")
     with open(types_path, "r") as read_file:
         GROUP_TYPES = ujson.load(read_file)
-    del base_path
+    for group_type, value in GROUP_TYPES.items():
+        compile_constraints(value.get("constraint"), f"group type {group_type}")
+    del base_path, group_type, value
 
     @staticmethod
     def handle_relationships(cat: Cat):
@@ -273,6 +276,7 @@ class Relation_Events:
         )
         cat_list.remove(main_cat)
         filtered_cat_list = []
+        compiled = compile_constraints(constraint, "a group type")
 
         for inter_cat in cat_list:
             cat_from = main_cat
@@ -286,100 +290,7 @@ class Relation_Events:
                     cat_to.create_one_relationship(cat_from)
                 continue
 
-            relationship = cat_from.relationships[cat_to.ID]
-
-            if "siblings" in constraint and not cat_from.is_sibling(cat_to):
-                continue
-
-            if "mates" in constraint and not relationship.mates:
-                continue
-
-            if "not_mates" in constraint and relationship.mates:
-                continue
-
-            if "parent/child" in constraint and not cat_from.is_parent(cat_to):
-                continue
-
-            if "child/parent" in constraint and not cat_to.is_parent(cat_from):
-                continue
-
-            value_types = [
-                "romantic",
-                "platonic",
-                "dislike",
-                "admiration",
-                "comfortable",
-                "jealousy",
-                "trust",
-            ]
-            fulfilled = True
-            for v_type in value_types:
-                tags = [i for i in constraint if v_type in i]
-                if len(tags) < 1:
-                    continue
-                threshold = 0
-                lower_than = False
-                # try to extract the value/threshold from the text
-                try:
-                    splitted = tags[0].split("_")
-                    threshold = int(splitted[1])
-                    if len(splitted) > 3:
-                        lower_than = True
-                except:
-                    print(
-                        f"ERROR: while creating a cat group, the relationship constraint for the value {v_type} follows not the formatting guidelines."
-                    )
-                    break
-
-                if threshold > 100:
-                    print(
-                        f"ERROR: while creating a cat group, the relationship constraints for the value {v_type}, which is higher than the max value of a relationship."
-                    )
-                    break
-
-                if threshold <= 0:
-                    print(
-                        f"ERROR: while creating a cat group, the relationship constraints for the value {v_type}, which is lower than the min value of a relationship or 0."
-                    )
-                    break
-
-                threshold_fulfilled = False
-                if v_type == "romantic":
-                    if not lower_than and relationship.romantic_love >= threshold:
-                        threshold_fulfilled = True
-                    elif lower_than and relationship.romantic_love <= threshold:
-                        threshold_fulfilled = True
-                if v_type == "platonic":
-                    if not lower_than and relationship.platonic_like >= threshold:
-                        threshold_fulfilled = True
-                    elif lower_than and relationship.platonic_like <= threshold:
-                        threshold_fulfilled = True
-                if v_type == "dislike":
-                    if not lower_than and relationship.dislike >= threshold:
-                        threshold_fulfilled = True
-                    elif lower_than and relationship.dislike <= threshold:
-                        threshold_fulfilled = True
-                if v_type == "comfortable":
-                    if not lower_than and relationship.comfortable >= threshold:
-                        threshold_fulfilled = True
-                    elif lower_than and relationship.comfortable <= threshold:
-                        threshold_fulfilled = True
-                if v_type == "jealousy":
-                    if not lower_than and relationship.jealousy >= threshold:
-                        threshold_fulfilled = True
-                    elif lower_than and relationship.jealousy <= threshold:
-                        threshold_fulfilled = True
-                if v_type == "trust":
-                    if not lower_than and relationship.trust >= threshold:
-                        threshold_fulfilled = True
-                    elif lower_than and relationship.trust <= threshold:
-                        threshold_fulfilled = True
-
-                if not threshold_fulfilled:
-                    fulfilled = False
-                    continue
-
-            if not fulfilled:
+            if not compiled.check_relationship(cat_from.relationships[cat_to.ID]):
                 continue
 
             filtered_cat_list.append(inter_cat)
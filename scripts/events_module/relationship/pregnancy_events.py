@@ -6,6 +6,7 @@ import ujson
 from scripts.cat.cats import Cat
 from scripts.cat.history import History
 from scripts.cat.names import names, Name
+from scripts.cat_relations.family_groups import family_groups
 from scripts.cat_relations.relationship import Relationship
 from scripts.event_class import Single_Event
 from scripts.events_module.condition_events import Condition_Events
@@ -23,34 +24,28 @@ from scripts.utility import (
 class Pregnancy_Events:
     """All events which are related to pregnancy such as kitting and defining who are the parents."""
 
-    biggest_family = {}
-
     PREGNANT_STRINGS = None
     with open(f"resources/dicts/conditions/pregnancy.json", "r") as read_file:
         PREGNANT_STRINGS = ujson.loads(read_file.read())
 
     @staticmethod
     def set_biggest_family():
-        """Gets the biggest family of the clan."""
-        biggest_family = None
-        for cat in Cat.all_cats.values():
-            ancestors = cat.get_relatives()
-            if not biggest_family:
-                biggest_family = ancestors
-                biggest_family.append(cat.ID)
-            elif len(biggest_family) < len(ancestors) + 1:
-                biggest_family = ancestors
-                biggest_family.append(cat.ID)
-        Pregnancy_Events.biggest_family = biggest_family
+        """Builds the family groups of the clan. Afterwards, births and adoptions keep them up to date."""
+        family_groups.build(Cat.all_cats)
+
+    @staticmethod
+    def in_biggest_family(cat):
+        """Returns if the cat belongs to the biggest family of the clan."""
+        if not family_groups.built:
+            Pregnancy_Events.set_biggest_family()
+        return family_groups.in_biggest_family(cat.ID)
 
     @staticmethod
     def biggest_family_is_big():
         """Returns if the current biggest family is big enough to 'activates' additional inbreeding counters."""
-
-        living_cats = len(
-            [i for i in Cat.all_cats.values() if not (i.dead or i.outside or i.exiled)]
-        )
-        return len(Pregnancy_Events.biggest_family) > (living_cats / 10)
+        if not family_groups.built:
+            Pregnancy_Events.set_biggest_family()
+        return family_groups.biggest_family_size() > (Cat.living_cat_count() / 10)
 
     @staticmethod
     def handle_pregnancy_age(clan):
@@ -64,9 +59,6 @@ class Pregnancy_Events:
         if not clan:
             return
 
-        if not Pregnancy_Events.biggest_family:
-            Pregnancy_Events.set_biggest_family()
-
         # Handles if a cat is already pregnant
         if cat.ID in clan.pregnancy_data:
             moons = clan.pregnancy_data[cat.ID]["moons"]
@@ -364,7 +356,6 @@ class Pregnancy_Events:
 
         kits = Pregnancy_Events.get_kits(kits_amount, cat, other_cat, clan)
         kits_amount = len(kits)
-        Pregnancy_Events.set_biggest_family()
 
         # delete the cat out of the pregnancy dictionary
         del clan.pregnancy_data[cat.ID]
@@ -628,12 +619,9 @@ class Pregnancy_Events:
             special_affair = True
 
         # 'buff' affairs if the current biggest family is big + this cat doesn't belong there
-        if not Pregnancy_Events.biggest_family:
-            Pregnancy_Events.set_biggest_family()
-
         if (
             Pregnancy_Events.biggest_family_is_big()
-            and cat.ID not in Pregnancy_Events.biggest_family
+            and not Pregnancy_Events.in_biggest_family(cat)
         ):
             chance = int(chance * 0.8)
 
@@ -641,9 +629,8 @@ class Pregnancy_Events:
         if not int(random.random() * chance):
             possible_affair_partners = [
                 i
-                for i in Cat.all_cats_list
-                if i.is_potential_mate(cat, for_love_interest=True)
-                and (samesex or i.gender != cat.gender)
+                for i in cat.get_potential_mates(for_love_interest=True)
+                if (samesex or i.gender != cat.gender)
                 and i.ID not in cat.mate
             ]
             if special_affair:
@@ -821,12 +808,24 @@ class Pregnancy_Events:
                         kit.pelt.scars.append("ROTRIDDEN")
                 Condition_Events.handle_already_disabled(kit)
 
-            # create and update relationships
-            for cat_id in clan.clan_cats:
-                if cat_id == kit.ID:
-                    continue
-                the_cat = Cat.all_cats.get(cat_id)
-                if the_cat.dead or the_cat.outside:
+            #### REMOVE ACCESSORY ######
+            # kit.pelt.accessory = None
+            kit.pelt.accessories = []
+            kit.pelt.inventory = []
+            
+            clan.add_cat(kit)
+
+            #### GIVE HISTORY ######
+            History.add_beginning(kit, clan_born=bool(cat))
+
+        # create and update relationships, in one pass over the Clan for the whole litter
+        for cat_id in clan.clan_cats:
+            the_cat = Cat.all_cats.get(cat_id)
+            if the_cat.dead or the_cat.outside:
+                continue
+            for kit in all_kitten:
+                # littermates only get one pair of relationships
+                if cat_id == kit.ID or cat_id in kit.relationships:
                     continue
                 if the_cat.ID in kit.get_parents():
                     parent_to_kit = game.config["new_cat"]["parent_buff"][
@@ -854,16 +853,6 @@ class Pregnancy_Events:
                     the_cat.relationships[kit.ID] = Relationship(the_cat, kit)
                     kit.relationships[the_cat.ID] = Relationship(kit, the_cat)
 
-            #### REMOVE ACCESSORY ######
-            # kit.pelt.accessory = None
-            kit.pelt.accessories = []
-            kit.pelt.inventory = []
-            
-            clan.add_cat(kit)
-
-            #### GIVE HISTORY ######
-            History.add_beginning(kit, clan_born=bool(cat))
-
         # check other cats of Clan for siblings
         for kitten in all_kitten:
             # update/buff the relationship towards the siblings
@@ -875,7 +864,8 @@ class Pregnancy_Events:
                 kitten.relationships[second_kitten.ID].comfortable += 10 + y
                 kitten.relationships[second_kitten.ID].trust += 10 + y
 
-            kitten.create_inheritance_new_cat()  # Calculate inheritance.
+        # Calculate inheritance.
+        Cat.create_inheritance_new_cats(all_kitten)
 
         # check if the possible adoptive cat is not already in the family tree and
         # add them as adoptive parents if not
@@ -887,9 +877,12 @@ class Pregnancy_Events:
         # Add the adoptive parents.
         for kit in all_kitten:
             kit.adoptive_parents = final_adoptive_parents
-            kit.inheritance.update_inheritance()
-            kit.inheritance.update_all_related_inheritance()
+        if final_adoptive_parents:
+            for kit in all_kitten:
+                kit.inheritance.update_inheritance()
+            Cat.update_related_inheritance(all_kitten)
 
+        for kit in all_kitten:
             # update relationship for adoptive parents
             for parent_id in final_adoptive_parents:
                 parent = Cat.fetch_cat(parent_id)
@@ -1136,13 +1129,10 @@ class Pregnancy_Events:
 
         # 'INBREED' counter
         # - increase inverse chance if one of the current cats belongs in the biggest family
-        if not Pregnancy_Events.biggest_family:  # set the family if not already
-            Pregnancy_Events.set_biggest_family()
-
         if (
-            first_parent.ID in Pregnancy_Events.biggest_family
+            Pregnancy_Events.in_biggest_family(first_parent)
             or second_parent
-            and second_parent.ID in Pregnancy_Events.biggest_family
+            and Pregnancy_Events.in_biggest_family(second_parent)
         ):
             inverse_chance = int(inverse_chance * 1.7)
 
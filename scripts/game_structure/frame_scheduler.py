@@ -0,0 +1,99 @@
+"""
+Decides when the main loop runs its next frame.
+
+While the player is doing something, or the game is busy with a timeskip or a screen switch, frames run at the full
+game.switches["fps"] rate. After a little while without any input, it drops to a few frames a second. That is still
+enough for blinking text cursors and tooltips, but saves a lot of CPU while the game sits on a menu or in camp.
+Input wakes it up again straight away, since the idle wait ends as soon as an event arrives.
+"""
+
+import time
+from collections import deque
+
+import pygame
+
+from scripts.game_structure.game_essentials import game
+
+
+class FrameScheduler:
+    idle_fps = 5
+    idle_after = 2  # seconds without input or work before the frame rate drops
+
+    def __init__(self):
+        self.clock = pygame.time.Clock()
+        self.idle = False
+        self.last_active = time.perf_counter()
+
+        # events that came in while waiting, to be handed out by get_events
+        self.held_events = []
+
+        self.frame_started = time.perf_counter()
+        self.frame_cpu_started = time.process_time()
+        # (seconds spent on the frame's work, seconds the frame took including the wait, CPU seconds used)
+        self.frame_times = deque(maxlen=60)
+
+    def wait_for_next_frame(self) -> float:
+        """Waits until the next frame is due. Returns the seconds since the last frame, for MANAGER.update."""
+        work_time = time.perf_counter() - self.frame_started
+
+        if self.is_busy():
+            self.wake()
+        self.idle = time.perf_counter() - self.last_active > self.idle_after
+
+        if self.idle:
+            timeout = max(int(1000 / self.idle_fps - work_time * 1000), 1)
+            event = pygame.event.wait(timeout)
+            if event.type != pygame.NOEVENT:
+                self.held_events.append(event)
+                self.wake()
+            time_delta = self.clock.tick() / 1000.0
+        else:
+            time_delta = self.clock.tick(game.switches["fps"]) / 1000.0
+
+        now = time.perf_counter()
+        cpu_now = time.process_time()
+        self.frame_times.append(
+            (work_time, now - self.frame_started, cpu_now - self.frame_cpu_started)
+        )
+        self.frame_started = now
+        self.frame_cpu_started = cpu_now
+
+        return time_delta
+
+    def get_events(self):
+        """Use instead of pygame.event.get, so events that ended an idle wait aren't lost."""
+        events = self.held_events + pygame.event.get()
+        self.held_events = []
+        if events:
+            self.wake()
+        return events
+
+    def wake(self):
+        """Goes back to the full frame rate, e.g. after input."""
+        self.last_active = time.perf_counter()
+        self.idle = False
+
+    @staticmethod
+    def is_busy():
+        """Returns if something is going on that should be shown at the full frame rate."""
+        # window_open is also set while a timeskip or other work runs behind a loading window
+        return game.switch_screens or game.switches["window_open"]
+
+    def get_stats(self) -> dict:
+        """Returns the frame rate, frame times in milliseconds and CPU use over the last frames."""
+        if not self.frame_times:
+            return {"idle": self.idle, "fps": 0, "frame_ms": 0, "max_frame_ms": 0, "cpu_percent": 0}
+
+        work_times = [frame[0] for frame in self.frame_times]
+        total_time = sum(frame[1] for frame in self.frame_times)
+        cpu_time = sum(frame[2] for frame in self.frame_times)
+        return {
+            "idle": self.idle,
+            "fps": len(self.frame_times) / total_time if total_time else 0,
+            "frame_ms": sum(work_times) / len(work_times) * 1000,
+            "max_frame_ms": max(work_times) * 1000,
+            "cpu_percent": cpu_time / total_time * 100 if total_time else 0,
+        }
+
+
+frame_scheduler = FrameScheduler()
@@ -6,7 +6,7 @@ import pygame
 import pygame_gui
 import ujson
 
-from scripts.event_class import Single_Event
+from scripts.event_class import Single_Event, Event_List
 from scripts.housekeeping.datadir import get_save_dir, get_temp_dir
 
 pygame.init()
@@ -25,7 +25,7 @@ class Game:
     mediated = []  # Keep track of which couples have been mediated this moon.
     just_died = []  # keeps track of which cats died this moon via die()
 
-    cur_events_list = []
+    cur_events_list = Event_List()
     ceremony_events_list = []
     birth_death_events_list = []
     relation_events_list = []
@@ -153,6 +153,7 @@ class Game:
         "showbounds": False,
         "visualdebugmode": False,
         "showfps": False,
+        "showframestats": False,
     }
 
     # Init Settings
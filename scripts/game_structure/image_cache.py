@@ -1,13 +1,192 @@
+"""
+Images loaded from file, and scaled versions of them, kept around so they don't have to be loaded and scaled again
+every time a screen is opened.
+
+The cache holds at most memory_budget bytes of images. When it is full, the images that haven't been used for
+the longest are dropped. The surfaces handed out are shared, so they must not be drawn on or changed. Make a copy
+first if that is needed.
+
+The images a screen uses are noted down in a manifest, which is saved when the game closes. Next time, they can be
+loaded ahead of time with preload_screen, e.g. while the player is still on the screen before.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
 import pygame
+import ujson
+
+memory_budget = 256 * 1024 * 1024  # bytes
+manifest_limit = 300  # most images noted down per screen
 
-_images = {}
+_cache = OrderedDict()  # key: (surface, size in bytes), least recently used first
+_cache_size = 0
+_lock = threading.RLock()
 
+hits = 0
+misses = 0
+evictions = 0
 
-def load_image(path):
+_manifest = {}  # screen name: {key: None}, in the order the screen first asked for them
+_current_screen = None
+
+
+def load_image(path, alpha=True):
+    """
+    Returns the image at path as a surface. It is converted for fast drawing, with convert_alpha,
+    or with convert if alpha is False.
     """
-    If not in the cache already, loads the image from path as a surface.
-    Otherwise, the image is retrieved from the cache.
+    return _get((path, None, False, alpha))
+
+
+def load_scaled(path, size, smooth=False, alpha=True):
     """
-    if path not in _images:
-        _images[path] = pygame.image.load(path).convert_alpha()
-    return _images[path]
+    Returns the image at path scaled to size, like pygame.transform.scale does, or smoothscale if smooth is True.
+    Scaling is only done the first time a size is asked for.
+    """
+    return _get((path, (int(size[0]), int(size[1])), smooth, alpha))
+
+
+def scale(surface, size, smooth=False):
+    """
+    Returns the surface scaled to size, for surfaces that don't come from a file, e.g. theme images.
+    The surface must not change afterwards.
+    """
+    size = (int(size[0]), int(size[1]))
+    if not surface.get_width() or not surface.get_height():
+        # pygame_gui hands out a new empty surface every time for theme images that failed to load
+        return pygame.transform.scale(surface, size)
+    key = ("surface", id(surface), size, smooth)
+    with _lock:
+        global hits, misses
+        entry = _cache.get(key)
+        # the original surface is kept with the scaled one, so its id can't be taken by another surface
+        if entry is not None and entry[0][1] is surface:
+            _cache.move_to_end(key)
+            hits += 1
+            return entry[0][0]
+        misses += 1
+        scaled = (pygame.transform.smoothscale if smooth else pygame.transform.scale)(
+            surface, size
+        )
+        _store(key, (scaled, surface), _surface_bytes(scaled))
+        return scaled
+
+
+def set_screen(name):
+    """Tells the cache which screen is being shown, so the images it loads are noted down in its manifest."""
+    global _current_screen
+    _current_screen = name
+
+
+def preload_screen(name):
+    """Loads the images the screen used last time, if they aren't in the cache already. Safe to call from a thread."""
+    for key in list(_manifest.get(name, ())):
+        try:
+            _get(key, count=False)
+        except (pygame.error, FileNotFoundError):
+            # the file is gone or broken, it is reported when the screen itself asks for it
+            pass
+
+
+def load_manifest(path):
+    """Reads the manifests saved by save_manifest. Does nothing if there are none yet."""
+    if not os.path.exists(path):
+        return
+    try:
+        with open(path, "r", encoding="utf-8") as read_file:
+            saved = ujson.loads(read_file.read())
+    except (OSError, ValueError):
+        print(f"WARNING: could not read the image manifest at {path}, it will be made again")
+        return
+
+    for screen, keys in saved.items():
+        _manifest[screen] = {
+            (key[0], tuple(key[1]) if key[1] else None, key[2], key[3]): None
+            for key in keys
+        }
+
+
+def save_manifest(path):
+    """Saves which images each screen used, for preload_screen to use next time."""
+    try:
+        with open(path, "w", encoding="utf-8") as write_file:
+            write_file.write(
+                ujson.dumps(
+                    {screen: list(keys) for screen, keys in _manifest.items()}
+                )
+            )
+    except OSError:
+        print(f"WARNING: could not save the image manifest to {path}")
+
+
+def get_stats():
+    """Returns the cache hits, misses and evictions so far, and how full the cache is."""
+    return {
+        "hits": hits,
+        "misses": misses,
+        "evictions": evictions,
+        "images": len(_cache),
+        "bytes": _cache_size,
+        "budget": memory_budget,
+    }
+
+
+def clear():
+    """Drops all images from the cache."""
+    global _cache_size
+    with _lock:
+        _cache.clear()
+        _cache_size = 0
+
+
+def _get(key, count=True):
+    global hits, misses
+    # screens made ahead of time on another thread load their images too, those don't belong to the current screen
+    if count and _current_screen is not None and threading.current_thread() is threading.main_thread():
+        keys = _manifest.setdefault(_current_screen, {})
+        if key not in keys and len(keys) < manifest_limit:
+            keys[key] = None
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            _cache.move_to_end(key)
+            if count:
+                hits += 1
+            return entry[0]
+        if count:
+            misses += 1
+
+    # loading happens outside the lock, so a preload doesn't hold up the screen that is being drawn
+    path, size, smooth, alpha = key
+    if size is None:
+        image = pygame.image.load(path)
+        image = image.convert_alpha() if alpha else image.convert()
+    else:
+        image = _get((path, None, False, alpha), count=False)
+        image = (pygame.transform.smoothscale if smooth else pygame.transform.scale)(
+            image, size
+        )
+
+    with _lock:
+        # another thread may have loaded it in the meantime, hand out the same surface as it did
+        if key in _cache:
+            return _cache[key][0]
+        _store(key, image, _surface_bytes(image))
+    return image
+
+
+def _store(key, value, size):
+    global _cache_size, evictions
+    _cache[key] = (value, size)
+    _cache_size += size
+    while _cache_size > memory_budget and len(_cache) > 1:
+        _, (_, dropped_size) = _cache.popitem(last=False)
+        _cache_size -= dropped_size
+        evictions += 1
+
+
+def _surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
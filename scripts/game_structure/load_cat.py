@@ -10,6 +10,7 @@ from scripts.cat.pelts import Pelt
 from scripts.cat_relations.inheritance import Inheritance
 from scripts.housekeeping.version import SAVE_VERSION_NUMBER
 from .game_essentials import game
+from .save_prefetch import read_json
 from ..cat.skills import CatSkills
 from ..housekeeping.datadir import get_save_dir
 
@@ -36,8 +37,7 @@ def json_load():
     with open(f"resources/dicts/conversion_dict.json", "r") as read_file:
         convert = ujson.loads(read_file.read())
     try:
-        with open(clan_cats_json_path, "r") as read_file:
-            cat_data = ujson.loads(read_file.read())
+        cat_data = read_json(clan_cats_json_path)
     except PermissionError as e:
         game.switches["error_message"] = f"Can\t open {clan_cats_json_path}!"
         game.switches["traceback"] = e
@@ -0,0 +1,60 @@
+"""
+Reads the json files of a save ahead of time, e.g. while the spritesheets are still loading.
+
+Loading a Clan reads a conditions file for every cat and a relationships file for every living cat, one after another. prefetch_json
+reads and parses them beforehand on another thread, and read_json hands out the parsed data instead of reading the
+file again. Files that have changed since they were prefetched are read again, so the data is never out of date.
+"""
+
+import os
+
+import ujson
+
+_prefetched = {}  # path: (time the file was last changed, parsed data)
+
+
+def prefetch_json(paths):
+    """Reads and parses the given json files, to be handed out by read_json. Files that can't be read are skipped,
+    read_json will run into the same error when they are needed."""
+    for path in paths:
+        try:
+            changed = os.path.getmtime(path)
+            with open(path, "r", encoding="utf-8") as read_file:
+                data = ujson.loads(read_file.read())
+        except (OSError, ValueError):
+            continue
+        _prefetched[path] = (changed, data)
+
+
+def prefetch_json_dir(directory, suffix=".json"):
+    """Prefetches all json files in the directory which end in suffix, e.g. all relationship files of a Clan."""
+    if not os.path.isdir(directory):
+        return
+    prefetch_json(
+        [entry.path for entry in os.scandir(directory) if entry.name.endswith(suffix)]
+    )
+
+
+def read_json(path):
+    """
+    Returns the parsed contents of the json file. Uses the prefetched data if the file hasn't changed since,
+    otherwise reads the file, raising the same errors as reading it with open and ujson.loads would.
+    Prefetched data is only handed out once, after that the file is read again.
+    """
+    prefetched = _prefetched.pop(path, None)
+    if prefetched is not None and prefetched[0] == os.path.getmtime(path):
+        return prefetched[1]
+
+    with open(path, "r", encoding="utf-8") as read_file:
+        return ujson.loads(read_file.read())
+
+
+def peek_json(path):
+    """Returns the prefetched data of the file without handing it out, or None if it hasn't been prefetched."""
+    prefetched = _prefetched.get(path)
+    return prefetched[1] if prefetched is not None else None
+
+
+def clear_prefetched():
+    """Drops all prefetched data, e.g. once a Clan has been loaded."""
+    _prefetched.clear()
@@ -0,0 +1,38 @@
+import pygame
+
+DEFAULT_FONT = "resources/fonts/NotoSans-Medium.ttf"
+
+_fonts = {}
+_glyph_widths = {}
+_text_widths = {}
+
+
+def get_font(font_type=DEFAULT_FONT, font_size=30):
+    """
+    If not in the cache already, creates a pygame Font from the font file at the given size.
+    Otherwise, the font is retrieved from the cache.
+    """
+    key = (font_type, font_size)
+    if key not in _fonts:
+        _fonts[key] = pygame.font.Font(font_type, font_size)
+    return _fonts[key]
+
+
+def glyph_width(character, font_type=DEFAULT_FONT, font_size=30):
+    """
+    Returns the rendered width of a single character, measuring it only the first time.
+    """
+    key = (font_type, font_size, character)
+    if key not in _glyph_widths:
+        _glyph_widths[key] = get_font(font_type, font_size).size(character)[0]
+    return _glyph_widths[key]
+
+
+def text_width(text, font_type=DEFAULT_FONT, font_size=30):
+    """
+    Returns the rendered width of a whole string, measuring it only the first time.
+    """
+    key = (font_type, font_size, text)
+    if key not in _text_widths:
+        _text_widths[key] = get_font(font_type, font_size).size(text)[0]
+    return _text_widths[key]
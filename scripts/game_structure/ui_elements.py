@@ -12,6 +12,7 @@ from pygame_gui.core.text.text_box_layout import TextBoxLayout
 from pygame_gui.core.utility import translate
 from pygame_gui.elements import UIAutoResizingContainer, UIHorizontalScrollBar
 
+from scripts.cat.cats import Cat
 from scripts.game_structure import image_cache
 from scripts.game_structure.game_essentials import game
 
@@ -29,7 +30,7 @@ class UIImageButton(pygame_gui.elements.UIButton):
             normal_image = self.ui_theme.get_image(
                 "normal_image", self.combined_element_ids
             )
-            normal_image = pygame.transform.scale(
+            normal_image = image_cache.scale(
                 normal_image, self.relative_rect.size
             )  # auto-rescale the image
         except LookupError:
@@ -47,7 +48,7 @@ class UIImageButton(pygame_gui.elements.UIButton):
             hovered_image = self.ui_theme.get_image(
                 "hovered_image", self.combined_element_ids
             )
-            hovered_image = pygame.transform.scale(
+            hovered_image = image_cache.scale(
                 hovered_image, self.relative_rect.size
             )  # auto-rescale the image
         except LookupError:
@@ -62,7 +63,7 @@ class UIImageButton(pygame_gui.elements.UIButton):
             selected_image = self.ui_theme.get_image(
                 "selected_image", self.combined_element_ids
             )
-            selected_image = pygame.transform.scale(
+            selected_image = image_cache.scale(
                 selected_image, self.relative_rect.size
             )  # auto-rescale the image
         except LookupError:
@@ -77,7 +78,7 @@ class UIImageButton(pygame_gui.elements.UIButton):
             disabled_image = self.ui_theme.get_image(
                 "disabled_image", self.combined_element_ids
             )
-            disabled_image = pygame.transform.scale(
+            disabled_image = image_cache.scale(
                 disabled_image, self.relative_rect.size
             )  # auto-rescale the image
         except LookupError:
@@ -100,7 +101,8 @@ class UIModifiedScrollingContainer(pygame_gui.elements.UIScrollingContainer):
             object_id=None,
             visible: int = 1,
             allow_scroll_x: bool = False,
-            allow_scroll_y: bool = False):
+            allow_scroll_y: bool = False,
+            should_grow_automatically: bool = True):
 
         super().__init__(
             relative_rect=relative_rect,
@@ -111,7 +113,7 @@ class UIModifiedScrollingContainer(pygame_gui.elements.UIScrollingContainer):
             visible=visible,
             allow_scroll_x=allow_scroll_x,
             allow_scroll_y=allow_scroll_y,
-            should_grow_automatically=True)
+            should_grow_automatically=should_grow_automatically)
 
         if self.allow_scroll_y:
             self.vert_scroll_bar.kill()
@@ -583,8 +585,8 @@ class UIRelationStatusBar:
             else:
                 overlay_path += "relations_border_dots.png"
 
-        image = pygame.transform.scale(
-            image_cache.load_image(overlay_path).convert_alpha(),
+        image = image_cache.load_scaled(
+            overlay_path,
             (relative_rect[2], relative_rect[3]),
         )
 
@@ -839,14 +841,17 @@ class UICatListDisplay(UIContainer):
         self.cat_names = {}
         self.cat_chunks = []
         self.boxes = []
+        self._displayed = None
 
         self.show_names = show_names
 
-        self._favor_circle = pygame.transform.scale(
-            pygame.image.load(f"resources/images/fav_marker.png").convert_alpha(),
+        self._favor_circle = image_cache.load_scaled(
+            f"resources/images/fav_marker.png",
             (100, 100),
         )
         if game.settings["dark mode"]:
+            # the cached image is shared, so fade a copy of it
+            self._favor_circle = self._favor_circle.copy()
             self._favor_circle.set_alpha(150)
 
         cell_width = floor(self.relative_rect.width / self.columns)
@@ -868,13 +873,60 @@ class UICatListDisplay(UIContainer):
                 new_row.append(ui_container)
             self.boxes.append(new_row)
 
+        self._create_pool()
         self._chunk()
         self._display_cats()
 
+    def _create_pool(self):
+        """
+        creates one favourite indicator, sprite button and name label per cell. These are reused for every
+        page, so changing pages only swaps images and text rather than rebuilding the ui elements
+        """
+        blank_sprite = pygame.Surface((100, 100), pygame.SRCALPHA)
+        i = -1
+        for row in range(self.rows):
+            for column in range(self.columns):
+                container = self.boxes[row][column]
+                i += 1
+                if i >= self.cats_displayed:
+                    return
+                self.create_favor_indicator(i, container)
+                self.favor_indicator[f"favor{i}"].hide()
+                self.cat_sprites[f"sprite{i}"] = UISpriteButton(
+                    scale(pygame.Rect((0, 30), (100, 100))),
+                    blank_sprite,
+                    container=container,
+                    object_id=f"#sprite{str(i)}",
+                    starting_height=1,
+                    anchors={"centerx": "centerx"},
+                )
+                self.cat_sprites[f"sprite{i}"].hide()
+                if self.show_names:
+                    self.cat_names[f"name{i}"] = pygame_gui.elements.UILabel(
+                        scale(
+                            pygame.Rect(
+                                (0, 10),
+                                (100 + self.x_px_between, 60),
+                            )
+                        ),
+                        "",
+                        container=container,
+                        object_id=self.text_theme,
+                        anchors={
+                            "centerx": "centerx",
+                            "top_target": self.cat_sprites[f"sprite{i}"],
+                        },
+                    )
+                    self.cat_names[f"name{i}"].hide()
+
     def clear_display(self):
         [sprite.kill() for sprite in self.cat_sprites.values()]
         [name.kill() for name in self.cat_names.values()]
         [favor.kill() for favor in self.favor_indicator.values()]
+        self.cat_sprites = {}
+        self.cat_names = {}
+        self.favor_indicator = {}
+        self._displayed = None
         self.next_button = None
         self.prev_button = None
         self.first_button = None
@@ -904,7 +956,7 @@ class UICatListDisplay(UIContainer):
 
     def _display_cats(self):
         """
-        creates the cat display
+        fills the pooled cells with the cats on the current page
         """
         self.current_page = max(1, min(self.current_page, len(self.cat_chunks)))
 
@@ -915,77 +967,63 @@ class UICatListDisplay(UIContainer):
             self.total_pages = len(self.cat_chunks)
             display_cats = self.cat_chunks[self.current_page - 1]
 
-        [sprite.kill() for sprite in self.cat_sprites.values()]
-        [name.kill() for name in self.cat_names.values()]
-        [favor.kill() for favor in self.favor_indicator.values()]
-
         show_fav = game.clan.clan_settings["show fav"]
 
-        # FAVOURITE ICON
-        if show_fav:
-            i = -1
-            for row in range(self.rows):
-                for column in range(self.columns):
-                    container = self.boxes[row][column]
-                    i += 1
-                    try:
-                        kitty = display_cats[i]
-                    except IndexError:
-                        break
-                    if kitty.favourite:
-                        self.create_favor_indicator(i, container)
-
-        # CAT SPRITE
-        i = -1
-        for row in range(self.rows):
-            for column in range(self.columns):
-                container = self.boxes[row][column]
-                i += 1
-                try:
-                    kitty = display_cats[i]
-                except IndexError:
-                    break
-                self.create_cat_button(i, kitty, container)
-
-        # CAT NAME
-        if self.show_names:
-            i = -1
-            for row in range(self.rows):
-                for column in range(self.columns):
-                    container = self.boxes[row][column]
-                    i += 1
-                    try:
-                        kitty = display_cats[i]
-                    except IndexError:
-                        break
-                    self.cat_names[f"name{i}"] = pygame_gui.elements.UILabel(
-                        scale(
-                            pygame.Rect(
-                                (0, 10),
-                                (100 + self.x_px_between, 60),
-                            )
-                        ),
-                        shorten_text_to_fit(str(kitty.name), 220, 30),
-                        container=container,
-                        object_id=self.text_theme,
-                        anchors={
-                            "centerx": "centerx",
-                            "top_target": self.cat_sprites[f"sprite{i}"],
-                        },
-                    )
-
-    def create_cat_button(self, i, kitty, container):
-        self.cat_sprites[f"sprite{i}"] = UISpriteButton(
-            scale(pygame.Rect((0, 30), (100, 100))),
-            kitty.sprite,
-            cat_object=kitty,
-            cat_id=kitty.ID,
-            container=container,
-            object_id=f"#sprite{str(i)}",
-            tool_tip_text=str(kitty.name) if self.tool_tip_name else None,
-            starting_height=1,
-            anchors={"centerx": "centerx"},
+        # Screens refresh the display every frame, so skip the work if nothing visible has changed
+        displayed = (
+            show_fav,
+            self.text_theme,
+            tuple(
+                (kitty.ID, id(kitty.sprite), kitty.favourite, str(kitty.name))
+                for kitty in display_cats
+            ),
         )
+        if displayed == self._displayed:
+            return
+        self._displayed = displayed
+
+        for i in range(self.cats_displayed):
+            sprite = self.cat_sprites.get(f"sprite{i}")
+            if sprite is None:
+                break
+            name = self.cat_names.get(f"name{i}")
+            favor = self.favor_indicator[f"favor{i}"]
+            try:
+                kitty = display_cats[i]
+            except IndexError:
+                sprite.hide()
+                favor.hide()
+                if name:
+                    name.hide()
+                continue
+
+            # FAVOURITE ICON
+            if show_fav and kitty.favourite:
+                favor.show()
+            else:
+                favor.hide()
+
+            # CAT SPRITE
+            self.update_cat_button(i, kitty)
+
+            # CAT NAME
+            if name:
+                if name.object_ids[-1] != self.text_theme:
+                    name.change_object_id(self.text_theme)
+                name.set_text(shorten_text_to_fit(str(kitty.name), 220, 30))
+                name.show()
+
+        # Get the next page ready in the background, so flipping to it doesn't have to generate sprites
+        if self.current_page < len(self.cat_chunks):
+            Cat.prewarm_sprites(self.cat_chunks[self.current_page])
+
+    def update_cat_button(self, i, kitty):
+        sprite = self.cat_sprites[f"sprite{i}"]
+        sprite.set_image(pygame.transform.scale(kitty.sprite, sprite.image.rect.size))
+        sprite.button.set_id(kitty.ID)
+        sprite.button.cat_object = kitty
+        sprite.button.set_tooltip(str(kitty.name) if self.tool_tip_name else None)
+        sprite.show()
 
     def create_favor_indicator(self, i, container):
         self.favor_indicator[f"favor{i}"] = pygame_gui.elements.UIImage(
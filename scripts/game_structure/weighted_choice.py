@@ -0,0 +1,80 @@
+"""
+Weighted random picks.
+
+random.choices adds up all the weights and searches through them again on every call. That is fine for a list
+that is made fresh for a single pick, but wasteful for pools that are drawn from over and over, like the patrol
+prey sizes or the thought files. AliasTable does that work once (Walker's alias method), after which every pick
+takes the same short time, however big the pool is.
+"""
+
+import random
+
+
+class AliasTable:
+    """A pool of items to pick from by weight, over and over. The pool can't be changed once made."""
+
+    def __init__(self, items, weights=None):
+        self.items = list(items)
+        self.weights = list(weights) if weights is not None else [1] * len(self.items)
+        if len(self.weights) != len(self.items):
+            raise ValueError("There must be as many weights as items")
+        total = sum(self.weights)
+        if not self.items or total <= 0:
+            raise ValueError("Can't pick from an empty pool")
+
+        # every column holds up to two items: its own and, for the rest of the column, an alias
+        count = len(self.items)
+        scaled = [weight * count / total for weight in self.weights]
+        self._own_chance = [1.0] * count
+        self._alias = list(range(count))
+        small = [i for i, weight in enumerate(scaled) if weight < 1]
+        large = [i for i, weight in enumerate(scaled) if weight >= 1]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self._own_chance[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] += scaled[less] - 1
+            if scaled[more] < 1:
+                small.append(more)
+            else:
+                large.append(more)
+
+    def __len__(self):
+        return len(self.items)
+
+    def choice(self):
+        """Picks one item."""
+        column = random.randrange(len(self.items))
+        if random.random() < self._own_chance[column]:
+            return self.items[column]
+        return self.items[self._alias[column]]
+
+    def choice_where(self, allowed, attempts=8):
+        """
+        Picks one item that allowed(item) is True for, with the same odds between those items as in the whole pool.
+        Returns None if there is no such item. allowed must not change anything, since it can be asked about
+        the same item more than once.
+
+        When most items are allowed, this only checks the few items it picks. When few are, it gives up after
+        a number of attempts and checks the whole pool instead, so the odds stay the same either way.
+        """
+        for _ in range(attempts):
+            item = self.choice()
+            if allowed(item):
+                return item
+
+        subset = [(item, weight) for item, weight in zip(self.items, self.weights) if weight > 0 and allowed(item)]
+        if not subset:
+            return None
+        return weighted_choice([i[0] for i in subset], [i[1] for i in subset])
+
+
+def weighted_choice(items, weights=None):
+    """
+    Picks one item from a list that is only picked from once, e.g. one that was just filtered.
+    Uses a plain random.choice when all weights are the same.
+    """
+    if weights is None or (len(set(weights)) == 1 and weights[0] > 0):
+        return random.choice(items)
+    return random.choices(items, weights)[0]
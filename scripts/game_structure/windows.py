@@ -241,8 +241,8 @@ class SaveCheck(UIWindow):
         )
         self.save_button_saved_state = pygame_gui.elements.UIImage(
             scale(pygame.Rect((186, 230), (228, 60))),
-            pygame.transform.scale(
-                image_cache.load_image("resources/images/save_clan_saved.png"),
+            image_cache.load_scaled(
+                "resources/images/save_clan_saved.png",
                 (228, 60),
             ),
             starting_height=top_stack_menu_layer_height + 2,
@@ -251,8 +251,8 @@ class SaveCheck(UIWindow):
         self.save_button_saved_state.hide()
         self.save_button_saving_state = pygame_gui.elements.UIImage(
             scale(pygame.Rect((186, 230), (228, 60))),
-            pygame.transform.scale(
-                image_cache.load_image("resources/images/save_clan_saving.png"),
+            image_cache.load_scaled(
+                "resources/images/save_clan_saving.png",
                 (228, 60),
             ),
             starting_height=top_stack_menu_layer_height + 1,
@@ -705,8 +705,8 @@ class PronounCreation(UIWindow):
         # Add the Demo frame to the sub-container
         self.elements["demo_frame"] = pygame_gui.elements.UIImage(
             scale(pygame.Rect((0, 0), (414, 576))),
-            pygame.transform.scale(
-                pygame.image.load(Demo_frame).convert_alpha(), (699, 520)
+            image_cache.load_scaled(
+                Demo_frame, (699, 520)
             ),
             manager=MANAGER,
             container=self.demo_container,
@@ -1861,7 +1861,7 @@ class EventLoading(UIWindow):
         frames = []
         for i in range(0, 16):
             frames.append(
-                pygame.image.load(f"resources/images/loading_animate/timeskip/{i}.png")
+                image_cache.load_image(f"resources/images/loading_animate/timeskip/{i}.png")
             )
 
         return frames
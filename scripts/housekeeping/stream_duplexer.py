@@ -1,3 +1,7 @@
+import queue
+import threading
+import time
+
 from scripts.housekeeping.noop_writer import NoopWriter
 
 
@@ -40,3 +44,145 @@ class UnbufferedStreamDuplexer:
 
     def flush(self):
         pass
+
+
+class QueuedStreamDuplexer:
+    """
+    Writes to both streams from a background thread, so print() only has to put the text in a queue.
+    Writes are flushed in batches, at most flush_interval seconds after they were made.
+
+    With dedupe on, a line that is written more than repeat_limit times within repeat_window seconds
+    is only written repeat_limit times, followed by a note of how often it was left out. This keeps warnings
+    that are printed for every cat in a moon from flooding the log.
+    """
+
+    def __init__(
+        self,
+        first_stream,
+        second_stream,
+        noop_writer_fallback=True,
+        dedupe=False,
+        flush_interval=0.25,
+        repeat_limit=5,
+        repeat_window=10,
+    ):
+        self.firstStream = first_stream
+        self.secondStream = second_stream
+
+        if noop_writer_fallback:
+            if self.firstStream is None:
+                self.firstStream = NoopWriter()
+            if self.secondStream is None:
+                self.secondStream = NoopWriter()
+
+        self.dedupe = dedupe
+        self.flush_interval = flush_interval
+        self.repeat_limit = repeat_limit
+        self.repeat_window = repeat_window
+
+        self.queue = queue.SimpleQueue()
+        self.flush_requested = threading.Event()
+        self.partial_line = ""
+        self.line_counts = {}  # line: times it was written in this window
+        self.window_started = time.monotonic()
+        self.last_flush = time.monotonic()
+        self.unflushed = False
+
+        self.writer = threading.Thread(
+            target=self._write_loop, name="log_writer", daemon=True
+        )
+        self.writer.start()
+
+    def write(self, data):
+        self.queue.put(data)
+
+    def flush(self):
+        """Asks for the queued text to be flushed soon, without waiting for it."""
+        self.flush_requested.set()
+
+    def drain(self, timeout=2):
+        """Waits until everything written so far is written out and flushed, e.g. before the game closes."""
+        done = threading.Event()
+        self.queue.put(done)
+        if not done.wait(timeout) and not self.writer.is_alive():
+            # the writer thread is gone, write out what's left from here. If it's only slow or stuck, writing from
+            # here as well would mix up both threads' output, so the rest is left to it.
+            self._write_out(
+                [item for item in self._take_queued() if isinstance(item, str)], final=True
+            )
+
+    def _write_loop(self):
+        while True:
+            try:
+                first = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                first = None
+            items = [first] if first is not None else []
+            items.extend(self._take_queued())
+
+            drained = [item for item in items if isinstance(item, threading.Event)]
+            text = [item for item in items if isinstance(item, str)]
+            try:
+                self._write_out(text, final=bool(drained))
+            except Exception:  # pylint: disable=broad-except
+                # there's nowhere left to report this, but the game shouldn't lose its logging for it
+                pass
+            for done in drained:
+                done.set()
+
+    def _take_queued(self):
+        items = []
+        while True:
+            try:
+                items.append(self.queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    def _write_out(self, text, final=False):
+        now = time.monotonic()
+        flush_due = (
+            final
+            or self.flush_requested.is_set()
+            or now - self.last_flush >= self.flush_interval
+        )
+
+        if self.dedupe:
+            lines = (self.partial_line + "".join(text)).split("\n")
+            self.partial_line = lines.pop()
+            out = [line + "\n" for line in lines if self._should_write(line)]
+            if now - self.window_started >= self.repeat_window or final:
+                out.extend(self._repeat_notes())
+                self.window_started = now
+            if flush_due and self.partial_line:
+                out.append(self.partial_line)
+                self.partial_line = ""
+            out = "".join(out)
+        else:
+            out = "".join(text)
+
+        if out:
+            self.firstStream.write(out)
+            self.secondStream.write(out)
+            self.unflushed = True
+        if flush_due and self.unflushed:
+            self.unflushed = False
+            self.flush_requested.clear()
+            self.last_flush = now
+            self.firstStream.flush()
+            self.secondStream.flush()
+
+    def _should_write(self, line):
+        if not line.strip():
+            return True
+        count = self.line_counts.get(line, 0) + 1
+        self.line_counts[line] = count
+        return count <= self.repeat_limit
+
+    def _repeat_notes(self):
+        notes = [
+            f"[left out {count - self.repeat_limit} more of: {line[:120]}]\n"
+            for line, count in self.line_counts.items()
+            if count > self.repeat_limit
+        ]
+        self.line_counts.clear()
+        return notes
@@ -0,0 +1,77 @@
+"""
+Runs the steps of a job like starting the game, with the steps that don't wait on each other running at the same
+time. Each step is timed, so the timeline shows which step holds up the rest when launching gets slower.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+class TaskGraph:
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self.tasks = {}  # name: (function, names of the tasks it waits for)
+        self.times = {}  # name: (start, end), in seconds since the graph started running
+        self.skipped = []  # names of the tasks that didn't run because a task they wait for failed
+
+    def add_task(self, name, function, after=()):
+        """Adds a step, which is run once all the steps named in after are done."""
+        for other in after:
+            if other not in self.tasks:
+                raise ValueError(f"{name} waits for {other}, which has not been added")
+        self.tasks[name] = (function, tuple(after))
+
+    def run(self):
+        """
+        Runs all steps and waits for them to finish. If a step raises an exception, the steps that wait for it are
+        skipped and the others still run. The first exception is raised again once everything has stopped.
+        """
+        started = time.perf_counter()
+        waiting = dict(self.tasks)
+        running = {}  # future: name
+        done = set()
+        failed = set()
+        first_error = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="startup") as executor:
+            while waiting or running:
+                for name, (function, after) in list(waiting.items()):
+                    if any(other in failed for other in after):
+                        del waiting[name]
+                        failed.add(name)
+                        self.skipped.append(name)
+                    elif all(other in done for other in after):
+                        del waiting[name]
+                        running[executor.submit(self._timed, name, function, started)] = name
+
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    if future.exception() is None:
+                        done.add(name)
+                        continue
+                    failed.add(name)
+                    if first_error is None:
+                        first_error = future.exception()
+
+        if first_error is not None:
+            raise first_error
+
+    def timeline(self):
+        """Returns a line for each step that ran, with when it started and finished, in the order they started."""
+        width = max((len(name) for name in self.times), default=0)
+        lines = [
+            f"{name.ljust(width)}  {start:6.3f}s - {end:6.3f}s  ({end - start:.3f}s)"
+            for name, (start, end) in sorted(self.times.items(), key=lambda item: item[1][0])
+        ]
+        lines.extend(f"{name.ljust(width)}  skipped" for name in self.skipped)
+        return lines
+
+    def _timed(self, name, function, started):
+        start = time.perf_counter() - started
+        try:
+            function()
+        finally:
+            self.times[name] = (start, time.perf_counter() - started)
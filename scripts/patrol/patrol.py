@@ -2,9 +2,8 @@
 # -*- coding: ascii -*-
 import random
 from copy import deepcopy
-from itertools import repeat
 from os.path import exists as path_exists
-from random import choice, randint, choices
+from random import choice, randint
 from typing import List, Tuple
 
 import pygame
@@ -14,6 +13,7 @@ from scripts.cat.cats import Cat
 from scripts.cat.history import History
 from scripts.clan import Clan
 from scripts.game_structure.game_essentials import game
+from scripts.game_structure.weighted_choice import AliasTable, weighted_choice
 from scripts.patrol.patrol_event import PatrolEvent
 from scripts.patrol.patrol_outcome import PatrolOutcome
 from scripts.special_dates import get_special_date, contains_special_date_tag
@@ -37,6 +37,10 @@ When adding new patrols, use \n to add a paragraph break in the text
 
 class Patrol:
     used_patrols = []
+    # (biome, season): AliasTable of the prey sizes balance_hunting picks from
+    prey_size_tables = {}
+    # path: PatrolEvents of the patrol file
+    patrol_catalog = {}
 
     def __init__(self):
 
@@ -75,18 +79,18 @@ class Patrol:
         )
 
         if final_patrols:
-            normal_event_choice = choices(
-                final_patrols, weights=[x.weight for x in final_patrols]
-            )[0]
+            normal_event_choice = weighted_choice(
+                final_patrols, [x.weight for x in final_patrols]
+            )
         else:
             print("ERROR: NO POSSIBLE NORMAL PATROLS FOUND for: ", self.patrol_statuses)
             raise RuntimeError
 
         romantic_event_choice = None
         if final_romance_patrols:
-            romantic_event_choice = choices(
+            romantic_event_choice = weighted_choice(
                 final_romance_patrols, [x.weight for x in final_romance_patrols]
-            )[0]
+            )
 
         if romantic_event_choice and Patrol.decide_if_romantic(
             romantic_event_choice,
@@ -298,49 +302,41 @@ class Patrol:
             welcoming_rep = True
             chance = welcoming_chance
 
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING))
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT_GEN))
+        possible_patrols.extend(self.HUNTING)
+        possible_patrols.extend(self.HUNTING_SZN)
+        possible_patrols.extend(self.BORDER)
+        possible_patrols.extend(self.BORDER_SZN)
+        possible_patrols.extend(self.TRAINING)
+        possible_patrols.extend(self.TRAINING_SZN)
+        possible_patrols.extend(self.MEDCAT)
+        possible_patrols.extend(self.MEDCAT_SZN)
+        possible_patrols.extend(self.HUNTING_GEN)
+        possible_patrols.extend(self.BORDER_GEN)
+        possible_patrols.extend(self.TRAINING_GEN)
+        possible_patrols.extend(self.MEDCAT_GEN)
 
         if game_setting_disaster:
             dis_chance = int(random.getrandbits(3))  # disaster patrol chance
             if dis_chance == 1:
-                possible_patrols.extend(self.generate_patrol_events(self.DISASTER))
+                possible_patrols.extend(self.DISASTER)
 
         # new cat patrols
         if chance == 1:
             if welcoming_rep:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.NEW_CAT_WELCOMING)
-                )
+                possible_patrols.extend(self.NEW_CAT_WELCOMING)
             elif neutral_rep:
-                possible_patrols.extend(self.generate_patrol_events(self.NEW_CAT))
+                possible_patrols.extend(self.NEW_CAT)
             elif hostile_rep:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.NEW_CAT_HOSTILE)
-                )
+                possible_patrols.extend(self.NEW_CAT_HOSTILE)
 
         # other Clan patrols
         if other_clan_chance == 1:
             if clan_neutral:
-                possible_patrols.extend(self.generate_patrol_events(self.OTHER_CLAN))
+                possible_patrols.extend(self.OTHER_CLAN)
             elif clan_allies:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.OTHER_CLAN_ALLIES)
-                )
+                possible_patrols.extend(self.OTHER_CLAN_ALLIES)
             elif clan_hostile:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.OTHER_CLAN_HOSTILE)
-                )
+                possible_patrols.extend(self.OTHER_CLAN_HOSTILE)
 
         final_patrols, final_romance_patrols = self.get_filtered_patrols(
             possible_patrols, biome, camp, current_season, patrol_type
@@ -643,12 +639,12 @@ class Patrol:
         fail_outcomes = PatrolOutcome.prepare_allowed_outcomes(fail_outcomes, self)
 
         # Choose a success and fail outcome
-        chosen_success = choices(
-            success_outcomes, weights=[x.weight for x in success_outcomes]
-        )[0]
-        chosen_failure = choices(
-            fail_outcomes, weights=[x.weight for x in fail_outcomes]
-        )[0]
+        chosen_success = weighted_choice(
+            success_outcomes, [x.weight for x in success_outcomes]
+        )
+        chosen_failure = weighted_choice(
+            fail_outcomes, [x.weight for x in fail_outcomes]
+        )
 
         final_event, success = self.calculate_success(chosen_success, chosen_failure)
 
@@ -720,101 +716,41 @@ class Patrol:
     def update_resources(self, biome_dir, leaf):
         resource_dir = "resources/dicts/patrols/"
         # HUNTING #
-        self.HUNTING_SZN = None
-        with open(
-            f"{resource_dir}{biome_dir}hunting/{leaf}.json", "r", encoding="ascii"
-        ) as read_file:
-            self.HUNTING_SZN = ujson.loads(read_file.read())
-        self.HUNTING = None
-        with open(
-            f"{resource_dir}{biome_dir}hunting/any.json", "r", encoding="ascii"
-        ) as read_file:
-            self.HUNTING = ujson.loads(read_file.read())
+        self.HUNTING_SZN = self.load_patrol_events(f"{resource_dir}{biome_dir}hunting/{leaf}.json")
+        self.HUNTING = self.load_patrol_events(f"{resource_dir}{biome_dir}hunting/any.json")
         # BORDER #
-        self.BORDER_SZN = None
-        with open(
-            f"{resource_dir}{biome_dir}border/{leaf}.json", "r", encoding="ascii"
-        ) as read_file:
-            self.BORDER_SZN = ujson.loads(read_file.read())
-        self.BORDER = None
-        with open(
-            f"{resource_dir}{biome_dir}border/any.json", "r", encoding="ascii"
-        ) as read_file:
-            self.BORDER = ujson.loads(read_file.read())
+        self.BORDER_SZN = self.load_patrol_events(f"{resource_dir}{biome_dir}border/{leaf}.json")
+        self.BORDER = self.load_patrol_events(f"{resource_dir}{biome_dir}border/any.json")
         # TRAINING #
-        self.TRAINING_SZN = None
-        with open(
-            f"{resource_dir}{biome_dir}training/{leaf}.json", "r", encoding="ascii"
-        ) as read_file:
-            self.TRAINING_SZN = ujson.loads(read_file.read())
-        self.TRAINING = None
-        with open(
-            f"{resource_dir}{biome_dir}training/any.json", "r", encoding="ascii"
-        ) as read_file:
-            self.TRAINING = ujson.loads(read_file.read())
+        self.TRAINING_SZN = self.load_patrol_events(f"{resource_dir}{biome_dir}training/{leaf}.json")
+        self.TRAINING = self.load_patrol_events(f"{resource_dir}{biome_dir}training/any.json")
         # MED #
-        self.MEDCAT_SZN = None
-        with open(
-            f"{resource_dir}{biome_dir}med/{leaf}.json", "r", encoding="ascii"
-        ) as read_file:
-            self.MEDCAT_SZN = ujson.loads(read_file.read())
-        self.MEDCAT = None
-        with open(
-            f"{resource_dir}{biome_dir}med/any.json", "r", encoding="ascii"
-        ) as read_file:
-            self.MEDCAT = ujson.loads(read_file.read())
+        self.MEDCAT_SZN = self.load_patrol_events(f"{resource_dir}{biome_dir}med/{leaf}.json")
+        self.MEDCAT = self.load_patrol_events(f"{resource_dir}{biome_dir}med/any.json")
         # NEW CAT #
-        self.NEW_CAT = None
-        with open(f"{resource_dir}new_cat.json", "r", encoding="ascii") as read_file:
-            self.NEW_CAT = ujson.loads(read_file.read())
-        self.NEW_CAT_HOSTILE = None
-        with open(
-            f"{resource_dir}new_cat_hostile.json", "r", encoding="ascii"
-        ) as read_file:
-            self.NEW_CAT_HOSTILE = ujson.loads(read_file.read())
-        self.NEW_CAT_WELCOMING = None
-        with open(
-            f"{resource_dir}new_cat_welcoming.json", "r", encoding="ascii"
-        ) as read_file:
-            self.NEW_CAT_WELCOMING = ujson.loads(read_file.read())
+        self.NEW_CAT = self.load_patrol_events(f"{resource_dir}new_cat.json")
+        self.NEW_CAT_HOSTILE = self.load_patrol_events(f"{resource_dir}new_cat_hostile.json")
+        self.NEW_CAT_WELCOMING = self.load_patrol_events(f"{resource_dir}new_cat_welcoming.json")
         # OTHER CLAN #
-        self.OTHER_CLAN = None
-        with open(f"{resource_dir}other_clan.json", "r", encoding="ascii") as read_file:
-            self.OTHER_CLAN = ujson.loads(read_file.read())
-        self.OTHER_CLAN_ALLIES = None
-        with open(
-            f"{resource_dir}other_clan_allies.json", "r", encoding="ascii"
-        ) as read_file:
-            self.OTHER_CLAN_ALLIES = ujson.loads(read_file.read())
-        self.OTHER_CLAN_HOSTILE = None
-        with open(
-            f"{resource_dir}other_clan_hostile.json", "r", encoding="ascii"
-        ) as read_file:
-            self.OTHER_CLAN_HOSTILE = ujson.loads(read_file.read())
-        self.DISASTER = None
-        with open(f"{resource_dir}disaster.json", "r", encoding="ascii") as read_file:
-            self.DISASTER = ujson.loads(read_file.read())
+        self.OTHER_CLAN = self.load_patrol_events(f"{resource_dir}other_clan.json")
+        self.OTHER_CLAN_ALLIES = self.load_patrol_events(f"{resource_dir}other_clan_allies.json")
+        self.OTHER_CLAN_HOSTILE = self.load_patrol_events(f"{resource_dir}other_clan_hostile.json")
+        self.DISASTER = self.load_patrol_events(f"{resource_dir}disaster.json")
         # sighing heavily as I add general patrols back in
-        self.HUNTING_GEN = None
-        with open(
-            f"{resource_dir}general/hunting.json", "r", encoding="ascii"
-        ) as read_file:
-            self.HUNTING_GEN = ujson.loads(read_file.read())
-        self.BORDER_GEN = None
-        with open(
-            f"{resource_dir}general/border.json", "r", encoding="ascii"
-        ) as read_file:
-            self.BORDER_GEN = ujson.loads(read_file.read())
-        self.TRAINING_GEN = None
-        with open(
-            f"{resource_dir}general/training.json", "r", encoding="ascii"
-        ) as read_file:
-            self.TRAINING_GEN = ujson.loads(read_file.read())
-        self.MEDCAT_GEN = None
-        with open(
-            f"{resource_dir}general/medcat.json", "r", encoding="ascii"
-        ) as read_file:
-            self.MEDCAT_GEN = ujson.loads(read_file.read())
+        self.HUNTING_GEN = self.load_patrol_events(f"{resource_dir}general/hunting.json")
+        self.BORDER_GEN = self.load_patrol_events(f"{resource_dir}general/border.json")
+        self.TRAINING_GEN = self.load_patrol_events(f"{resource_dir}general/training.json")
+        self.MEDCAT_GEN = self.load_patrol_events(f"{resource_dir}general/medcat.json")
+
+    def load_patrol_events(self, path) -> List[PatrolEvent]:
+        """
+        Returns the patrols in the file as PatrolEvents, with all their outcomes. Each file is only read and
+        turned into PatrolEvents once, since the patrol files don't change while the game runs.
+        """
+        if path not in Patrol.patrol_catalog:
+            with open(path, "r", encoding="ascii") as read_file:
+                Patrol.patrol_catalog[path] = self.generate_patrol_events(ujson.loads(read_file.read()))
+        return Patrol.patrol_catalog[path]
 
     def balance_hunting(self, possible_patrols: list):
         """Filter the incoming hunting patrol list to balance the different kinds of hunting patrols.
@@ -835,13 +771,13 @@ class Patrol:
         # get first what kind of prey size which will be chosen
         biome = game.clan.biome
         season = game.clan.current_season
-        possible_prey_size = []
-        idx = 0
         prey_size = ["very_small", "small", "medium", "large", "huge"]
-        for amount in PATROL_BALANCE[biome][season]:
-            possible_prey_size.extend(repeat(prey_size[idx], amount))
-            idx += 1
-        chosen_prey_size = choice(possible_prey_size)
+        if (biome, season) not in Patrol.prey_size_tables:
+            Patrol.prey_size_tables[(biome, season)] = AliasTable(
+                prey_size[: len(PATROL_BALANCE[biome][season])],
+                PATROL_BALANCE[biome][season],
+            )
+        chosen_prey_size = Patrol.prey_size_tables[(biome, season)].choice()
         print(f"chosen filter prey size: {chosen_prey_size}")
 
         # filter all possible patrol depending on the needed prey size
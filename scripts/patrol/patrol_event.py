@@ -2,6 +2,7 @@
 # -*- coding: ascii -*-
 from typing import List, Union
 
+from scripts.cat_relations.constraints import compile_constraints
 from scripts.patrol.patrol_outcome import PatrolOutcome
 
 
@@ -56,6 +57,7 @@ class PatrolEvent:
                                                           is not None else []
         self.relationship_constraints = relationship_constraints if relationship_constraints \
                                                                     is not None else []
+        compile_constraints(self.relationship_constraints, f"patrol {patrol_id}")
         self.pl_skill_constraints = pl_skill_constraints if pl_skill_constraints is not None else []
         self.pl_trait_constraints = pl_trait_constraints if pl_trait_constraints is not None else []
         self.min_max_status = min_max_status if min_max_status is not None else {}
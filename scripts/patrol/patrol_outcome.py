@@ -2,6 +2,7 @@
 # -*- coding: ascii -*-
 import random
 import re
+from copy import copy
 from os.path import exists as path_exists
 from random import choice, choices
 from typing import List, Dict, Union, TYPE_CHECKING
@@ -40,6 +41,9 @@ from scripts.clan_resources.freshkill import (
 class PatrolOutcome:
     """Holds all info on patrol outcomes, and methods to handle that outcome"""
 
+    # the prey size tags, in the order of prey_types in _handle_prey
+    prey_sizes = ("very_small", "small", "medium", "large", "huge")
+
     def __init__(
         self,
         success: bool = True,
@@ -111,6 +115,52 @@ class PatrolOutcome:
         # This will hold the stat cat, for filtering purposes
         self.stat_cat = stat_cat
 
+        # Outcomes are made once, when their patrol file is loaded, and reused for every patrol after that.
+        # Everything that only depends on the outcome itself is worked out here, so choosing and running
+        # the outcome doesn't have to go through the lists again.
+        self.stat_cat_allowed_specific = [
+            x
+            for x in self.can_have_stat
+            if x in ("r_c", "p_l", "app1", "app2", "any", "not_pl_rc")
+        ]
+        self.stat_cat_status_allowed = self._compile_stat_cat_status_check()
+        self.prey_size = next((x for x in self.prey if x in PatrolOutcome.prey_sizes), None)
+        self.specific_herbs = [x for x in self.herbs if x in HERBS]
+        self.injury_blocks = [self._compile_injury_block(block) for block in self.injury]
+
+    def _compile_stat_cat_status_check(self):
+        """Returns a function telling if a cat has a status that can_have_stat allows for the stat cat."""
+        apprentices = ("apprentice", "medicine cat apprentice")
+        checks = []
+        if "app" in self.can_have_stat:
+            checks.append(lambda kitty: kitty.status in apprentices)
+        if "adult" in self.can_have_stat:
+            checks.append(lambda kitty: kitty.status not in apprentices)
+        if "healer" in self.can_have_stat:
+            checks.append(lambda kitty: kitty.status in ("medicine cat", "medicine cat apprentice"))
+
+        if not checks:
+            return lambda kitty: True
+        if len(checks) == 1:
+            return checks[0]
+        return lambda kitty: all(check(kitty) for check in checks)
+
+    @staticmethod
+    def _compile_injury_block(block: dict) -> tuple:
+        """Returns the injury block with the conditions it can give, and whether they can be lethal."""
+        if not isinstance(block, dict):
+            # _handle_condition_and_scars reports this one, if the outcome is ever chosen
+            return block, [], True
+
+        possible_injuries = []
+        for _tag in block.get("injuries", ()):
+            if _tag in INJURY_GROUPS:
+                possible_injuries.extend(INJURY_GROUPS[_tag])
+            elif _tag in INJURIES or _tag in ILLNESSES or _tag in PERMANENT:
+                possible_injuries.append(_tag)
+
+        return block, possible_injuries, "non_lethal" not in block.get("injuries", ())
+
     @staticmethod
     def prepare_allowed_outcomes(
         outcomes: List["PatrolOutcome"], patrol: "Patrol"
@@ -130,9 +180,12 @@ class PatrolOutcome:
 
             if out.stat_skill or out.stat_trait:
                 special = True
-                out._get_stat_cat(patrol)
-                if not isinstance(out.stat_cat, Cat):
+                stat_cat = out._get_stat_cat(patrol)
+                if not isinstance(stat_cat, Cat):
                     continue
+                # the outcome is shared between patrols, so the stat cat goes on a copy
+                out = copy(out)
+                out.stat_cat = stat_cat
 
             # TODO: outcome relationship constraints
             # if not patrol._satify_relationship_constaints(patrol, out.relationship_constaints):
@@ -294,7 +347,7 @@ class PatrolOutcome:
         return False
 
     def _get_stat_cat(self, patrol: "Patrol"):
-        """Sets the stat cat. Returns true if a stat cat was found, and False is a stat cat was not found"""
+        """Returns a stat cat for this outcome from the patrol, or None if no cat fits."""
 
         print("---")
         print(
@@ -303,11 +356,7 @@ class PatrolOutcome:
         print(f"Can Have Stat: {self.can_have_stat}")
 
         # Grab any specfic stat cat requirements:
-        allowed_specific = [
-            x
-            for x in self.can_have_stat
-            if x in ("r_c", "p_l", "app1", "app2", "any", "not_pl_rc")
-        ]
+        allowed_specific = self.stat_cat_allowed_specific
 
         # Special default behavior for patrols less than two cats.
         # Patrol leader is the only one allowed to be stat_cat in patrols equal to or less than than two cats
@@ -317,22 +366,7 @@ class PatrolOutcome:
         possible_stat_cats = []
         for kitty in patrol.patrol_cats:
             # First, the blanket requirements
-            if "app" in self.can_have_stat and kitty.status not in [
-                "apprentice",
-                "medicine cat apprentice",
-            ]:
-                continue
-
-            if "adult" in self.can_have_stat and kitty.status in [
-                "apprentice",
-                "medicine cat apprentice",
-            ]:
-                continue
-
-            if "healer" in self.can_have_stat and kitty.status not in [
-                "medicine cat",
-                "medicine cat apprentice",
-            ]:
+            if not self.stat_cat_status_allowed(kitty):
                 continue
 
             # Then, move on the specific requirements.
@@ -351,15 +385,16 @@ class PatrolOutcome:
             if kitty.skills.check_skill_requirement_list(self.stat_skill):
                 actual_stat_cats.append(kitty)
 
+        stat_cat = None
         if actual_stat_cats:
-            self.stat_cat = choice(actual_stat_cats)
-            print(f"Found stat cat: {self.stat_cat.name}")
+            stat_cat = choice(actual_stat_cats)
+            print(f"Found stat cat: {stat_cat.name}")
         else:
             print("No Stat Cat Found")
 
         print("---")
 
-        return
+        return stat_cat
 
     def get_outcome_art(self):
         """Return outcome art, if not None. Return's None if there is no outcome art, or if outcome art can't be found."""
@@ -494,9 +529,12 @@ class PatrolOutcome:
             return ""
 
         results = []
-        condition_lists = INJURY_GROUPS
 
-        for block in self.injury:
+        for block, possible_injuries, lethal in self.injury_blocks:
+            if not isinstance(block, dict):
+                print(f"something is wrong with injury - {block}")
+                continue
+
             cats = gather_cat_objects(Cat, block.get("cats", ()), patrol, self.stat_cat)
             injury = block.get("injuries", ())
             scars = block.get("scars", ())
@@ -505,17 +543,6 @@ class PatrolOutcome:
                 print(f"something is wrong with injury - {block}")
                 continue
 
-            possible_injuries = []
-            for _tag in injury:
-                if _tag in condition_lists:
-                    possible_injuries.extend(condition_lists[_tag])
-                elif _tag in INJURIES or _tag in ILLNESSES or _tag in PERMANENT:
-                    possible_injuries.append(_tag)
-
-            lethal = True
-            if "non_lethal" in injury:
-                lethal = False
-
             # Injury or scar the cats
             results = []
             for _cat in cats:
@@ -676,7 +703,7 @@ class PatrolOutcome:
             large_bonus = True
 
         # Determine which herbs get picked
-        specific_herbs = [x for x in self.herbs if x in HERBS]
+        specific_herbs = list(self.specific_herbs)
         if "random_herbs" in self.herbs:
             specific_herbs += random.sample(
                 HERBS, k=choices([1, 2, 3], [6, 5, 1], k=1)[0]
@@ -743,15 +770,11 @@ class PatrolOutcome:
             "huge": basic_amount * 3.2,
         }
 
-        used_tag = None
-        for tag in self.prey:
-            basic_amount = prey_types.get(tag)
-            if basic_amount is not None:
-                used_tag = tag
-                break
-        else:
+        used_tag = self.prey_size
+        if used_tag is None:
             print(f"{self.prey} - no prey amount tags in prey property")
             return ""
+        basic_amount = prey_types[used_tag]
 
         total_amount = 0
         highest_hunter_tier = 0
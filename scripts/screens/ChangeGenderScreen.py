@@ -7,6 +7,7 @@ import pygame_gui
 import ujson
 
 from scripts.cat.cats import Cat
+from scripts.game_structure import image_cache
 from scripts.game_structure.game_essentials import game, MANAGER
 from scripts.game_structure.ui_elements import UIImageButton, CatButton
 from scripts.utility import get_text_box_theme, shorten_text_to_fit
@@ -174,10 +175,8 @@ class ChangeGenderScreen(Screens):
 
         self.elements["cat_frame"] = pygame_gui.elements.UIImage(
             scale(pygame.Rect((100, 200), (1398, 1040))),
-            pygame.transform.scale(
-                pygame.image.load(
-                    "resources/images/gender_framing.png"
-                ).convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/gender_framing.png",
                 (699, 520),
             ),
             manager=MANAGER,
@@ -292,8 +291,8 @@ class ChangeGenderScreen(Screens):
             block_rect = scale(pygame.Rect((75, ycoor), (544, 88)))
             self.elements[f"cat_pronouns_{n}"] = pygame_gui.elements.UIImage(
                 block_rect,
-                pygame.transform.scale(
-                    pygame.image.load(pronoun_frame).convert_alpha(), (272, 44)
+                image_cache.load_scaled(
+                    pronoun_frame, (272, 44)
                 ),
                 container=self.removalboxes_text["container_general"],
                 manager=MANAGER,
@@ -385,8 +384,8 @@ class ChangeGenderScreen(Screens):
             block_rect = scale(pygame.Rect((75, ycoor), (544, 88)))
             self.elements[f"{n}"] = pygame_gui.elements.UIImage(
                 block_rect,
-                pygame.transform.scale(
-                    pygame.image.load(pronoun_frame).convert_alpha(), (272, 44)
+                image_cache.load_scaled(
+                    pronoun_frame, (272, 44)
                 ),
                 container=self.removalboxes_text["container_general2"],
                 manager=MANAGER,
@@ -464,8 +463,8 @@ class ChangeGenderScreen(Screens):
             block_rect = scale(pygame.Rect((75, ycoor), (544, 88)))
             self.elements[f"custom_pronouns_{n}"] = pygame_gui.elements.UIImage(
                 block_rect,
-                pygame.transform.scale(
-                    pygame.image.load(pronoun_frame).convert_alpha(), (272, 44)
+                image_cache.load_scaled(
+                    pronoun_frame, (272, 44)
                 ),
                 container=self.removalboxes_text["container_general2"],
                 manager=MANAGER,
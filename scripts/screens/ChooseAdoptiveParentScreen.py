@@ -17,8 +17,8 @@ from .Screens import Screens
 
 
 class ChooseAdoptiveParentScreen(Screens):
-    list_frame = pygame.transform.scale(
-        image_cache.load_image("resources/images/choosing_frame.png").convert_alpha(),
+    list_frame = image_cache.load_scaled(
+        "resources/images/choosing_frame.png",
         (1300 / 1600 * screen_x, 388 / 1400 * screen_y),
     )
 
@@ -176,27 +176,23 @@ class ChooseAdoptiveParentScreen(Screens):
 
         self.the_cat_frame = pygame_gui.elements.UIImage(
             scale(pygame.Rect((80, 226), (532, 394))),
-            pygame.transform.scale(
-                image_cache.load_image(
-                    "resources/images/choosing_cat1_frame_mate.png"
-                ).convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/choosing_cat1_frame_mate.png",
                 (532, 394),
             ),
         )
         self.parent_frame = pygame_gui.elements.UIImage(
             scale(pygame.Rect((988, 226), (532, 394))),
-            pygame.transform.scale(
-                image_cache.load_image(
-                    "resources/images/choosing_cat2_frame_mate.png"
-                ).convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/choosing_cat2_frame_mate.png",
                 (532, 394),
             ),
         )
 
         self.center_icon = pygame_gui.elements.UIImage(
             scale(pygame.Rect((612, 320), (376, 258))),
-            pygame.transform.scale(
-                image_cache.load_image("resources/images/adoption.png").convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/adoption.png",
                 scale_dimentions((376, 258)),
             ),
             manager=MANAGER,
@@ -252,8 +248,8 @@ class ChooseAdoptiveParentScreen(Screens):
         )
         self.potential_seperator = pygame_gui.elements.UIImage(
             scale(pygame.Rect((995, 0), (20, 352))),
-            pygame.transform.scale(
-                image_cache.load_image("resources/images/vertical_bar.png"),
+            image_cache.load_scaled(
+                "resources/images/vertical_bar.png",
                 scale_dimentions((20, 352)),
             ),
             container=self.potential_container,
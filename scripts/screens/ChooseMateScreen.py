@@ -21,8 +21,8 @@ from .Screens import Screens
 
 
 class ChooseMateScreen(Screens):
-    list_frame = pygame.transform.scale(
-        image_cache.load_image("resources/images/choosing_frame.png").convert_alpha(),
+    list_frame = image_cache.load_scaled(
+        "resources/images/choosing_frame.png",
         (1300 / 1600 * screen_x, 388 / 1400 * screen_y),
     )
 
@@ -196,19 +196,15 @@ class ChooseMateScreen(Screens):
 
         self.the_cat_frame = pygame_gui.elements.UIImage(
             scale(pygame.Rect((80, 226), (532, 394))),
-            pygame.transform.scale(
-                image_cache.load_image(
-                    "resources/images/choosing_cat1_frame_mate.png"
-                ).convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/choosing_cat1_frame_mate.png",
                 (532, 394),
             ),
         )
         self.mate_frame = pygame_gui.elements.UIImage(
             scale(pygame.Rect((988, 226), (532, 394))),
-            pygame.transform.scale(
-                image_cache.load_image(
-                    "resources/images/choosing_cat2_frame_mate.png"
-                ).convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/choosing_cat2_frame_mate.png",
                 (532, 394),
             ),
         )
@@ -261,8 +257,8 @@ class ChooseMateScreen(Screens):
         )
         self.offspring_seperator = pygame_gui.elements.UIImage(
             scale(pygame.Rect((995, 0), (20, 352))),
-            pygame.transform.scale(
-                image_cache.load_image("resources/images/vertical_bar.png"),
+            image_cache.load_scaled(
+                "resources/images/vertical_bar.png",
                 scale_dimentions((20, 352)),
             ),
             container=self.offspring_container,
@@ -292,8 +288,8 @@ class ChooseMateScreen(Screens):
         )
         self.potential_seperator = pygame_gui.elements.UIImage(
             scale(pygame.Rect((995, 0), (20, 352))),
-            pygame.transform.scale(
-                image_cache.load_image("resources/images/vertical_bar.png"),
+            image_cache.load_scaled(
+                "resources/images/vertical_bar.png",
                 scale_dimentions((20, 352)),
             ),
             container=self.potential_container,
@@ -892,30 +888,24 @@ class ChooseMateScreen(Screens):
         if self.selected_cat.ID in self.the_cat.mate:
             self.selected_cat_elements["center_heart"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((600, 376), (400, 156))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/heart_mates.png"
-                    ).convert_alpha(),
+                image_cache.load_scaled(
+                    "resources/images/heart_mates.png",
                     (400, 156),
                 ),
             )
         elif self.selected_cat.ID in self.the_cat.previous_mates:
             self.selected_cat_elements["center_heart"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((600, 376), (400, 156))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/heart_breakup.png"
-                    ).convert_alpha(),
+                image_cache.load_scaled(
+                    "resources/images/heart_breakup.png",
                     (400, 156),
                 ),
             )
         else:
             self.selected_cat_elements["center_heart"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((600, 376), (400, 156))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/heart_maybe.png"
-                    ).convert_alpha(),
+                image_cache.load_scaled(
+                    "resources/images/heart_maybe.png",
                     (400, 156),
                 ),
             )
@@ -996,28 +986,22 @@ class ChooseMateScreen(Screens):
         # Set the lines
         self.selected_cat_elements["compat_line"] = pygame_gui.elements.UIImage(
             scale(pygame.Rect((600, 380), (400, 156))),
-            pygame.transform.scale(
-                image_cache.load_image(
-                    "resources/images/line_neutral.png"
-                ).convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/line_neutral.png",
                 (400, 156),
             ),
         )
         if get_personality_compatibility(self.the_cat, self.selected_cat) is True:
             self.selected_cat_elements["compat_line"].set_image(
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/line_compatible.png"
-                    ).convert_alpha(),
+                image_cache.load_scaled(
+                    "resources/images/line_compatible.png",
                     (400, 156),
                 )
             )
         elif get_personality_compatibility(self.the_cat, self.selected_cat) is False:
             self.selected_cat_elements["compat_line"].set_image(
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/line_incompatible.png"
-                    ).convert_alpha(),
+                image_cache.load_scaled(
+                    "resources/images/line_incompatible.png",
                     (400, 156),
                 )
             )
@@ -1045,10 +1029,8 @@ class ChooseMateScreen(Screens):
         for i in range(0, heart_number):
             self.selected_cat_elements["heart1" + str(i)] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((x_pos, 570), (44, 40))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/heart_big.png"
-                    ).convert_alpha(),
+                image_cache.load_scaled(
+                    "resources/images/heart_big.png",
                     (44, 40),
                 ),
             )
@@ -1077,10 +1059,8 @@ class ChooseMateScreen(Screens):
         for i in range(0, heart_number):
             self.selected_cat_elements["heart2" + str(i)] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((x_pos, 570), (44, 40))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/heart_big.png"
-                    ).convert_alpha(),
+                image_cache.load_scaled(
+                    "resources/images/heart_big.png",
                     (44, 40),
                 ),
             )
@@ -1154,11 +1134,10 @@ class ChooseMateScreen(Screens):
         # Behold! The uglest list comprehension ever created!
         valid_mates = [
             i
-            for i in Cat.all_cats_list
-            if not i.faded
-            and self.the_cat.is_potential_mate(
-                i, for_love_interest=False, age_restriction=False, ignore_no_mates=True
+            for i in self.the_cat.get_potential_mates(
+                for_love_interest=False, age_restriction=False, ignore_no_mates=True
             )
+            if not i.faded
             and i.ID not in self.the_cat.mate
             and (not self.single_only or not i.mate)
             and (
@@ -21,8 +21,8 @@ from .Screens import Screens
 class ChooseMentorScreen(Screens):
     selected_mentor = None
     current_page = 1
-    list_frame = pygame.transform.scale(
-        image_cache.load_image("resources/images/choosing_frame.png").convert_alpha(),
+    list_frame = image_cache.load_scaled(
+        "resources/images/choosing_frame.png",
         (1300 / 1600 * screen_x, 452 / 1400 * screen_y),
     )
     apprentice_details = {}
@@ -146,20 +146,16 @@ class ChooseMentorScreen(Screens):
         # Layout Images:
         self.mentor_frame = pygame_gui.elements.UIImage(
             scale(pygame.Rect((80, 226), (562, 394))),
-            pygame.transform.scale(
-                image_cache.load_image(
-                    "resources/images/choosing_cat1_frame_ment.png"
-                ).convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/choosing_cat1_frame_ment.png",
                 (562, 394),
             ),
             manager=MANAGER,
         )
         self.app_frame = pygame_gui.elements.UIImage(
             scale(pygame.Rect((960, 226), (562, 394))),
-            pygame.transform.scale(
-                image_cache.load_image(
-                    "resources/images/choosing_cat2_frame_ment.png"
-                ).convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/choosing_cat2_frame_ment.png",
                 (562, 394),
             ),
             manager=MANAGER,
@@ -167,8 +163,8 @@ class ChooseMentorScreen(Screens):
 
         self.mentor_icon = pygame_gui.elements.UIImage(
             scale(pygame.Rect((630, 320), (343, 228))),
-            pygame.transform.scale(
-                image_cache.load_image("resources/images/mentor.png").convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/mentor.png",
                 (343, 228),
             ),
             manager=MANAGER,
@@ -227,8 +223,8 @@ class ChooseMentorScreen(Screens):
         # Add a vertical separator
         self.filter_seperator = pygame_gui.elements.UIImage(
             scale(pygame.Rect((995, 15), (20, 420))),
-            pygame.transform.scale(
-                image_cache.load_image("resources/images/vertical_bar.png"),
+            image_cache.load_scaled(
+                "resources/images/vertical_bar.png",
                 scale_dimentions((20, 420))
             ),
             container=self.filter_container
@@ -481,6 +477,11 @@ class ChooseMentorScreen(Screens):
             if self.the_cat.ID in new_mentor.former_apprentices:
                 new_mentor.former_apprentices.remove(self.the_cat.ID)
 
+        # is_potential_mate looks at who mentors whom
+        for changed_cat in (self.the_cat, old_mentor, new_mentor):
+            if changed_cat is not None:
+                changed_cat.mate_index_changed()
+
         if self.mentor is not None:
             self.current_mentor_text.set_text(
                 f"{self.the_cat.name}'s current mentor is {self.mentor.name}"
@@ -160,19 +160,19 @@ class ClanScreen(Screens):
         )
         self.elder_den_label = pygame_gui.elements.UIImage(
             scale(pygame.Rect(self.layout["elder den"], (206, 56))),
-            pygame.transform.scale(
-                image_cache.load_image('resources/images/elder_den.png'),
+            image_cache.load_scaled(
+                'resources/images/elder_den.png',
                 (206, 56)),
         )
         self.nursery_label = pygame_gui.elements.UIImage(scale(pygame.Rect(self.layout['nursery'], (160, 56))),
-                                                         pygame.transform.scale(
-                                                             image_cache.load_image('resources/images/nursery_den.png'),
+                                                         image_cache.load_scaled(
+                                                             'resources/images/nursery_den.png',
                                                              (160, 56)))
         if game.clan.game_mode == 'classic':
             self.clearing_label = pygame_gui.elements.UIImage(
                 scale(pygame.Rect(self.layout['clearing'], (162, 56))),
-                pygame.transform.scale(
-                    image_cache.load_image('resources/images/buttons/clearing.png'),
+                image_cache.load_scaled(
+                    'resources/images/buttons/clearing.png',
                     (162, 56)))
         else:
             self.clearing_label = UIImageButton(scale(pygame.Rect(
@@ -183,15 +183,14 @@ class ClanScreen(Screens):
             )
         self.app_den_label = pygame_gui.elements.UIImage(
             scale(pygame.Rect(self.layout['apprentice den'], (294, 56))),
-            pygame.transform.scale(
-                image_cache.load_image('resources/images/app_den.png'),
+            image_cache.load_scaled(
+                'resources/images/app_den.png',
                 (294, 56)))
 
         # Draw the toggle and text
         self.show_den_labels = pygame_gui.elements.UIImage(scale(pygame.Rect((50, 1282), (334, 68))),
-                                                           pygame.transform.scale(
-                                                               image_cache.load_image(
-                                                                   'resources/images/show_den_labels.png'),
+                                                           image_cache.load_scaled(
+                                                               'resources/images/show_den_labels.png',
                                                                (334, 68)))
         self.show_den_labels.disable()
         self.label_toggle = UIImageButton(scale(pygame.Rect((50, 1282), (64, 64))), "", object_id="#checked_checkbox")
@@ -200,14 +199,14 @@ class ClanScreen(Screens):
         self.save_button.enable()
         self.save_button_saved_state = pygame_gui.elements.UIImage(
             scale(pygame.Rect((686, 1286), (228, 60))),
-            pygame.transform.scale(
-                image_cache.load_image('resources/images/save_clan_saved.png'),
+            image_cache.load_scaled(
+                'resources/images/save_clan_saved.png',
                 (228, 60)))
         self.save_button_saved_state.hide()
         self.save_button_saving_state = pygame_gui.elements.UIImage(
             scale(pygame.Rect((686, 1286), (228, 60))),
-            pygame.transform.scale(
-                image_cache.load_image('resources/images/save_clan_saving.png'),
+            image_cache.load_scaled(
+                'resources/images/save_clan_saving.png',
                 (228, 60)))
         self.save_button_saving_state.hide()
 
@@ -273,14 +272,14 @@ class ClanScreen(Screens):
             platform_dir = f'{camp_bg_base_dir}/{biome}/{leaf}_{camp_nr}_{light_dark}.png'
             all_backgrounds.append(platform_dir)
 
-        self.newleaf_bg = pygame.transform.scale(
-            pygame.image.load(all_backgrounds[0]).convert(), (screen_x, screen_y))
-        self.greenleaf_bg = pygame.transform.scale(
-            pygame.image.load(all_backgrounds[1]).convert(), (screen_x, screen_y))
-        self.leafbare_bg = pygame.transform.scale(
-            pygame.image.load(all_backgrounds[2]).convert(), (screen_x, screen_y))
-        self.leaffall_bg = pygame.transform.scale(
-            pygame.image.load(all_backgrounds[3]).convert(), (screen_x, screen_y))
+        self.newleaf_bg = image_cache.load_scaled(
+            all_backgrounds[0], (screen_x, screen_y), alpha=False)
+        self.greenleaf_bg = image_cache.load_scaled(
+            all_backgrounds[1], (screen_x, screen_y), alpha=False)
+        self.leafbare_bg = image_cache.load_scaled(
+            all_backgrounds[2], (screen_x, screen_y), alpha=False)
+        self.leaffall_bg = image_cache.load_scaled(
+            all_backgrounds[3], (screen_x, screen_y), alpha=False)
 
     def choose_nonoverlapping_positions(self, first_choices, dens, weights=None):
         if not weights:
@@ -5,6 +5,7 @@ import ujson
 from scripts.cat.cats import Cat
 
 from ..events_module.condition_events import Condition_Events
+from scripts.game_structure import image_cache
 from scripts.game_structure.game_essentials import game, screen_x, screen_y, MANAGER
 from scripts.game_structure.ui_elements import (
     UISpriteButton,
@@ -279,7 +280,7 @@ class ClearingScreen(Screens):
         self.tactic_title.hide()
         self.cat_bg = pygame_gui.elements.UIImage(
             scale(pygame.Rect((280, 880), (1120, 400))),
-            pygame.image.load("resources/images/sick_hurt_bg.png").convert_alpha(),
+            image_cache.load_image("resources/images/sick_hurt_bg.png"),
             manager=MANAGER,
         )
         self.cat_bg.disable()
@@ -1,3 +1,6 @@
+import re
+from bisect import bisect_right
+
 import pygame
 import pygame_gui
 
@@ -10,7 +13,7 @@ from scripts.game_structure.ui_elements import UIImageButton, UIModifiedScrollin
 from scripts.game_structure.windows import GameOver
 from scripts.screens.Screens import Screens
 from scripts.utility import scale, clan_symbol_sprite, get_text_box_theme, shorten_text_to_fit, \
-    get_living_clan_cat_count
+    get_living_clan_cat_count, scale_dimentions
 
 
 class EventsScreen(Screens):
@@ -30,6 +33,10 @@ class EventsScreen(Screens):
     display_events = []
     tabs = ["all", "ceremony", "birth_death", "relationship", "health", "other_clans", "misc"]
 
+    # how far above and below the visible part of the event list rows are already made, so they are ready to be
+    # scrolled to
+    row_margin = 350
+
     def __init__(self, name):
         super().__init__(name)
 
@@ -44,7 +51,6 @@ class EventsScreen(Screens):
         self.alert = {}
 
         self.event_display = None
-        self.event_display_elements = {}
         self.cat_profile_buttons = {}
         self.involved_cat_container = None
         self.involved_cat_buttons = {}
@@ -52,6 +58,18 @@ class EventsScreen(Screens):
         # Stores the involved cat button that currently has its cat profile buttons open
         self.open_involved_cat_button = None
 
+        # Only the rows near the visible part of the event list have elements. Rows that are scrolled away give
+        # theirs to the rows that are scrolled to.
+        self.event_rows = []  # [event, y_pos, text height] for each row of the event list
+        self.row_positions = []  # y_pos of each row, to look rows up by scroll position
+        self.shown_rows = {}  # row index: {"text": ..., "shading": ..., "cat_button": ...}
+        self.spare_row_elements = {"text": [], "shading": [], "cat_button": []}
+        self.shown_scroll_offset = None
+
+        self.text_heights = {}  # event: height of its text box, once it has been shown
+        self.estimated_text_heights = {}  # event: height its text box is guessed to have
+        self.text_metrics = None
+
         self.first_opened = False
 
     def handle_event(self, event):
@@ -192,6 +210,10 @@ class EventsScreen(Screens):
         self.update_events_display()
 
     def screen_switches(self):
+        # the theme may have changed since the text was last measured
+        self.text_metrics = None
+        self.estimated_text_heights = {}
+
         # On first open, update display events list
         if not self.first_opened:
             self.first_opened = True
@@ -287,8 +309,8 @@ class EventsScreen(Screens):
             if event_type:
                 self.alert[f"{event_type}"] = pygame_gui.elements.UIImage(
                     scale(pygame.Rect((20, 48 + y_pos), (8, 44))),
-                    pygame.transform.scale(
-                        image_cache.load_image("resources/images/alert_mark.png"), (8, 44)
+                    image_cache.load_scaled(
+                        "resources/images/alert_mark.png", (8, 44)
                     ),
                     container=self.full_event_display_container,
                     object_id=f"alert_mark_{event_type}",
@@ -321,26 +343,32 @@ class EventsScreen(Screens):
             object_id="#event_display",
             starting_height=3,
             manager=MANAGER,
-            allow_scroll_y=True
+            allow_scroll_y=True,
+            should_grow_automatically=False
         )
 
+        # the old rows went with the old container
+        self.shown_rows = {}
+        self.spare_row_elements = {"text": [], "shading": [], "cat_button": []}
+        self.shown_scroll_offset = None
+        self.involved_cat_buttons = {}
+        self.cat_profile_buttons = {}
+        self.involved_cat_container = None
+        self.open_involved_cat_button = None
+
     def make_cat_buttons(self, button_pressed):
         """Makes the buttons that take you to the profile."""
 
         # Check if the button you pressed doesn't have its cat profile buttons currently displayed.
         # if it does, clear the cat profile buttons
         if self.open_involved_cat_button == button_pressed:
-            self.open_involved_cat_button = None
-            for ele in self.cat_profile_buttons:
-                self.cat_profile_buttons[ele].kill()
-            self.cat_profile_buttons = {}
+            self.close_cat_buttons()
             return
 
         # If it doesn't have its buttons displayed, set the current open involved_cat_button to the pressed button,
         # clear all other buttons, and open the cat profile buttons.
+        self.close_cat_buttons()
         self.open_involved_cat_button = button_pressed
-        if self.involved_cat_container:
-            self.involved_cat_container.kill()
 
         x_pos = 655
         if game.settings["fullscreen"]:
@@ -388,6 +416,16 @@ class EventsScreen(Screens):
         self.involved_cat_container.set_view_container_dimensions(
             (self.involved_cat_container.get_relative_rect()[2], self.event_display.get_relative_rect()[3]))
 
+    def close_cat_buttons(self):
+        """Removes the open cat profile buttons, if there are any."""
+        self.open_involved_cat_button = None
+        for ele in self.cat_profile_buttons:
+            self.cat_profile_buttons[ele].kill()
+        self.cat_profile_buttons = {}
+        if self.involved_cat_container:
+            self.involved_cat_container.kill()
+            self.involved_cat_container = None
+
     def exit_screen(self):
         self.event_display.kill()  # event display isn't put in the screen container due to lag issues
         self.event_screen_container.kill()
@@ -397,32 +435,18 @@ class EventsScreen(Screens):
         Categorize events from game.cur_events_list into display categories for screen
         """
 
-        self.all_events = [
-            x for x in game.cur_events_list if "interaction" not in x.types
-        ]
-        self.ceremony_events = [
-            x for x in game.cur_events_list if "ceremony" in x.types
-        ]
-        self.birth_death_events = [
-            x for x in game.cur_events_list if "birth_death" in x.types
-        ]
-        self.relation_events = [
-            x for x in game.cur_events_list if "relation" in x.types
-        ]
-        self.health_events = [
-            x for x in game.cur_events_list if "health" in x.types
-        ]
-        self.other_clans_events = [
-            x for x in game.cur_events_list if "other_clans" in x.types
-        ]
-        self.misc_events = [
-            x for x in game.cur_events_list if "misc" in x.types
-        ]
+        self.all_events = game.cur_events_list.get_events_without_type("interaction")
+        self.ceremony_events = game.cur_events_list.get_events_of_type("ceremony")
+        self.birth_death_events = game.cur_events_list.get_events_of_type("birth_death")
+        self.relation_events = game.cur_events_list.get_events_of_type("relation")
+        self.health_events = game.cur_events_list.get_events_of_type("health")
+        self.other_clans_events = game.cur_events_list.get_events_of_type("other_clans")
+        self.misc_events = game.cur_events_list.get_events_of_type("misc")
 
     def update_events_display(self):
         """
         Kills and recreates the event display, updates the clan info, sets the event display scroll position if it was
-        previously saved
+        previously saved. Only the rows near the visible part of the list are made, see update_shown_rows
         """
 
         # UPDATE CLAN INFO
@@ -433,33 +457,170 @@ class EventsScreen(Screens):
             self.clan_info["age"].set_text(f"Clan age: {game.clan.age} cycles")
 
         self.make_event_scrolling_container()
-
-        for ele in self.event_display_elements:
-            self.event_display_elements[ele].kill()
-        self.event_display_elements = {}
-
-        for ele in self.cat_profile_buttons:
-            self.cat_profile_buttons[ele].kill()
-        self.cat_profile_buttons = {}
-
-        for ele in self.involved_cat_buttons:
-            self.involved_cat_buttons[ele].kill()
-        self.involved_cat_buttons = {}
+        self.event_rows = []
+        self.row_positions = []
 
         # Stop if Clan is new, so that events from previously loaded Clan don't show up
         if game.clan.age == 0:
             return
 
         y_pos = 0
-
-        for i, event_object in enumerate(self.display_events):
+        for event_object in self.display_events:
             # checking that text is a string
             if not isinstance(event_object.text, str):
                 print(f"Incorrectly Formatted Event: {event_object.text}, {type(event_object)}")
                 continue
 
-            # TEXT BOX
-            self.event_display_elements[f"event{i}"] = pygame_gui.elements.UITextBox(
+            text_box_len = self.get_text_height(event_object)
+            self.event_rows.append([event_object, y_pos, text_box_len])
+            self.row_positions.append(y_pos)
+            y_pos += self.get_row_height(event_object, text_box_len)
+
+        # the rows aren't all there to grow the container, so it is given the height of the whole list
+        self.event_display.set_scrollable_area_dimensions(scale_dimentions((1028, y_pos)))
+
+        # this HAS TO UPDATE before saved scroll position can be set
+        self.event_display.scrollable_container.update(1)
+
+        # don't ask me why we have to redefine these dimensions, we just do
+        # otherwise the scroll position save will break
+        self.event_display.set_dimensions(
+            (self.event_display.get_relative_rect()[2], self.event_display.get_relative_rect()[3]))
+
+        # set saved scroll position
+        if game.switches["saved_scroll_positions"].get(self.current_display):
+            self.event_display.vert_scroll_bar.set_scroll_from_start_percentage(
+                game.switches["saved_scroll_positions"][self.current_display]
+            )
+            self.event_display.update(1)
+
+        self.update_shown_rows()
+
+    @staticmethod
+    def get_row_height(event_object, text_box_len):
+        """Returns the height of a row of the event list, from the height of its text box."""
+        if event_object.cats_involved:
+            return text_box_len + 125
+        return text_box_len + 45
+
+    def get_text_height(self, event_object):
+        """
+        Returns the height of the event's text box. Until the event has been shown, this is worked out from the
+        width of its words, which is usually right and is corrected once the row is made.
+        """
+        if event_object in self.text_heights:
+            return self.text_heights[event_object]
+        if event_object in self.estimated_text_heights:
+            return self.estimated_text_heights[event_object]
+
+        if not self.text_metrics:
+            self.text_metrics = self.get_text_metrics()
+        font, wrap_width, first_line_height, line_height = self.text_metrics
+
+        space_width = font.size(" ")[0]
+        lines = 0
+        for paragraph in re.split(r"<br\s*/?>|\n", event_object.text):
+            lines += 1
+            line_width = 0
+            for word in re.sub(r"<[^>]*>", "", paragraph).split():
+                word_width = font.size(word)[0]
+                if line_width and line_width + space_width + word_width > wrap_width:
+                    lines += 1
+                    line_width = word_width
+                elif line_width:
+                    line_width += space_width + word_width
+                else:
+                    line_width = word_width
+
+        text_box_len = first_line_height + line_height * (lines - 1)
+        if not game.settings["fullscreen"]:
+            text_box_len *= 2
+        self.estimated_text_heights[event_object] = text_box_len
+        return text_box_len
+
+    @staticmethod
+    def get_text_metrics():
+        """Measures the font and line heights of the event text boxes, to guess the height of events with."""
+        object_id = get_text_box_theme("#text_box_30_horizleft")
+        one_line = pygame_gui.elements.UITextBox(
+            "A", scale(pygame.Rect((0, 0), (1018, -1))), object_id=object_id, manager=MANAGER, visible=False
+        )
+        two_lines = pygame_gui.elements.UITextBox(
+            "A<br>A", scale(pygame.Rect((0, 0), (1018, -1))), object_id=object_id, manager=MANAGER, visible=False
+        )
+        first_line_height = one_line.get_relative_rect()[3]
+        line_height = two_lines.get_relative_rect()[3] - first_line_height
+        wrap_width = one_line.text_wrap_rect[2]
+        one_line.kill()
+        two_lines.kill()
+
+        return MANAGER.get_theme().get_font([object_id]), wrap_width, first_line_height, line_height
+
+    def update_shown_rows(self):
+        """
+        Makes the rows near the visible part of the event list, and frees up the elements of the rows that have been
+        scrolled away from. Does nothing if the list hasn't been scrolled since the last time.
+        """
+        scroll_offset = -self.event_display.scrollable_container.get_relative_rect()[1]
+        view_height = self.event_display.get_relative_rect()[3]
+        if not game.settings["fullscreen"]:
+            scroll_offset *= 2
+            view_height *= 2
+        if scroll_offset == self.shown_scroll_offset:
+            return
+
+        # rows can turn out to be a different height than guessed when they are made, which moves the rows below,
+        # so keep going until the rows that should be there are
+        while True:
+            top = scroll_offset - self.row_margin
+            bottom = scroll_offset + view_height + self.row_margin
+            wanted_rows = set()
+            index = max(bisect_right(self.row_positions, top) - 1, 0)
+            while index < len(self.event_rows) and self.event_rows[index][1] < bottom:
+                wanted_rows.add(index)
+                index += 1
+
+            for index in [i for i in self.shown_rows if i not in wanted_rows]:
+                self.free_row(index)
+
+            new_rows = sorted(wanted_rows.difference(self.shown_rows))
+            for index in new_rows:
+                y_pos = self.event_rows[index][1]
+                height_change = self.make_row(index)
+                if height_change:
+                    self.move_rows_below(index, height_change)
+                    if y_pos < scroll_offset:
+                        # a row above the visible part of the list changed height, so scroll along with it
+                        # to keep what is being looked at in place
+                        scroll_offset += height_change
+                        self.event_display.scrollable_container.set_relative_position(
+                            (0, -scroll_offset if game.settings["fullscreen"] else -scroll_offset // 2))
+
+            if not new_rows:
+                break
+
+            last_event, last_y_pos, last_text_box_len = self.event_rows[-1]
+            list_height = last_y_pos + self.get_row_height(last_event, last_text_box_len)
+            self.event_display.set_scrollable_area_dimensions(scale_dimentions((1028, list_height)))
+
+        self.shown_scroll_offset = scroll_offset
+
+    def make_row(self, index):
+        """
+        Gives a row of the event list its elements, using spare ones where there are some. Returns by how much the
+        row's text box turned out taller than guessed.
+        """
+        event_object, y_pos, text_box_len = self.event_rows[index]
+        row = {"text": None, "shading": None, "cat_button": None}
+
+        # TEXT BOX
+        if self.spare_row_elements["text"]:
+            row["text"] = self.spare_row_elements["text"].pop()
+            row["text"].set_text(event_object.text)
+            row["text"].set_relative_position(scale_dimentions((0, y_pos)))
+            row["text"].show()
+        else:
+            row["text"] = pygame_gui.elements.UITextBox(
                 event_object.text,
                 scale(pygame.Rect((0, y_pos), (1018, -1))),
                 object_id=get_text_box_theme("#text_box_30_horizleft"),
@@ -468,64 +629,94 @@ class EventsScreen(Screens):
                 manager=MANAGER
             )
 
-            if game.settings["fullscreen"]:
-                text_box_len = self.event_display_elements[f"event{i}"].get_relative_rect()[3]
+        if game.settings["fullscreen"]:
+            real_text_box_len = row["text"].get_relative_rect()[3]
+        else:
+            real_text_box_len = row["text"].get_relative_rect()[3] * 2
+        self.text_heights[event_object] = real_text_box_len
+        self.event_rows[index][2] = real_text_box_len
+        row_height = self.get_row_height(event_object, real_text_box_len)
+
+        # SHADING
+        if index % 2 == 0:
+            if self.spare_row_elements["shading"]:
+                row["shading"] = self.spare_row_elements["shading"].pop()
+                row["shading"].set_relative_position(scale_dimentions((0, y_pos)))
+                row["shading"].set_dimensions(scale_dimentions((1028, row_height)))
+                row["shading"].show()
             else:
-                text_box_len = self.event_display_elements[f"event{i}"].get_relative_rect()[3] * 2
-
-            # SHADING
-            if i % 2 == 0:
                 image_path = "resources/images/shading"
                 if game.settings["dark mode"]:
                     image_path += "_dark.png"
                 else:
                     image_path += ".png"
 
-                if event_object.cats_involved:
-                    y_len = text_box_len + 125
-                else:
-                    y_len = text_box_len + 45
-
-                self.event_display_elements[f"shading{i}"] = pygame_gui.elements.UIImage(
-                    scale(pygame.Rect((0, y_pos), (1028, y_len))),
+                row["shading"] = pygame_gui.elements.UIImage(
+                    scale(pygame.Rect((0, y_pos), (1028, row_height))),
                     image_cache.load_image(image_path),
                     starting_height=1,
-                    object_id=f"shading{i}",
+                    object_id="shading",
                     container=self.event_display,
                     manager=MANAGER
                 )
-                self.event_display_elements[f"shading{i}"].disable()
-
-            if event_object.cats_involved:
-                # INVOLVED CAT BUTTON
-                y_pos += text_box_len + 15
-
-                self.involved_cat_buttons[f"cat_button{i}"] = IDImageButton(
-                    scale(pygame.Rect((928, y_pos), (68, 68))),
+                row["shading"].disable()
+
+        # INVOLVED CAT BUTTON
+        if event_object.cats_involved:
+            button_y_pos = y_pos + real_text_box_len + 15
+            if self.spare_row_elements["cat_button"]:
+                row["cat_button"] = self.spare_row_elements["cat_button"].pop()
+                row["cat_button"].ids = event_object.cats_involved
+                row["cat_button"].set_relative_position(scale_dimentions((928, button_y_pos)))
+                row["cat_button"].show()
+            else:
+                row["cat_button"] = IDImageButton(
+                    scale(pygame.Rect((928, button_y_pos), (68, 68))),
                     ids=event_object.cats_involved,
                     layer_starting_height=3,
                     object_id="#events_cat_button",
                     container=self.event_display,
                     manager=MANAGER
                 )
-
-                y_pos += 110
-            else:
-                y_pos += text_box_len + 45
-
-        # this HAS TO UPDATE before saved scroll position can be set
-        self.event_display.scrollable_container.update(1)
-
-        # don't ask me why we have to redefine these dimensions, we just do
-        # otherwise the scroll position save will break
-        self.event_display.set_dimensions(
-            (self.event_display.get_relative_rect()[2], self.event_display.get_relative_rect()[3]))
-
-        # set saved scroll position
-        if game.switches["saved_scroll_positions"].get(self.current_display):
-            self.event_display.vert_scroll_bar.set_scroll_from_start_percentage(
-                game.switches["saved_scroll_positions"][self.current_display]
-            )
+            self.involved_cat_buttons[f"cat_button{index}"] = row["cat_button"]
+
+        self.shown_rows[index] = row
+        return real_text_box_len - text_box_len
+
+    def free_row(self, index):
+        """Hides the elements of a row of the event list and keeps them to be used for other rows."""
+        row = self.shown_rows.pop(index)
+        if row["cat_button"]:
+            if row["cat_button"] == self.open_involved_cat_button:
+                self.close_cat_buttons()
+            del self.involved_cat_buttons[f"cat_button{index}"]
+
+        for kind, element in row.items():
+            if element:
+                element.hide()
+                self.spare_row_elements[kind].append(element)
+
+    def move_rows_below(self, index, height_change):
+        """Moves the rows below the given row, after it changed height."""
+        for row_index in range(index + 1, len(self.event_rows)):
+            self.event_rows[row_index][1] += height_change
+            self.row_positions[row_index] += height_change
+
+            if row_index not in self.shown_rows:
+                continue
+            for kind, element in self.shown_rows[row_index].items():
+                if element:
+                    x_pos = 928 if kind == "cat_button" else 0
+                    y_pos = self.event_rows[row_index][1]
+                    if kind == "cat_button":
+                        y_pos += self.event_rows[row_index][2] + 15
+                    element.set_relative_position(scale_dimentions((x_pos, y_pos)))
+
+        # open cat profile buttons stay with their involved cat button
+        if self.involved_cat_container and self.open_involved_cat_button:
+            self.involved_cat_container.set_relative_position(
+                (self.involved_cat_container.get_relative_rect()[0],
+                 self.open_involved_cat_button.get_relative_rect()[1]))
 
     def update_list_buttons(self):
         """
@@ -538,12 +729,16 @@ class EventsScreen(Screens):
 
     def on_use(self):
         self.loading_screen_on_use(self.events_thread, self.timeskip_done)
-        pass
+
+        if self.event_rows:
+            self.update_shown_rows()
 
     def timeskip_done(self):
         """Various sorting and other tasks that must be done with the timeskip is over."""
 
         game.switches["saved_scroll_positions"] = {}
+        self.text_heights = {}
+        self.estimated_text_heights = {}
 
         if get_living_clan_cat_count(Cat) == 0:
             GameOver("events screen")
@@ -558,9 +753,8 @@ class EventsScreen(Screens):
                 self.event_buttons[tab].enable()
 
         if not self.all_events:
-            self.all_events.append(
-                Single_Event("Nothing interesting happened this cycle.")
-            )
+            # the event lists are shared with game.cur_events_list, so this one is made anew
+            self.all_events = [Single_Event("Nothing interesting happened this cycle.")]
 
         self.display_events = self.all_events
 
@@ -9,7 +9,125 @@ from scripts.utility import get_text_box_theme, scale, shorten_text_to_fit
 from .Screens import Screens
 
 
+class FamilyTreeLayout:
+    """
+    Everything the family tree of one cat is built from: the relation groups, the size of the tree and where the
+    cat sits in it. Working this out means going through the cat's whole inheritance, so it is kept until the
+    inheritance changes.
+    """
+
+    def __init__(self, the_cat):
+        inheritance = the_cat.inheritance
+        self.inheritance = inheritance
+        self.key = FamilyTreeLayout.get_key(the_cat)
+
+        self.parents = inheritance.get_parents()
+        self.mates = inheritance.get_mates()
+        self.kits = inheritance.get_children()
+        self.kits_mates = inheritance.get_kits_mates()
+        self.siblings = inheritance.get_siblings()
+        self.siblings_mates = inheritance.get_siblings_mates()
+        self.siblings_kits = inheritance.get_siblings_kits()
+        self.parents_siblings = inheritance.get_parents_siblings()
+        self.cousins = inheritance.get_cousins()
+        self.grandparents = inheritance.get_grandparents()
+        self.grandkits = inheritance.get_grand_kits()
+
+        # as the various groups are collected, the x_pos and y_pos are adjusted to account for the new buttons,
+        # these affect the positioning of all the buttons
+        self.x_pos = 0
+        self.y_pos = 0
+
+        # as the various groups are collected, the x_dim and y_dim are adjusted to account for the new button,
+        # these affect the size and positioning of the UIContainer holding the family tree
+        self.x_dim = 160
+        self.y_dim = 180
+
+        # collect grandparents
+        if self.parents:
+            self.y_dim += 196
+            self.y_pos += 196
+            if self.grandparents:
+                self.y_dim += 160
+                self.y_pos += 160
+
+            self.x_dim += 309
+            if self.siblings_mates:
+                self.x_dim += 417
+            if self.siblings_kits:
+                self.y_dim += 80
+                if not self.siblings_mates:
+                    self.x_dim += 417
+
+        # collect cousins
+        if self.parents_siblings:
+            if not self.siblings_mates and not self.siblings_kits:
+                self.x_dim += 433
+
+        # collect mates
+        if self.mates or self.kits:
+            self.x_pos += 276
+            self.x_dim += 280
+        # collect kits
+        if self.kits:
+            if not self.siblings_kits:
+                self.y_dim += 80
+            if self.kits_mates:
+                self.x_pos += 202
+                self.x_dim += 202
+            if self.grandkits:
+                self.y_dim += 140
+                if not self.kits_mates:
+                    self.x_pos += 202
+                    self.x_dim += 202
+
+        self._relation_texts = {}
+
+    @staticmethod
+    def get_key(the_cat):
+        """The parents are read from the cat itself rather than from the inheritance, so they are part of the key."""
+        return (
+            the_cat.inheritance.version,
+            the_cat.parent1,
+            the_cat.parent2,
+            tuple(the_cat.adoptive_parents),
+        )
+
+    def is_current(self, the_cat) -> bool:
+        return self.inheritance is the_cat.inheritance and self.key == FamilyTreeLayout.get_key(the_cat)
+
+    def get_relation_text(self, cat_id) -> str:
+        """Returns the relation types and additional info shown below a relative's name in their tooltip.
+        Only worked out for the relatives that are actually shown."""
+        if cat_id in self._relation_texts:
+            return self._relation_texts[cat_id]
+
+        info_text = ""
+        additional_info = self.inheritance.get_cat_info(cat_id)
+        if len(additional_info["type"]) > 0:  # types is always real
+            rel_types = [
+                str(rel_type.value) for rel_type in additional_info["type"]
+            ]
+            rel_types = set(rel_types)  # remove duplicates
+            if "" in rel_types:
+                rel_types.remove("")  # removes empty
+            if len(rel_types) > 0:
+                info_text += "\n"
+                info_text += ", ".join(rel_types)
+            if len(additional_info["additional"]) > 0:
+                add_info = set(additional_info["additional"])  # remove duplicates
+                info_text += "\n"
+                info_text += ", ".join(add_info)
+
+        self._relation_texts[cat_id] = info_text
+        return info_text
+
+
 class FamilyTreeScreen(Screens):
+    # cat ID: FamilyTreeLayout, so going back and forth between cats doesn't work out their trees again
+    layouts = {}
+    max_layouts = 50
+
     # Page numbers for siblings and offspring
 
     def __init__(self, name=None):
@@ -49,6 +167,7 @@ class FamilyTreeScreen(Screens):
         self.next_cat_button = None
         self.previous_cat_button = None
         self.the_cat = None
+        self.layout = None
 
         self.grandparents = []
         self.parents = []
@@ -210,12 +329,7 @@ class FamilyTreeScreen(Screens):
         self.next_group_page.disable()
         self.relation_backdrop = pygame_gui.elements.UIImage(
             scale(pygame.Rect((628, 950), (841, 342))),
-            pygame.transform.scale(
-                image_cache.load_image(
-                    "resources/images/familytree_relationbackdrop.png"
-                ).convert_alpha(),
-                (841, 342),
-            ),
+            image_cache.load_scaled("resources/images/familytree_relationbackdrop.png", (841, 342)),
             manager=MANAGER,
         )
         self.relation_backdrop.disable()
@@ -224,12 +338,7 @@ class FamilyTreeScreen(Screens):
             game.switches["root_cat"] = Cat.all_cats[game.switches["cat"]]
         self.root_cat_frame = pygame_gui.elements.UIImage(
             scale(pygame.Rect((129, 950), (452, 340))),
-            pygame.transform.scale(
-                image_cache.load_image(
-                    "resources/images/familytree_bigcatbox.png"
-                ).convert_alpha(),
-                (452, 340),
-            ),
+            image_cache.load_scaled("resources/images/familytree_bigcatbox.png", (452, 340)),
             manager=MANAGER,
         )
         self.cat_elements["root_cat_image"] = UISpriteButton(
@@ -244,12 +353,7 @@ class FamilyTreeScreen(Screens):
 
         self.center_cat_frame = pygame_gui.elements.UIImage(
             scale(pygame.Rect((0, 0), (160, 180))),
-            pygame.transform.scale(
-                image_cache.load_image(
-                    "resources/images/familytree_smallcatbox.png"
-                ).convert_alpha(),
-                (160, 180),
-            ),
+            image_cache.load_scaled("resources/images/familytree_smallcatbox.png", (160, 180)),
             manager=MANAGER,
             container=self.family_tree,
         )
@@ -275,69 +379,35 @@ class FamilyTreeScreen(Screens):
             manager=MANAGER,
         )
 
-        # will need these later to adjust positioning
-        # as the various groups are collected, the x_pos and y_pos are adjusted to account for the new buttons,
-        # these affect the positioning of all the buttons
-        x_pos = 0
-        y_pos = 0
-
-        # as the various groups are collected, the x_dim and y_dim are adjusted to account for the new button,
-        # these affect the size and positioning of the UIContainer holding the family tree
-        x_dim = 160
-        y_dim = 180
-
         if not self.the_cat.inheritance:
             self.the_cat.create_inheritance_new_cat()
 
-        self.parents = self.the_cat.inheritance.get_parents()
-        self.mates = self.the_cat.inheritance.get_mates()
-        self.kits = self.the_cat.inheritance.get_children()
-        self.kits_mates = self.the_cat.inheritance.get_kits_mates()
-        self.siblings = self.the_cat.inheritance.get_siblings()
-        self.siblings_mates = self.the_cat.inheritance.get_siblings_mates()
-        self.siblings_kits = self.the_cat.inheritance.get_siblings_kits()
-        self.parents_siblings = self.the_cat.inheritance.get_parents_siblings()
-        self.cousins = self.the_cat.inheritance.get_cousins()
-        self.grandparents = self.the_cat.inheritance.get_grandparents()
-        self.grandkits = self.the_cat.inheritance.get_grand_kits()
-
-        # collect grandparents
-        if self.parents:
-            y_dim += 196
-            y_pos += 196
-            if self.grandparents:
-                y_dim += 160
-                y_pos += 160
-
-            x_dim += 309
-            if self.siblings_mates:
-                x_dim += 417
-            if self.siblings_kits:
-                y_dim += 80
-                if not self.siblings_mates:
-                    x_dim += 417
-
-        # collect cousins
-        if self.parents_siblings:
-            if not self.siblings_mates and not self.siblings_kits:
-                x_dim += 433
-
-        # collect mates
-        if self.mates or self.kits:
-            x_pos += 276
-            x_dim += 280
-        # collect kits
-        if self.kits:
-            if not self.siblings_kits:
-                y_dim += 80
-            if self.kits_mates:
-                x_pos += 202
-                x_dim += 202
-            if self.grandkits:
-                y_dim += 140
-                if not self.kits_mates:
-                    x_pos += 202
-                    x_dim += 202
+        layout = FamilyTreeScreen.layouts.get(self.the_cat.ID)
+        if layout is None or not layout.is_current(self.the_cat):
+            layout = FamilyTreeLayout(self.the_cat)
+            FamilyTreeScreen.layouts.pop(self.the_cat.ID, None)
+            if len(FamilyTreeScreen.layouts) >= FamilyTreeScreen.max_layouts:
+                # dicts keep insertion order, so this is the layout that was made the longest ago
+                del FamilyTreeScreen.layouts[next(iter(FamilyTreeScreen.layouts))]
+            FamilyTreeScreen.layouts[self.the_cat.ID] = layout
+        self.layout = layout
+
+        self.parents = layout.parents
+        self.mates = layout.mates
+        self.kits = layout.kits
+        self.kits_mates = layout.kits_mates
+        self.siblings = layout.siblings
+        self.siblings_mates = layout.siblings_mates
+        self.siblings_kits = layout.siblings_kits
+        self.parents_siblings = layout.parents_siblings
+        self.cousins = layout.cousins
+        self.grandparents = layout.grandparents
+        self.grandkits = layout.grandkits
+
+        x_pos = layout.x_pos
+        y_pos = layout.y_pos
+        x_dim = layout.x_dim
+        y_dim = layout.y_dim
 
         self.family_tree.kill()
         self.family_tree = pygame_gui.core.UIContainer(
@@ -362,12 +432,7 @@ class FamilyTreeScreen(Screens):
         )
         self.center_cat_frame = pygame_gui.elements.UIImage(
             scale(pygame.Rect((x_pos, y_pos), (160, 180))),
-            pygame.transform.scale(
-                image_cache.load_image(
-                    "resources/images/familytree_smallcatbox.png"
-                ).convert_alpha(),
-                (160, 180),
-            ),
+            image_cache.load_scaled("resources/images/familytree_smallcatbox.png", (160, 180)),
             manager=MANAGER,
             container=self.family_tree,
         )
@@ -510,22 +575,8 @@ class FamilyTreeScreen(Screens):
         i = 0
         for kitty in display_cats:
             _kitty = Cat.fetch_cat(kitty)
-            info_text = f"{str(_kitty.name)}"
-            additional_info = self.the_cat.inheritance.get_cat_info(kitty)
-            if len(additional_info["type"]) > 0:  # types is always real
-                rel_types = [
-                    str(rel_type.value) for rel_type in additional_info["type"]
-                ]
-                rel_types = set(rel_types)  # remove duplicates
-                if "" in rel_types:
-                    rel_types.remove("")  # removes empty
-                if len(rel_types) > 0:
-                    info_text += "\n"
-                    info_text += ", ".join(rel_types)
-                if len(additional_info["additional"]) > 0:
-                    add_info = set(additional_info["additional"])  # remove duplicates
-                    info_text += "\n"
-                    info_text += ", ".join(add_info)
+            # names can change without the inheritance changing, so only the relation part is kept
+            info_text = f"{str(_kitty.name)}" + self.layout.get_relation_text(kitty)
 
             self.relation_elements["cat" + str(i)] = UISpriteButton(
                 scale(pygame.Rect((649 + pos_x, 970 + pos_y), (100, 100))),
@@ -564,122 +615,67 @@ class FamilyTreeScreen(Screens):
         if self.current_group_name == "grandparents":
             self.tabs["grandparents_tab"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((1164, 890), (256, 60))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/grandparents_tab.png"
-                    ).convert_alpha(),
-                    (256, 60),
-                ),
+                image_cache.load_scaled("resources/images/grandparents_tab.png", (256, 60)),
                 manager=MANAGER,
             )
         elif self.current_group_name == "parents":
             self.tabs["parents_tab"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((1246, 890), (174, 60))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/parents_tab.png"
-                    ).convert_alpha(),
-                    (174, 60),
-                ),
+                image_cache.load_scaled("resources/images/parents_tab.png", (174, 60)),
                 manager=MANAGER,
             )
         elif self.current_group_name == "parents_siblings":
             self.tabs["parents_siblings_tab"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((1123, 890), (296, 60))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/parentsibling_tab.png"
-                    ).convert_alpha(),
-                    (296, 60),
-                ),
+                image_cache.load_scaled("resources/images/parentsibling_tab.png", (296, 60)),
                 manager=MANAGER,
             )
         elif self.current_group_name == "cousins":
             self.tabs["cousins_tab"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((1254, 890), (166, 60))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/cousins_tab.png"
-                    ).convert_alpha(),
-                    (166, 60),
-                ),
+                image_cache.load_scaled("resources/images/cousins_tab.png", (166, 60)),
                 manager=MANAGER,
             )
         elif self.current_group_name == "siblings":
             self.tabs["siblings_tab"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((1256, 890), (164, 60))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/siblings_tab.png"
-                    ).convert_alpha(),
-                    (164, 60),
-                ),
+                image_cache.load_scaled("resources/images/siblings_tab.png", (164, 60)),
                 manager=MANAGER,
             )
         elif self.current_group_name == "siblings_mates":
             self.tabs["siblings_mates_tab"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((1146, 890), (274, 60))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/siblingsmate_tab.png"
-                    ).convert_alpha(),
-                    (274, 60),
-                ),
+                image_cache.load_scaled("resources/images/siblingsmate_tab.png", (274, 60)),
                 manager=MANAGER,
             )
         elif self.current_group_name == "siblings_kits":
             self.tabs["siblings_kits_tab"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((1170, 890), (250, 60))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/siblingkits_tab.png"
-                    ).convert_alpha(),
-                    (250, 60),
-                ),
+                image_cache.load_scaled("resources/images/siblingkits_tab.png", (250, 60)),
                 manager=MANAGER,
             )
         elif self.current_group_name == "mates":
             self.tabs["mates_tab"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((1270, 890), (150, 60))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/mates_tab.png"
-                    ).convert_alpha(),
-                    (150, 60),
-                ),
+                image_cache.load_scaled("resources/images/mates_tab.png", (150, 60)),
                 manager=MANAGER,
             )
         elif self.current_group_name == "kits":
             self.tabs["kits_tab"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((1306, 890), (114, 60))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/kits_tab.png"
-                    ).convert_alpha(),
-                    (114, 60),
-                ),
+                image_cache.load_scaled("resources/images/kits_tab.png", (114, 60)),
                 manager=MANAGER,
             )
         elif self.current_group_name == "kits_mates":
             self.tabs["kits_mates_tab"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((1196, 890), (224, 60))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/kitsmate_tab.png"
-                    ).convert_alpha(),
-                    (224, 60),
-                ),
+                image_cache.load_scaled("resources/images/kitsmate_tab.png", (224, 60)),
                 manager=MANAGER,
             )
         elif self.current_group_name == "grandkits":
             self.tabs["grandkits_tab"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((1220, 890), (200, 60))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/grandkits_tab.png"
-                    ).convert_alpha(),
-                    (200, 60),
-                ),
+                image_cache.load_scaled("resources/images/grandkits_tab.png", (200, 60)),
                 manager=MANAGER,
             )
 
@@ -5,6 +5,7 @@ import pygame_gui
 
 from scripts.cat.cats import Cat
 from scripts.clan import OtherClan
+from scripts.game_structure import image_cache
 from scripts.game_structure.game_essentials import game, MANAGER
 from scripts.game_structure.ui_elements import UIImageButton, UISpriteButton
 from scripts.screens.Screens import Screens
@@ -149,9 +150,9 @@ class LeaderDenScreen(Screens):
         try:
             self.screen_elements["bg_image"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((0, 0), (1400, 900))),
-                pygame.image.load(
+                image_cache.load_image(
                     f"resources/images/lead_den_bg/{game.clan.biome.lower()}/{game.clan.camp_bg.lower()}.png"
-                ).convert_alpha(),
+                ),
                 object_id="#lead_den_bg",
                 starting_height=1,
                 manager=MANAGER,
@@ -159,9 +160,9 @@ class LeaderDenScreen(Screens):
         except FileNotFoundError:
             self.screen_elements["bg_image"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((0, 0), (1400, 900))),
-                pygame.image.load(
+                image_cache.load_image(
                     f"resources/images/lead_den_bg/{game.clan.biome.lower()}/camp1.png"
-                ).convert_alpha(),
+                ),
                 object_id="#lead_den_bg",
                 starting_height=1,
                 manager=MANAGER,
@@ -336,9 +337,9 @@ class LeaderDenScreen(Screens):
         )
         self.focus_frame_elements["frame"] = pygame_gui.elements.UIImage(
             scale(pygame.Rect((0, 63), (480, 728))),
-            pygame.image.load(
+            image_cache.load_image(
                 "resources/images/lead_den_focus_frame.png"
-            ).convert_alpha(),
+            ),
             object_id="#lead_den_focus_frame",
             container=self.focus_frame_container,
             starting_height=1,
@@ -378,9 +379,9 @@ class LeaderDenScreen(Screens):
         )
         self.other_clan_selection_elements["frame"] = pygame_gui.elements.UIImage(
             scale(pygame.Rect((0, 0), (1324, 388))),
-            pygame.image.load(
+            image_cache.load_image(
                 "resources/images/lead_den_clan_frame.png"
-            ).convert_alpha(),
+            ),
             object_id="#lead_den_clan_frame",
             container=self.other_clan_selection_container,
             starting_height=1,
@@ -464,9 +465,9 @@ class LeaderDenScreen(Screens):
         )
         self.outsider_selection_elements["frame"] = pygame_gui.elements.UIImage(
             scale(pygame.Rect((56, 0), (1248, 348))),
-            pygame.image.load(
+            image_cache.load_image(
                 "resources/images/lead_den_outsider_frame.png"
-            ).convert_alpha(),
+            ),
             object_id="#lead_den_outsider_frame",
             container=self.outsider_selection_container,
             starting_height=2,
@@ -4,6 +4,7 @@ import pygame
 import pygame_gui
 
 from scripts.cat.cats import Cat
+from scripts.game_structure import image_cache
 from scripts.game_structure.game_essentials import game, MANAGER, screen
 from scripts.game_structure.ui_elements import (
     UIImageButton,
@@ -260,7 +261,7 @@ class ListScreen(Screens):
         # SEARCH BAR
         self.cat_list_bar_elements["search_bar_image"] = pygame_gui.elements.UIImage(
             scale(pygame.Rect((72, 0), (276, 68))),
-            pygame.image.load("resources/images/search_bar.png").convert_alpha(),
+            image_cache.load_image("resources/images/search_bar.png"),
             container=self.cat_list_bar,
             object_id="#search_bar",
             manager=MANAGER,
@@ -431,8 +432,8 @@ class ListScreen(Screens):
         # BG IMAGES
         self.sc_bg = pygame_gui.elements.UIImage(
             scale(pygame.Rect((0, 0), (1600, 1400))),
-            pygame.transform.scale(
-                pygame.image.load("resources/images/starclanbg.png").convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/starclanbg.png",
                 (1600, 1400),
             ),
             container=self.list_screen_container,
@@ -443,9 +444,9 @@ class ListScreen(Screens):
         )
         self.ur_bg = pygame_gui.elements.UIImage(
             scale(pygame.Rect((0, 0), (1600, 1400))),
-            pygame.transform.scale(
-                pygame.image.load("resources/images/urbg.png").convert(),
-                (1600, 1400),
+            image_cache.load_scaled(
+                "resources/images/urbg.png",
+                (1600, 1400), alpha=False,
             ),
             container=self.list_screen_container,
             starting_height=1,
@@ -455,8 +456,8 @@ class ListScreen(Screens):
         )
         self.df_bg = pygame_gui.elements.UIImage(
             scale(pygame.Rect((0, 0), (1600, 1400))),
-            pygame.transform.scale(
-                pygame.image.load("resources/images/darkforestbg.png").convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/darkforestbg.png",
                 (1600, 1400),
             ),
             container=self.list_screen_container,
@@ -6,7 +6,7 @@ import pygame_gui
 
 from scripts.utility import get_text_box_theme, scale
 from scripts.clan import Clan
-from scripts.cat.cats import create_example_cats, create_cat, Cat
+from scripts.cat.cats import create_example_cats, example_cat_pool, Cat
 from scripts.cat.names import names
 from scripts.clan import Clan
 from scripts.game_structure import image_cache
@@ -27,44 +27,32 @@ from ..game_structure.windows import SymbolFilterWindow
 
 class MakeClanScreen(Screens):
     # UI images
-    clan_frame_img = pygame.transform.scale(
-        pygame.image.load(
-            "resources/images/pick_clan_screen/clan_name_frame.png"
-        ).convert_alpha(),
+    clan_frame_img = image_cache.load_scaled(
+        "resources/images/pick_clan_screen/clan_name_frame.png",
         (432, 100),
     )
-    name_clan_img = pygame.transform.scale(
-        pygame.image.load(
-            "resources/images/pick_clan_screen/name_clan_light.png"
-        ).convert_alpha(),
+    name_clan_img = image_cache.load_scaled(
+        "resources/images/pick_clan_screen/name_clan_light.png",
         (1600, 1400),
     )
-    leader_img = pygame.transform.scale(
-        pygame.image.load(
-            "resources/images/pick_clan_screen/leader_light.png"
-        ).convert_alpha(),
+    leader_img = image_cache.load_scaled(
+        "resources/images/pick_clan_screen/leader_light.png",
         (1600, 1400),
     )
-    deputy_img = pygame.transform.scale(
-        pygame.image.load(
-            "resources/images/pick_clan_screen/deputy_light.png"
-        ).convert_alpha(),
+    deputy_img = image_cache.load_scaled(
+        "resources/images/pick_clan_screen/deputy_light.png",
         (1600, 1400),
     )
-    medic_img = pygame.transform.scale(
-        pygame.image.load(
-            "resources/images/pick_clan_screen/med_light.png"
-        ).convert_alpha(),
+    medic_img = image_cache.load_scaled(
+        "resources/images/pick_clan_screen/med_light.png",
         (1600, 1400),
     )
-    clan_img = pygame.transform.scale(
-        pygame.image.load(
-            "resources/images/pick_clan_screen/clan_light.png"
-        ).convert_alpha(),
+    clan_img = image_cache.load_scaled(
+        "resources/images/pick_clan_screen/clan_light.png",
         (1600, 1400),
     )
-    bg_preview_border = pygame.transform.scale(
-        pygame.image.load("resources/images/bg_preview_border.png").convert_alpha(),
+    bg_preview_border = image_cache.load_scaled(
+        "resources/images/bg_preview_border.png",
         (466, 416),
     )
 
@@ -674,50 +662,40 @@ class MakeClanScreen(Screens):
         elif self.sub_screen == "choose members":
             if len(self.members) == 0:
                 self.elements["background"].set_image(
-                    pygame.transform.scale(
-                        pygame.image.load(
-                            "resources/images/pick_clan_screen/clan_none_light.png"
-                        ).convert_alpha(),
+                    image_cache.load_scaled(
+                        "resources/images/pick_clan_screen/clan_none_light.png",
                         (1600, 1400),
                     )
                 )
                 self.elements["next_step"].disable()
             elif len(self.members) == 1:
                 self.elements["background"].set_image(
-                    pygame.transform.scale(
-                        pygame.image.load(
-                            "resources/images/pick_clan_screen/clan_one_light.png"
-                        ).convert_alpha(),
+                    image_cache.load_scaled(
+                        "resources/images/pick_clan_screen/clan_one_light.png",
                         (1600, 1400),
                     )
                 )
                 self.elements["next_step"].disable()
             elif len(self.members) == 2:
                 self.elements["background"].set_image(
-                    pygame.transform.scale(
-                        pygame.image.load(
-                            "resources/images/pick_clan_screen/clan_two_light.png"
-                        ).convert_alpha(),
+                    image_cache.load_scaled(
+                        "resources/images/pick_clan_screen/clan_two_light.png",
                         (1600, 1400),
                     )
                 )
                 self.elements["next_step"].disable()
             elif len(self.members) == 3:
                 self.elements["background"].set_image(
-                    pygame.transform.scale(
-                        pygame.image.load(
-                            "resources/images/pick_clan_screen/clan_three_light.png"
-                        ).convert_alpha(),
+                    image_cache.load_scaled(
+                        "resources/images/pick_clan_screen/clan_three_light.png",
                         (1600, 1400),
                     )
                 )
                 self.elements["next_step"].disable()
             elif 4 <= len(self.members) <= 6:
                 self.elements["background"].set_image(
-                    pygame.transform.scale(
-                        pygame.image.load(
-                            "resources/images/pick_clan_screen/clan_four_light.png"
-                        ).convert_alpha(),
+                    image_cache.load_scaled(
+                        "resources/images/pick_clan_screen/clan_four_light.png",
                         (1600, 1400),
                     )
                 )
@@ -727,10 +705,8 @@ class MakeClanScreen(Screens):
                 self.elements["select_cat"].enable()
             elif len(self.members) == 7:
                 self.elements["background"].set_image(
-                    pygame.transform.scale(
-                        pygame.image.load(
-                            "resources/images/pick_clan_screen/clan_full_light.png"
-                        ).convert_alpha(),
+                    image_cache.load_scaled(
+                        "resources/images/pick_clan_screen/clan_full_light.png",
                         (1600, 1400),
                     )
                 )
@@ -1002,10 +978,8 @@ class MakeClanScreen(Screens):
         if self.biome_selected:
             self.elements["camp_art"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((350, 340), (900, 800))),
-                pygame.transform.scale(
-                    pygame.image.load(
-                        self.get_camp_art_path(self.selected_camp_tab)
-                    ).convert_alpha(),
+                image_cache.load_scaled(
+                    self.get_camp_art_path(self.selected_camp_tab),
                     (900, 800),
                 ),
                 manager=MANAGER,
@@ -1013,10 +987,8 @@ class MakeClanScreen(Screens):
             self.elements["art_frame"].kill()
             self.elements["art_frame"] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect(((334, 324), (932, 832)))),
-                pygame.transform.scale(
-                    pygame.image.load(
-                        "resources/images/bg_preview_border.png"
-                    ).convert_alpha(),
+                image_cache.load_scaled(
+                    "resources/images/bg_preview_border.png",
                     (932, 832),
                 ),
                 manager=MANAGER,
@@ -1203,12 +1175,12 @@ class MakeClanScreen(Screens):
             self.symbol_selected = f"symbol{self.clan_name.upper()}0"
         else:
             self.symbol_selected = choice(sprites.clan_symbols)
-        self.leader = create_cat(status='warrior')
-        self.deputy = create_cat(status='warrior')
-        self.med_cat = create_cat(status='warrior')
+        self.leader = example_cat_pool.take('warrior')
+        self.deputy = example_cat_pool.take('warrior')
+        self.med_cat = example_cat_pool.take('warrior')
         for _ in range(randrange(4, 8)):
             random_status = choice(['kitten', 'apprentice', 'warrior', 'warrior', 'elder'])
-            self.members.append(create_cat(status=random_status))
+            self.members.append(example_cat_pool.take(random_status))
 
     def random_clan_name(self):
         clan_names = names.names_dict["normal_prefixes"] + names.names_dict["clan_prefixes"]
@@ -1240,13 +1212,13 @@ class MakeClanScreen(Screens):
         self.clear_all_page()
         self.sub_screen = "game mode"
 
-        text_box = image_cache.load_image(
-            "resources/images/game_mode_text_box.png"
-        ).convert_alpha()
+        text_box = image_cache.load_scaled(
+            "resources/images/game_mode_text_box.png", (798, 922)
+        )
 
         self.elements["game_mode_background"] = pygame_gui.elements.UIImage(
             scale(pygame.Rect((650, 260), (798, 922))),
-            pygame.transform.scale(text_box, (798, 922)),
+            text_box,
             manager=MANAGER,
         )
         self.elements["permi_warning"] = pygame_gui.elements.UITextBox(
@@ -1640,10 +1612,8 @@ class MakeClanScreen(Screens):
 
         self.elements["background"] = pygame_gui.elements.UIImage(
             scale(pygame.Rect((0, 828), (1600, 572))),
-            pygame.transform.scale(
-                pygame.image.load(
-                    "resources/images/pick_clan_screen/clan_none_light.png"
-                ).convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/pick_clan_screen/clan_none_light.png",
                 (1600, 1400),
             ),
             manager=MANAGER,
@@ -1810,10 +1780,8 @@ class MakeClanScreen(Screens):
         # art frame
         self.elements["art_frame"] = pygame_gui.elements.UIImage(
             scale(pygame.Rect(((334, 324), (932, 832)))),
-            pygame.transform.scale(
-                pygame.image.load(
-                    "resources/images/bg_preview_border.png"
-                ).convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/bg_preview_border.png",
                 (932, 832),
             ),
             manager=MANAGER,
@@ -1897,9 +1865,9 @@ class MakeClanScreen(Screens):
 
         self.elements["symbol_frame"] = pygame_gui.elements.UIImage(
             scale(pygame.Rect((1081, 181), (338, 332))),
-            pygame.image.load(
+            image_cache.load_image(
                 f"resources/images/symbol_choice_frame.png"
-            ).convert_alpha(),
+            ),
             object_id="#symbol_choice_frame",
             starting_height=1,
             manager=MANAGER,
@@ -1928,9 +1896,9 @@ class MakeClanScreen(Screens):
         )
         self.elements["symbol_list_frame"] = pygame_gui.elements.UIImage(
             scale(pygame.Rect((152, 500), (1300, 740))),
-            pygame.image.load(
+            image_cache.load_image(
                 f"resources/images/symbol_list_frame.png"
-            ).convert_alpha(),
+            ),
             object_id="#symbol_list_frame",
             starting_height=2,
             manager=MANAGER,
@@ -3,6 +3,7 @@ import pygame_gui
 
 from scripts.cat.cats import Cat
 
+from scripts.game_structure import image_cache
 from scripts.game_structure.game_essentials import game, MANAGER
 from scripts.game_structure.ui_elements import (
     UISpriteButton,
@@ -171,7 +172,7 @@ class MedDenScreen(Screens):
             self.log_title.hide()
             self.cat_bg = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((280, 880), (1120, 400))),
-                pygame.image.load("resources/images/sick_hurt_bg.png").convert_alpha(),
+                image_cache.load_image("resources/images/sick_hurt_bg.png"),
                 manager=MANAGER,
             )
             self.cat_bg.disable()
@@ -604,10 +605,8 @@ class MedDenScreen(Screens):
             if herb == "cobwebs":
                 self.herbs["cobweb1"] = pygame_gui.elements.UIImage(
                     scale(pygame.Rect((216, 190), (792, 448))),
-                    pygame.transform.scale(
-                        pygame.image.load(
-                            "resources/images/med_cat_den/cobweb1.png"
-                        ).convert_alpha(),
+                    image_cache.load_scaled(
+                        "resources/images/med_cat_den/cobweb1.png",
                         (792, 448),
                     ),
                     manager=MANAGER,
@@ -615,10 +614,8 @@ class MedDenScreen(Screens):
                 if herbs["cobwebs"] > 1:
                     self.herbs["cobweb2"] = pygame_gui.elements.UIImage(
                         scale(pygame.Rect((216, 190), (792, 448))),
-                        pygame.transform.scale(
-                            pygame.image.load(
-                                "resources/images/med_cat_den/cobweb2.png"
-                            ).convert_alpha(),
+                        image_cache.load_scaled(
+                            "resources/images/med_cat_den/cobweb2.png",
                             (792, 448),
                         ),
                         manager=MANAGER,
@@ -626,10 +623,8 @@ class MedDenScreen(Screens):
                 continue
             self.herbs[herb] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((216, 190), (792, 448))),
-                pygame.transform.scale(
-                    pygame.image.load(
-                        f"resources/images/med_cat_den/{herb}.png"
-                    ).convert_alpha(),
+                image_cache.load_scaled(
+                    f"resources/images/med_cat_den/{herb}.png",
                     (792, 448),
                 ),
                 manager=MANAGER,
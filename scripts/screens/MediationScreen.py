@@ -139,16 +139,16 @@ class MediationScreen(Screens):
 
         self.selected_frame_1 = pygame_gui.elements.UIImage(
             scale(pygame.Rect((100, 160), (400, 700))),
-            pygame.transform.scale(
-                image_cache.load_image("resources/images/mediator_selected_frame.png"),
+            image_cache.load_scaled(
+                "resources/images/mediator_selected_frame.png",
                 (400, 700),
             ),
         )
         self.selected_frame_1.disable()
         self.selected_frame_2 = pygame_gui.elements.UIImage(
             scale(pygame.Rect((1100, 160), (400, 700))),
-            pygame.transform.scale(
-                image_cache.load_image("resources/images/mediator_selected_frame.png"),
+            image_cache.load_scaled(
+                "resources/images/mediator_selected_frame.png",
                 (400, 700),
             ),
         )
@@ -156,10 +156,8 @@ class MediationScreen(Screens):
 
         self.cat_bg = pygame_gui.elements.UIImage(
             scale(pygame.Rect((100, 940), (1400, 300))),
-            pygame.transform.scale(
-                pygame.image.load(
-                    "resources/images/mediation_selection_bg.png"
-                ).convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/mediation_selection_bg.png",
                 (1400, 300),
             ),
         )
@@ -245,7 +243,7 @@ class MediationScreen(Screens):
 
         self.search_bar_image = pygame_gui.elements.UIImage(
             scale(pygame.Rect((110, 1250), (236, 68))),
-            pygame.image.load("resources/images/search_bar.png").convert_alpha(),
+            image_cache.load_image("resources/images/search_bar.png"),
             manager=MANAGER,
         )
         self.search_bar = pygame_gui.elements.UITextEntryLine(
@@ -376,10 +374,8 @@ class MediationScreen(Screens):
         if chunked_cats:
             for cat in chunked_cats[self.page - 1]:
                 if game.clan.clan_settings["show fav"] and cat.favourite:
-                    _temp = pygame.transform.scale(
-                        pygame.image.load(
-                            f"resources/images/fav_marker.png"
-                        ).convert_alpha(),
+                    _temp = image_cache.load_scaled(
+                        f"resources/images/fav_marker.png",
                         (100, 100),
                     )
 
@@ -473,10 +469,8 @@ class MediationScreen(Screens):
         if other_cat and len(cat.mate) > 0 and other_cat.ID in cat.mate:
             self.selected_cat_elements["mate_icon" + tag] = pygame_gui.elements.UIImage(
                 scale(pygame.Rect((x + 28, y + 28), (44, 40))),
-                pygame.transform.scale(
-                    image_cache.load_image(
-                        "resources/images/heart_big.png"
-                    ).convert_alpha(),
+                image_cache.load_scaled(
+                    "resources/images/heart_big.png",
                     (44, 40),
                 ),
             )
@@ -502,10 +496,8 @@ class MediationScreen(Screens):
                 self.selected_cat_elements["relation_icon" + tag] = (
                     pygame_gui.elements.UIImage(
                         scale(pygame.Rect((x + 28, y + 28), (36, 36))),
-                        pygame.transform.scale(
-                            image_cache.load_image(
-                                "resources/images/dot_big.png"
-                            ).convert_alpha(),
+                        image_cache.load_scaled(
+                            "resources/images/dot_big.png",
                             (36, 36),
                         ),
                     )
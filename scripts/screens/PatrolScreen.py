@@ -4,6 +4,7 @@ import pygame
 import pygame_gui
 
 from scripts.cat.cats import Cat
+from scripts.game_structure import image_cache
 from scripts.game_structure.game_essentials import game, MANAGER
 from scripts.game_structure.ui_elements import UIImageButton, UISpriteButton
 from scripts.patrol.patrol import Patrol
@@ -12,15 +13,15 @@ from .Screens import Screens
 
 
 class PatrolScreen(Screens):
-    able_box = pygame.transform.scale(pygame.image.load("resources/images/patrol_able_cats.png").convert_alpha(),
+    able_box = image_cache.load_scaled("resources/images/patrol_able_cats.png",
                                       (540, 402))
-    patrol_box = pygame.transform.scale(pygame.image.load("resources/images/patrol_cats.png").convert_alpha(),
+    patrol_box = image_cache.load_scaled("resources/images/patrol_cats.png",
                                         (540, 402))
-    cat_frame = pygame.transform.scale(pygame.image.load("resources/images/patrol_cat_frame.png").convert_alpha(),
+    cat_frame = image_cache.load_scaled("resources/images/patrol_cat_frame.png",
                                        (400, 550))
-    app_frame = pygame.transform.scale(pygame.image.load("resources/images/patrol_app_frame.png").convert_alpha(),
+    app_frame = image_cache.load_scaled("resources/images/patrol_app_frame.png",
                                        (332, 340))
-    mate_frame = pygame.transform.scale(pygame.image.load("resources/images/patrol_mate_frame.png").convert_alpha(),
+    mate_frame = image_cache.load_scaled("resources/images/patrol_mate_frame.png",
                                         (332, 340))
 
     current_patrol = []
@@ -376,8 +377,8 @@ class PatrolScreen(Screens):
             'Smaller patrols help cats gain more experience, but larger patrols are safer.',
             scale(pygame.Rect((375, 190), (850, 200))), object_id=get_text_box_theme("#text_box_22_horizcenter"))
         self.elements["cat_frame"] = pygame_gui.elements.UIImage(scale(pygame.Rect((600, 330), (400, 550))),
-                                                                 pygame.image.load(
-                                                                     "resources/images/patrol_cat_frame.png").convert_alpha()
+                                                                 image_cache.load_image(
+                                                                     "resources/images/patrol_cat_frame.png")
                                                                  , manager=MANAGER)
         self.elements["cat_frame"].disable()
 
@@ -503,22 +504,19 @@ class PatrolScreen(Screens):
 
         # Layout images
         self.elements['event_bg'] = pygame_gui.elements.UIImage(scale(pygame.Rect((762, 330), (708, 540))),
-                                                                pygame.transform.scale(
-                                                                    pygame.image.load(
-                                                                        "resources/images/patrol_event_frame.png").convert_alpha(),
+                                                                image_cache.load_scaled(
+                                                                    "resources/images/patrol_event_frame.png",
                                                                     (708, 540)
                                                                 ), manager=MANAGER)
         self.elements['event_bg'].disable()
         self.elements['info_bg'] = pygame_gui.elements.UIImage(scale(pygame.Rect((180, 912), (840, 408))),
-                                                               pygame.transform.scale(
-                                                                   pygame.image.load(
-                                                                       "resources/images/patrol_info.png").convert_alpha(),
+                                                               image_cache.load_scaled(
+                                                                   "resources/images/patrol_info.png",
                                                                    (840, 408)
                                                                ), manager=MANAGER)
         self.elements['image_frame'] = pygame_gui.elements.UIImage(scale(pygame.Rect((130, 280), (640, 640))),
-                                                                   pygame.transform.scale(
-                                                                       pygame.image.load(
-                                                                           "resources/images/patrol_sprite_frame.png").convert_alpha(),
+                                                                   image_cache.load_scaled(
+                                                                       "resources/images/patrol_sprite_frame.png",
                                                                        (640, 640)
                                                                    ), manager=MANAGER) 
 
@@ -687,9 +685,8 @@ class PatrolScreen(Screens):
             if game.clan.clan_settings["show fav"] and cat.favourite:
                 self.fav[str(i)] = pygame_gui.elements.UIImage(
                     scale(pygame.Rect((pos_x, pos_y), (100, 100))),
-                    pygame.transform.scale(
-                        pygame.image.load(
-                            f"resources/images/fav_marker.png").convert_alpha(),
+                    image_cache.load_scaled(
+                        f"resources/images/fav_marker.png",
                         (100, 100))
                 )
                 self.fav[str(i)].disable()
@@ -14,7 +14,7 @@ import pygame
 import pygame_gui
 import ujson
 
-from scripts.cat.cats import Cat, BACKSTORIES
+from scripts.cat.cats import Cat, BACKSTORIES, _freeze
 from scripts.cat.pelts import Pelt
 from scripts.clan_resources.freshkill import FRESHKILL_ACTIVE
 from scripts.game_structure import image_cache
@@ -180,6 +180,8 @@ class ProfileScreen(Screens):
         self.previous_search_text = "search"
         self.checkboxes = {}
         self.profile_elements = {}
+        self.profile_texts = {}  # ID: (profile state, {part: text})
+        self.prefetch_queue = []
 
     def handle_event(self, event):
 
@@ -432,7 +434,7 @@ class ProfileScreen(Screens):
                                                                             (300, 300)), manager=MANAGER)
                 self.profile_elements["cat_image"].disable()
                 self.profile_elements["cat_info_column1"].kill()
-                self.profile_elements["cat_info_column1"] = UITextBoxTweaked(self.generate_column1(self.the_cat),
+                self.profile_elements["cat_info_column1"] = UITextBoxTweaked(self.get_profile_text(self.the_cat, "column1"),
                                                                     scale(pygame.Rect((600, 460), (360, 380))),
                                                                     object_id=get_text_box_theme(
                                                                         "#text_box_22_horizleft"),
@@ -794,7 +796,7 @@ class ProfileScreen(Screens):
                                                                             (300, 300)), manager=MANAGER)
                 self.profile_elements["cat_image"].disable()
                 self.profile_elements["cat_info_column1"].kill()
-                self.profile_elements["cat_info_column1"] = UITextBoxTweaked(self.generate_column1(self.the_cat),
+                self.profile_elements["cat_info_column1"] = UITextBoxTweaked(self.get_profile_text(self.the_cat, "column1"),
                                                                     scale(pygame.Rect((600, 460), (360, 380))),
                                                                     object_id=get_text_box_theme(
                                                                         "#text_box_22_horizleft"),
@@ -802,6 +804,8 @@ class ProfileScreen(Screens):
 
     def screen_switches(self):
         self.the_cat = Cat.all_cats.get(game.switches["cat"])
+        # the clan may have moved on since the profile was last open
+        self.profile_texts = {}
 
         # Set up the menu buttons, which appear on all cat profile images.
         self.next_cat_button = UIImageButton(
@@ -918,6 +922,7 @@ class ProfileScreen(Screens):
         self.accessories_tab_button.kill()
         self.inspect_button.kill()
         self.close_current_tab()
+        self.prefetch_queue = []
 
     def build_profile(self):
         """Rebuild builds the cat profile. Run when you switch cats
@@ -1002,14 +1007,14 @@ class ProfileScreen(Screens):
         )
 
         self.profile_elements["cat_info_column1"] = UITextBoxTweaked(
-            self.generate_column1(self.the_cat),
+            self.get_profile_text(self.the_cat, "column1"),
             scale(pygame.Rect((600, 460), (360, 380))),
             object_id=get_text_box_theme("#text_box_22_horizleft"),
             line_spacing=1,
             manager=MANAGER,
         )
         self.profile_elements["cat_info_column2"] = UITextBoxTweaked(
-            self.generate_column2(self.the_cat),
+            self.get_profile_text(self.the_cat, "column2"),
             scale(pygame.Rect((980, 460), (500, 360))),
             object_id=get_text_box_theme("#text_box_22_horizleft"),
             line_spacing=1,
@@ -1088,6 +1093,8 @@ class ProfileScreen(Screens):
 
         # Determine where the next and previous cat buttons lead
         self.determine_previous_and_next_cat()
+        # the next and previous cats are likely to be looked at next, so get them ready while idle
+        self.prefetch_queue = [i for i in (self.next_cat, self.previous_cat) if i]
 
         # Disable and enable next and previous cat buttons as needed.
         if self.next_cat == 0:
@@ -1181,6 +1188,90 @@ class ProfileScreen(Screens):
         self.next_cat = next_cat
         self.previous_cat = previous_cat
 
+    def get_profile_state(self, the_cat) -> tuple:
+        """Returns everything the profile texts of the cat are made from, in a form that can be compared cheaply."""
+        related = []
+        for cat_id in (list(the_cat.get_parents()) + the_cat.mate[:2] + [the_cat.mentor] + the_cat.apprentice
+                       + the_cat.former_apprentices + the_cat.former_mentor):
+            related_cat = Cat.all_cats.get(cat_id)
+            if related_cat:
+                related.append((cat_id, str(related_cat.name), related_cat.dead, related_cat.outside))
+
+        nutrition = None
+        if game.clan.freshkill_pile and the_cat.ID in game.clan.freshkill_pile.nutrition_info:
+            nutr = game.clan.freshkill_pile.nutrition_info[the_cat.ID]
+            nutrition = (nutr.nutrition_text, int(nutr.percentage))
+
+        return (
+            str(the_cat.name),
+            the_cat.status,
+            the_cat.dead,
+            the_cat.df,
+            the_cat.outside,
+            the_cat.exiled,
+            the_cat.moons,
+            the_cat.dead_for,
+            the_cat.gender,
+            the_cat.genderalign,
+            the_cat.backstory,
+            the_cat.experience,
+            the_cat.personality.trait,
+            the_cat.skills.skill_string(),
+            tuple(the_cat.mate),
+            tuple(related),
+            nutrition,
+            _freeze(vars(the_cat.pelt)),
+            _freeze(the_cat.pronouns),
+            _freeze(the_cat.injuries),
+            _freeze(the_cat.illnesses),
+            _freeze(the_cat.permanent_condition),
+            _freeze(vars(the_cat.history)) if the_cat.history else None,
+            game.clan.leader_lives,
+            game.clan.clan_settings["showxp"],
+            game.switches["show_history_moons"],
+        )
+
+    def get_profile_text(self, the_cat, part):
+        """
+        Returns the column1, column2 or life events text of the cat. Texts are kept until something they
+        are made from changes, so flipping between cats and tabs doesn't write them all again.
+        """
+        state = self.get_profile_state(the_cat)
+        cached = self.profile_texts.get(the_cat.ID)
+        if not cached or cached[0] != state:
+            cached = (state, {})
+        texts = cached[1]
+
+        if part not in texts:
+            if part == "column1":
+                texts[part] = self.generate_column1(the_cat)
+            elif part == "column2":
+                texts[part] = self.generate_column2(the_cat)
+            else:
+                # the history helpers all work on self.the_cat
+                current_cat, self.the_cat = self.the_cat, the_cat
+                try:
+                    texts[part] = self.get_all_history_text()
+                finally:
+                    self.the_cat = current_cat
+            # writing the text can fill in the history or nutrition of the cat, which is no change worth
+            # writing it again for
+            state = self.get_profile_state(the_cat)
+
+        self.profile_texts[the_cat.ID] = (state, texts)
+        return texts[part]
+
+    def prefetch_profile(self, cat_id):
+        """Gets the sprite and texts of the cat ready, so switching to its profile is quick."""
+        the_cat = Cat.all_cats.get(cat_id)
+        if not the_cat or the_cat.faded:
+            return
+        the_cat.sprite
+        self.get_profile_text(the_cat, "column1")
+        self.get_profile_text(the_cat, "column2")
+        if self.open_tab == "history" and self.open_sub_tab == "life events":
+            self.get_profile_text(the_cat, "life events")
+
     def generate_column1(self, the_cat):
         """Generate the left column information"""
         output = ""
@@ -1287,14 +1378,14 @@ class ProfileScreen(Screens):
                 mate_ob = Cat.fetch_cat(_m)
                 if not isinstance(mate_ob, Cat):
                     continue
-                if mate_ob.dead != self.the_cat.dead:
+                if mate_ob.dead != the_cat.dead:
                     if the_cat.dead:
                         former_indicate = "(living)"
                     else:
                         former_indicate = "(dead)"
                     
                     mate_names.append(f"{str(mate_ob.name)} {former_indicate}")
-                elif mate_ob.outside != self.the_cat.outside:
+                elif mate_ob.outside != the_cat.outside:
                     mate_names.append(f"{str(mate_ob.name)} (away)")
                 else:
                     mate_names.append(f"{str(mate_ob.name)}")
@@ -2524,8 +2615,8 @@ class ProfileScreen(Screens):
                                                   object_id="#exit_window_button", tool_tip_text="Remove all worn accessories", manager=MANAGER)
 
             self.search_bar_image = pygame_gui.elements.UIImage(scale(pygame.Rect((239, 910), (236, 68))),
-                                                            pygame.image.load(
-                                                                "resources/images/search_bar.png").convert_alpha(),
+                                                            image_cache.load_image(
+                                                                "resources/images/search_bar.png"),
                                                             manager=MANAGER)
             self.search_bar = pygame_gui.elements.UITextEntryLine(scale(pygame.Rect((259, 915), (205, 55))),
                                                               object_id="#search_entry_box",
@@ -2881,7 +2972,7 @@ class ProfileScreen(Screens):
                 self.sub_tab_2.enable()
                 self.history_text_box.kill()
                 self.history_text_box = UITextBoxTweaked(
-                    self.get_all_history_text(),
+                    self.get_profile_text(self.the_cat, "life events"),
                     scale(pygame.Rect((200, 946), (1200, 298))),
                     object_id="#text_box_26_horizleft_pad_10_14",
                     line_spacing=1,
@@ -3063,9 +3154,7 @@ class ProfileScreen(Screens):
 
         biome = biome.lower()
 
-        platformsheet = pygame.image.load(
-            "resources/images/platforms.png"
-        ).convert_alpha()
+        platformsheet = image_cache.load_image("resources/images/platforms.png")
 
         order = ["beach", "forest", "mountainous", "nest", "plains", "SC/DF"]
 
@@ -3123,6 +3212,9 @@ class ProfileScreen(Screens):
             )
 
     def on_use(self):
+        if self.prefetch_queue:
+            self.prefetch_profile(self.prefetch_queue.pop(0))
+
         if self.search_bar:
             if self.search_bar.is_focused and self.search_bar.get_text() == "search":
                 self.search_bar.set_text("")
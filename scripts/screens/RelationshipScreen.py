@@ -36,28 +36,20 @@ class RelationshipScreen(Screens):
 
     inspect_cat = None
 
-    search_bar = pygame.transform.scale(
-        image_cache.load_image(
-            "resources/images/relationship_search.png"
-        ).convert_alpha(),
+    search_bar = image_cache.load_scaled(
+        "resources/images/relationship_search.png",
         (456 / 1600 * screen_x, 78 / 1400 * screen_y),
     )
-    details_frame = pygame.transform.scale(
-        image_cache.load_image(
-            "resources/images/relationship_details_frame.png"
-        ).convert_alpha(),
+    details_frame = image_cache.load_scaled(
+        "resources/images/relationship_details_frame.png",
         (508 / 1600 * screen_x, 688 / 1400 * screen_y),
     )
-    toggle_frame = pygame.transform.scale(
-        image_cache.load_image(
-            "resources/images/relationship_toggle_frame.png"
-        ).convert_alpha(),
+    toggle_frame = image_cache.load_scaled(
+        "resources/images/relationship_toggle_frame.png",
         (502 / 1600 * screen_x, 240 / 1400 * screen_y),
     )
-    list_frame = pygame.transform.scale(
-        image_cache.load_image(
-            "resources/images/relationship_list_frame.png"
-        ).convert_alpha(),
+    list_frame = image_cache.load_scaled(
+        "resources/images/relationship_list_frame.png",
         (1004 / 1600 * screen_x, 1000 / 1400 * screen_y),
     )
 
@@ -495,10 +487,8 @@ class RelationshipScreen(Screens):
             if len(self.the_cat.mate) > 0 and self.inspect_cat.ID in self.the_cat.mate:
                 self.inspect_cat_elements["mate"] = pygame_gui.elements.UIImage(
                     scale(pygame.Rect((90, 300), (44, 40))),
-                    pygame.transform.scale(
-                        image_cache.load_image(
-                            "resources/images/heart_big.png"
-                        ).convert_alpha(),
+                    image_cache.load_scaled(
+                        "resources/images/heart_big.png",
                         (44, 40),
                     ),
                 )
@@ -510,10 +500,8 @@ class RelationshipScreen(Screens):
                 if related:
                     self.inspect_cat_elements["family"] = pygame_gui.elements.UIImage(
                         scale(pygame.Rect((90, 300), (36, 36))),
-                        pygame.transform.scale(
-                            image_cache.load_image(
-                                "resources/images/dot_big.png"
-                            ).convert_alpha(),
+                        image_cache.load_scaled(
+                            "resources/images/dot_big.png",
                             (36, 36),
                         ),
                     )
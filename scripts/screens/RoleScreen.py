@@ -94,16 +94,15 @@ class RoleScreen(Screens):
 
         # Create the buttons
         self.bar = pygame_gui.elements.UIImage(scale(pygame.Rect((96, 700), (1408, 20))),
-                                               pygame.transform.scale(
-                                                   image_cache.load_image("resources/images/bar.png"),
+                                               image_cache.load_scaled(
+                                                   "resources/images/bar.png",
                                                    (1408 / 1600 * screen_x, 20 / 1400 * screen_y)
                                                ), manager=MANAGER)
 
         self.blurb_background = pygame_gui.elements.UIImage(scale(pygame.Rect
                                                                   ((100, 390), (1400, 300))),
-                                                            pygame.transform.scale(
-                                                                pygame.image.load(
-                                                                    "resources/images/mediation_selection_bg.png").convert_alpha(),
+                                                            image_cache.load_scaled(
+                                                                "resources/images/mediation_selection_bg.png",
                                                                 (1400, 300))
                                                             )
 
@@ -223,8 +222,8 @@ class RoleScreen(Screens):
 
         self.selected_cat_elements["role_icon"] = pygame_gui.elements.UIImage(
             scale(pygame.Rect((165, 462), (156, 156))),
-            pygame.transform.scale(
-                image_cache.load_image(icon_path),
+            image_cache.load_scaled(
+                icon_path,
                 (156 / 1600 * screen_x, 156 / 1400 * screen_y)
             ))
 
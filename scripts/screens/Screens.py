@@ -9,7 +9,7 @@ from scripts.game_structure.game_essentials import game, screen, screen_x, scree
 from scripts.game_structure.ui_elements import UIImageButton
 from scripts.game_structure.propagating_thread import PropagatingThread
 from scripts.game_structure.windows import SaveCheck, EventLoading
-from scripts.utility import update_sprite, scale
+from scripts.utility import scale
 
 
 class Screens():
@@ -77,9 +77,8 @@ class Screens():
         ),
         "name_background": pygame_gui.elements.UIImage(
             scale(pygame.Rect((610, 50), (380, 70))),
-            pygame.transform.scale(
-                image_cache.load_image(
-                    "resources/images/clan_name_bg.png").convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/clan_name_bg.png",
                 (380, 70)),
             visible=False,
             manager=MANAGER,
@@ -102,9 +101,8 @@ class Screens():
         ),
         "dens_bar": pygame_gui.elements.UIImage(
             scale(pygame.Rect((80, 120), (20, 320))),
-            pygame.transform.scale(
-                image_cache.load_image(
-                    "resources/images/vertical_bar.png").convert_alpha(),
+            image_cache.load_scaled(
+                "resources/images/vertical_bar.png",
                 (380, 70)),
             visible=False,
             starting_height=5,
@@ -358,9 +356,8 @@ class Screens():
                         self.menu_buttons.update({
                             "dens_bar": pygame_gui.elements.UIImage(
                                 scale(pygame.Rect((80, 120), (20, 250))),
-                                pygame.transform.scale(
-                                    image_cache.load_image(
-                                        "resources/images/vertical_bar.png").convert_alpha(),
+                                image_cache.load_scaled(
+                                    "resources/images/vertical_bar.png",
                                     (380, 70)),
                                 visible=True,
                                 starting_height=1,
@@ -502,8 +499,8 @@ class Screens():
 
 # CAT PROFILES
 def cat_profiles():
-    """Updates every cat's sprites"""
+    """Marks every cat's sprite as stale. Each one is regenerated the next time it is shown."""
     game.choose_cats.clear()
 
     for x in Cat.all_cats:
-        update_sprite(Cat.all_cats[x])
+        Cat.all_cats[x].mark_sprite_stale()
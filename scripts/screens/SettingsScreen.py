@@ -9,6 +9,7 @@ import pygame
 import pygame_gui
 import ujson
 
+from scripts.cat.cats import Cat
 from scripts.game_structure.discord_rpc import _DiscordRPC
 from scripts.game_structure.game_essentials import game, screen_x, screen_y, MANAGER
 from scripts.game_structure.ui_elements import UIImageButton
@@ -141,6 +142,11 @@ class SettingsScreen(Screens):
                         game.settings['language'] = key
                     else:
                         game.switch_setting(key)
+                        if key in ("shaders", "new accessories"):
+                            # every cat's sprite depends on these, so redraw the living ones in the background
+                            Cat.prewarm_sprites(
+                                [i for i in Cat.all_cats_list if not i.dead and not i.outside]
+                            )
                     self.settings_changed = True
                     self.update_save_button()
                     if self.sub_menu == 'general' and event.ui_element is self.checkboxes['discord']:
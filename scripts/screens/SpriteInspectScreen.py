@@ -4,6 +4,7 @@ import pygame
 import pygame_gui
 
 from scripts.cat.cats import Cat
+from scripts.game_structure import image_cache
 from scripts.game_structure.game_essentials import game, MANAGER
 from scripts.game_structure.ui_elements import UIImageButton
 from scripts.utility import (
@@ -550,9 +551,7 @@ class SpriteInspectScreen(Screens):
 
         biome = biome.lower()
 
-        platformsheet = pygame.image.load(
-            "resources/images/platforms.png"
-        ).convert_alpha()
+        platformsheet = image_cache.load_image("resources/images/platforms.png")
 
         order = ["beach", "forest", "mountainous", "nest", "plains", "SC/DF"]
 
@@ -595,7 +594,8 @@ class SpriteInspectScreen(Screens):
     def generate_image_to_save(self):
         """Generates the image to save, with platform if needed."""
         if self.platform_shown:
-            full_image = self.get_platform()
+            # a copy, the platform can be part of the cached platform sheet
+            full_image = self.get_platform().copy()
             full_image.blit(self.cat_image, (15, 0))
             return full_image
         else:
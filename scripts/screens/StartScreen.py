@@ -52,11 +52,11 @@ class StartScreen(Screens):
         self.warning_label = None
         if game.settings["dark mode"]:
             menunumber = randrange(0,37)
-            self.bg = pygame.image.load(f"resources/images/menu_art_dark/menu{menunumber}.png").convert()
+            self.bg = image_cache.load_image(f"resources/images/menu_art_dark/menu{menunumber}.png", alpha=False)
             self.bg = pygame.transform.scale(self.bg, (screen_x, screen_y))
         else:
             menunumber = randrange(0,58)
-            self.bg = pygame.image.load(f"resources/images/menu_art/menu{menunumber}.png").convert()
+            self.bg = image_cache.load_image(f"resources/images/menu_art/menu{menunumber}.png", alpha=False)
             self.bg = pygame.transform.scale(self.bg, (screen_x, screen_y))
         self.social_buttons = {}
 
@@ -109,11 +109,11 @@ class StartScreen(Screens):
             elif event.ui_element == self.social_buttons["menurandom_button"]:
                 if game.settings["dark mode"]:
                     menunumber = randrange(0,37)
-                    self.bg = pygame.image.load(f"resources/images/menu_art_dark/menu{menunumber}.png").convert()
+                    self.bg = image_cache.load_image(f"resources/images/menu_art_dark/menu{menunumber}.png", alpha=False)
                     self.bg = pygame.transform.scale(self.bg, (screen_x, screen_y))
                 else:
                     menunumber = randrange(0,58)
-                    self.bg = pygame.image.load(f"resources/images/menu_art/menu{menunumber}.png").convert()
+                    self.bg = image_cache.load_image(f"resources/images/menu_art/menu{menunumber}.png", alpha=False)
                     self.bg = pygame.transform.scale(self.bg, (screen_x, screen_y))
         elif event.type == pygame.KEYDOWN and game.settings["keybinds"]:
             if (
@@ -199,13 +199,13 @@ class StartScreen(Screens):
             manager=MANAGER,
             tool_tip_text="Randomize menu screen",
         )
-        errorimg = image_cache.load_image(
-            "resources/images/errormsg.png"
-        ).convert_alpha()
+        errorimg = image_cache.load_scaled(
+            "resources/images/errormsg.png", (1180, 802)
+        )
 
         self.error_box = pygame_gui.elements.UIImage(
             scale(pygame.Rect((259, 300), (1180, 802))),
-            pygame.transform.scale(errorimg, (1180, 802)),
+            errorimg,
             manager=MANAGER,
         )
 
@@ -4,6 +4,7 @@ import pygame
 import pygame_gui
 
 from scripts.clan import Clan
+from scripts.game_structure import image_cache
 from scripts.game_structure.game_essentials import game, screen, screen_x, screen_y, MANAGER
 from scripts.game_structure.ui_elements import UIImageButton
 from scripts.game_structure.windows import DeleteCheck
@@ -90,9 +91,8 @@ class SwitchClanScreen(Screens):
         """
         TODO: DOCS
         """
-        self.screen = pygame.transform.scale(
-            pygame.image.load(
-                "resources/images/clan_saves_frame.png").convert_alpha(),
+        self.screen = image_cache.load_scaled(
+            "resources/images/clan_saves_frame.png",
             (440 / 1600 * screen_x, 750 / 1400 * screen_y))
         self.main_menu = UIImageButton(scale(pygame.Rect((50, 50), (306, 60))),
                                        "",
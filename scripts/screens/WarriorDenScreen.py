@@ -3,6 +3,7 @@ import pygame_gui
 import ujson
 
 from scripts.cat.cats import Cat
+from scripts.game_structure import image_cache
 from scripts.game_structure.ui_elements import UIImageButton
 from scripts.game_structure.windows import SelectFocusClans
 from scripts.screens.Screens import Screens
@@ -117,8 +118,8 @@ class WarriorDenScreen(Screens):
 
         self.focus_frame = pygame_gui.elements.UIImage(scale(pygame.Rect
                                                              ((100, 380), (1400, 920))),
-                                                       pygame.image.load(
-                                                           "resources/images/warrior_den_frame.png").convert_alpha(),
+                                                       image_cache.load_image(
+                                                           "resources/images/warrior_den_frame.png"),
                                                        object_id="#focus_frame",
                                                        starting_height=1,
                                                        manager=MANAGER)
@@ -148,8 +149,8 @@ class WarriorDenScreen(Screens):
 
         self.base_image = pygame_gui.elements.UIImage(scale(pygame.Rect
                                                             ((885, 169), (528, 696))),
-                                                      pygame.image.load(
-                                                          f"resources/images/warrior_den/{image}.png").convert_alpha(),
+                                                      image_cache.load_image(
+                                                          f"resources/images/warrior_den/{image}.png"),
                                                       manager=MANAGER)
 
         # check for a focus visual already onscreen and kill it so we can update the visual. if it isn't onscreen,
@@ -160,16 +161,16 @@ class WarriorDenScreen(Screens):
             path = settings_dict["clan_focus"][self.active_code][3]
             self.focus_information["focus_visual"] = pygame_gui.elements.UIImage(scale(pygame.Rect
                                                                                        ((885, 169), (528, 696))),
-                                                                                 pygame.image.load(
-                                                                                     f"resources/images/warrior_den/{path}.png").convert_alpha(),
+                                                                                 image_cache.load_image(
+                                                                                     f"resources/images/warrior_den/{path}.png"),
                                                                                  manager=MANAGER)
 
         else:
             path = settings_dict["clan_focus"][self.original_focus_code][3]
             self.focus_information["focus_visual"] = pygame_gui.elements.UIImage(scale(pygame.Rect
                                                                                        ((885, 169), (528, 696))),
-                                                                                 pygame.image.load(
-                                                                                     f"resources/images/warrior_den/{path}.png").convert_alpha(),
+                                                                                 image_cache.load_image(
+                                                                                     f"resources/images/warrior_den/{path}.png"),
                                                                                  manager=MANAGER)
 
     def exit_screen(self):
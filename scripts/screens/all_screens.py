@@ -1,29 +1,9 @@
-from .AllegiancesScreen import AllegiancesScreen
-from .CeremonyScreen import CeremonyScreen
-from .ChangeGenderScreen import ChangeGenderScreen
-from .ChooseAdoptiveParentScreen import ChooseAdoptiveParentScreen
-from .ChooseMateScreen import ChooseMateScreen
-from .ChooseMentorScreen import ChooseMentorScreen
-from .ClanScreen import ClanScreen
-from .ClanSettingsScreen import ClanSettingsScreen
-from .ClearingScreen import ClearingScreen
-from .EventsScreen import EventsScreen
-from .FamilyTreeScreen import FamilyTreeScreen
-from .LeaderDenScreen import LeaderDenScreen
-from .ListScreen import ListScreen
-from .MakeClanScreen import MakeClanScreen
-from .MedDenScreen import MedDenScreen
-from .MediationScreen import MediationScreen
-from .PatrolScreen import PatrolScreen
-from .ProfileScreen import ProfileScreen
-from .RelationshipScreen import RelationshipScreen
-from .RoleScreen import RoleScreen
+import importlib
+import threading
+
+from scripts.game_structure import image_cache
+from scripts.game_structure.game_essentials import game
 from .Screens import Screens
-from .SettingsScreen import SettingsScreen
-from .SpriteInspectScreen import SpriteInspectScreen
-from .StartScreen import StartScreen
-from .SwitchClanScreen import SwitchClanScreen
-from .WarriorDenScreen import WarriorDenScreen
 
 # ---------------------------------------------------------------------------- #
 #                                  UI RULES                                    #
@@ -47,45 +27,102 @@ BUTTONS:
 # SCREENS
 screens = Screens()
 
-# ---------------------------------------------------------------------------- #
-#                                 cat_screens.py                               #
-# ---------------------------------------------------------------------------- #
-
-profile_screen = ProfileScreen('profile screen')
-ceremony_screen = CeremonyScreen('ceremony screen')
-role_screen = RoleScreen('role screen')
-sprite_inspect_screen = SpriteInspectScreen("sprite inspect screen")
-
-
-make_clan_screen = MakeClanScreen('make clan screen')
-
-
-allegiances_screen = AllegiancesScreen('allegiances screen')
-camp_screen = ClanScreen('camp screen')
-catlist_screen = ListScreen('list screen')
-med_den_screen = MedDenScreen('med den screen')
-freshkill_pile_screen = ClearingScreen('clearing screen')
-warrior_den_screen = WarriorDenScreen('warrior den screen')
-leader_den_screen = LeaderDenScreen('leader den screen')
-
-
-events_screen = EventsScreen('events screen')
-
-
-settings_screen = SettingsScreen('settings screen')
-clan_settings_screen = ClanSettingsScreen('clan settings screen')
-start_screen = StartScreen('start screen')
-switch_clan_screen = SwitchClanScreen('switch clan screen')
-
-
-patrol_screen = PatrolScreen('patrol screen')
-
-
-choose_mate_screen = ChooseMateScreen('choose mate screen')
-choose_mentor_screen = ChooseMentorScreen('choose mentor screen')
-choose_adoptive_parent_screen = ChooseAdoptiveParentScreen('choose adoptive parent screen')
-relationship_screen = RelationshipScreen('relationship screen')
-view_children_screen = FamilyTreeScreen('see kits screen')
-mediation_screen = MediationScreen("mediation screen")
-change_gender_screen = ChangeGenderScreen("change gender screen")
-
+# screen name: (module, class) of each screen. A screen is only imported and made the first time it is needed, see
+# ScreenRegistry.
+SCREENS = {
+    # cat_screens.py
+    "profile screen": ("ProfileScreen", "ProfileScreen"),
+    "ceremony screen": ("CeremonyScreen", "CeremonyScreen"),
+    "role screen": ("RoleScreen", "RoleScreen"),
+    "sprite inspect screen": ("SpriteInspectScreen", "SpriteInspectScreen"),
+
+    "make clan screen": ("MakeClanScreen", "MakeClanScreen"),
+
+    "allegiances screen": ("AllegiancesScreen", "AllegiancesScreen"),
+    "camp screen": ("ClanScreen", "ClanScreen"),
+    "list screen": ("ListScreen", "ListScreen"),
+    "med den screen": ("MedDenScreen", "MedDenScreen"),
+    "clearing screen": ("ClearingScreen", "ClearingScreen"),
+    "warrior den screen": ("WarriorDenScreen", "WarriorDenScreen"),
+    "leader den screen": ("LeaderDenScreen", "LeaderDenScreen"),
+
+    "events screen": ("EventsScreen", "EventsScreen"),
+
+    "settings screen": ("SettingsScreen", "SettingsScreen"),
+    "clan settings screen": ("ClanSettingsScreen", "ClanSettingsScreen"),
+    "start screen": ("StartScreen", "StartScreen"),
+    "switch clan screen": ("SwitchClanScreen", "SwitchClanScreen"),
+
+    "patrol screen": ("PatrolScreen", "PatrolScreen"),
+
+    "choose mate screen": ("ChooseMateScreen", "ChooseMateScreen"),
+    "choose mentor screen": ("ChooseMentorScreen", "ChooseMentorScreen"),
+    "choose adoptive parent screen": ("ChooseAdoptiveParentScreen", "ChooseAdoptiveParentScreen"),
+    "relationship screen": ("RelationshipScreen", "RelationshipScreen"),
+    "see kits screen": ("FamilyTreeScreen", "FamilyTreeScreen"),
+    "mediation screen": ("MediationScreen", "MediationScreen"),
+    "change gender screen": ("ChangeGenderScreen", "ChangeGenderScreen"),
+}
+
+# screen name: the screens the player is likely to go to from there. Those are made in the background while the
+# player is still on the screen, so switching to them doesn't have to wait for their imports.
+LIKELY_NEXT_SCREENS = {
+    "start screen": ["camp screen", "make clan screen", "settings screen", "switch clan screen"],
+    "make clan screen": ["camp screen"],
+    "camp screen": ["events screen", "list screen", "profile screen", "patrol screen", "allegiances screen"],
+    "events screen": ["profile screen", "patrol screen"],
+    "list screen": ["profile screen"],
+    "patrol screen": ["events screen"],
+    "profile screen": ["role screen", "relationship screen", "see kits screen", "choose mate screen"],
+}
+
+
+class ScreenRegistry(dict):
+    """
+    game.all_screens. Works like a dictionary of screen name: screen, except that a screen is only imported and
+    made the first time it is looked up.
+    """
+
+    def __init__(self, screens):
+        super().__init__()
+        self.screens = screens
+        self.lock = threading.RLock()
+        self.prewarm_thread = None
+
+    def __missing__(self, name):
+        if name not in self.screens:
+            raise KeyError(name)
+        with self.lock:
+            # the screen may have been made by the prewarm thread in the meantime
+            if not super().__contains__(name):
+                module = importlib.import_module(f"scripts.screens.{self.screens[name][0]}")
+                # screens add themselves to game.all_screens
+                getattr(module, self.screens[name][1])(name)
+        return super().__getitem__(name)
+
+    def prewarm(self, names):
+        """Makes the given screens and loads the images they used last time, in a background thread."""
+        if not names or (self.prewarm_thread and self.prewarm_thread.is_alive()):
+            return
+        self.prewarm_thread = threading.Thread(
+            target=self._prewarm, args=(names,), name="screen_prewarm", daemon=True
+        )
+        self.prewarm_thread.start()
+
+    def prewarm_likely_next(self, name):
+        """Gets the screens the player is likely to go to from the given screen ready in the background."""
+        self.prewarm(LIKELY_NEXT_SCREENS.get(name, []))
+
+    def _prewarm(self, names):
+        for name in names:
+            try:
+                self[name]
+                image_cache.preload_screen(name)
+            except Exception as e:
+                # it will go wrong again when the screen is needed, and be reported there
+                print(f"WARNING: could not make the {name} ahead of time: {e}")
+
+
+game.all_screens = ScreenRegistry(SCREENS)
+
+start_screen = game.all_screens["start screen"]
@@ -8,7 +8,6 @@ TODO: Docs
 
 import logging
 import re
-from itertools import combinations
 from random import choice, choices, randint, random, sample, randrange
 from sys import exit as sys_exit
 from typing import List
@@ -17,9 +16,12 @@ import pygame
 import ujson
 
 logger = logging.getLogger(__name__)
-from scripts.game_structure import image_cache
+from scripts.game_structure import image_cache, text_measure
 from scripts.cat.history import History
+from scripts.cat_relations import incoming
+from scripts.cat_relations.constraints import compile_constraints
 from scripts.cat.names import names
+from scripts.cat import sprite_layers
 from scripts.cat.pelts import Pelt
 from scripts.cat.sprites import sprites
 from scripts.game_structure.game_essentials import game, screen_x, screen_y
@@ -150,10 +152,11 @@ def get_cats_same_age(Cat, cat, age_range=10):
 def get_free_possible_mates(cat):
     """Returns a list of available cats, which are possible mates for the given cat."""
     cats = []
-    for inter_cat in cat.all_cats.values():
-        if inter_cat.dead or inter_cat.outside or inter_cat.exiled:
-            continue
-        if inter_cat.ID == cat.ID:
+    if cat.dead:
+        return cats
+
+    for inter_cat in cat.get_potential_mates(for_love_interest=True):
+        if inter_cat.exiled:
             continue
 
         if inter_cat.ID not in cat.relationships:
@@ -162,8 +165,7 @@ def get_free_possible_mates(cat):
                 inter_cat.create_one_relationship(cat)
             continue
 
-        if inter_cat.is_potential_mate(cat, for_love_interest=True):
-            cats.append(inter_cat)
+        cats.append(inter_cat)
     return cats
 
 
@@ -558,13 +560,12 @@ def create_new_cat_block(
         for n_c in new_cats:
 
             # SET MATES
+            # the inheritances are updated once for the whole block, below
             for inter_cat in give_mates:
                 if n_c == inter_cat or n_c.ID in inter_cat.mate:
                     continue
 
-                # this is some duplicate work, since this triggers inheritance re-calcs
-                # TODO: optimize
-                n_c.set_mate(inter_cat)
+                n_c.set_mate(inter_cat, update_inheritance=False)
 
             # LITTERMATES
             for inter_cat in new_cats:
@@ -600,8 +601,14 @@ def create_new_cat_block(
                 start_relation.trust = 10 + y
                 n_c.relationships[par.ID] = start_relation
 
-            # UPDATE INHERITANCE
-            n_c.create_inheritance_new_cat()
+        # UPDATE INHERITANCE
+        Cat.create_inheritance_new_cats(new_cats)
+        updated_mates = set()
+        for inter_cat in give_mates:
+            if inter_cat.ID in updated_mates or inter_cat in new_cats or not inter_cat.inheritance:
+                continue
+            updated_mates.add(inter_cat.ID)
+            inter_cat.inheritance.update_all_mates()
 
     return new_cats
 
@@ -908,11 +915,11 @@ def create_new_cat(
         history = History()
         history.add_beginning(new_cat)
 
-        # create relationships
-        new_cat.create_relationships_new_cat()
-        # Note - we always update inheritance after the cats are generated, to
-        # allow us to add parents.
-        # new_cat.create_inheritance_new_cat()
+    # create relationships, for the whole litter at once
+    Cat.create_relationships_new_cats(created_cats)
+    # Note - we always update inheritance after the cats are generated, to
+    # allow us to add parents.
+    # Cat.create_inheritance_new_cats(created_cats)
 
     return created_cats
 
@@ -1045,45 +1052,24 @@ def get_amount_of_cats_with_relation_value_towards(cat, value, all_cats):
     :param all_cats: list of cats which has to be checked
     """
 
-    # collect all true or false if the value is reached for the cat or not
-    # later count or sum can be used to get the amount of cats
-    # this will be handled like this, because it is easier / shorter to check
-    relation_dict = {
-        "romantic_love": [],
-        "platonic_like": [],
-        "dislike": [],
-        "admiration": [],
-        "comfortable": [],
-        "jealousy": [],
-        "trust": [],
-    }
-
-    for inter_cat in all_cats:
-        if cat.ID in inter_cat.relationships:
-            relation = inter_cat.relationships[cat.ID]
-        else:
-            continue
-
-        relation_dict["romantic_love"].append(relation.romantic_love >= value)
-        relation_dict["platonic_like"].append(relation.platonic_like >= value)
-        relation_dict["dislike"].append(relation.dislike >= value)
-        relation_dict["admiration"].append(relation.admiration >= value)
-        relation_dict["comfortable"].append(relation.comfortable >= value)
-        relation_dict["jealousy"].append(relation.jealousy >= value)
-        relation_dict["trust"].append(relation.trust >= value)
-
-    return_dict = {
-        "romantic_love": sum(relation_dict["romantic_love"]),
-        "platonic_like": sum(relation_dict["platonic_like"]),
-        "dislike": sum(relation_dict["dislike"]),
-        "admiration": sum(relation_dict["admiration"]),
-        "comfortable": sum(relation_dict["comfortable"]),
-        "jealousy": sum(relation_dict["jealousy"]),
-        "trust": sum(relation_dict["trust"]),
+    allowed_ids = {inter_cat.ID for inter_cat in all_cats}
+    return {
+        value_name: sum(
+            1
+            for relation in incoming.get_incoming(cat, value_name, minimum=value)
+            if relation.cat_from.ID in allowed_ids
+        )
+        for value_name in (
+            "romantic_love",
+            "platonic_like",
+            "dislike",
+            "admiration",
+            "comfortable",
+            "jealousy",
+            "trust",
+        )
     }
 
-    return return_dict
-
 
 def filter_relationship_type(
         group: list,
@@ -1098,188 +1084,13 @@ def filter_relationship_type(
     :param list[str] filter_types: the relationship types to check for. possible types: "siblings", "mates",
     "mates_with_pl" (PATROL ONLY), "not_mates", "parent/child", "child/parent", "mentor/app", "app/mentor",
     (following tags check if value is over given int) "romantic_int", "platonic_int", "dislike_int", "comfortable_int",
-    "jealousy_int", "trust_int"
+    "jealousy_int", "trust_int", "admiration_int", add "_lower" to check if the value is under it instead
     :param str event_id: if the event has an ID, include it here
     :param Cat patrol_leader: if you are testing a patrol, ensure you include the self.patrol_leader here
     """
-    # keeping this list here just for quick reference of what tags are handled here
-    possible_rel_types = ["siblings", "mates", "mates_with_pl", "not_mates", "parent/child", "child/parent",
-                          "mentor/app", "app/mentor"]
-
-    possible_value_types = ["romantic", "platonic", "dislike", "comfortable", "jealousy", "trust", "admiration"]
-
-    if "siblings" in filter_types:
-        test_cat = group[0]
-        testing_cats = [cat for cat in group if cat.ID != test_cat.ID]
-
-        siblings = [test_cat.is_sibling(inter_cat) for inter_cat in testing_cats]
-        if not all(siblings):
-            return False
-
-    if "mates" in filter_types:
-        # first test if more than one cat
-        if len(group) == 1:
-            return False
-
-        # then if cats don't have the needed number of mates
-        if not all(len(i.mate) >= (len(group) - 1) for i in group):
-            return False
-
-        # Now the expensive test.  We have to see if everone is mates with each other
-        # Hopefully the cheaper tests mean this is only needed on events with a small number of cats
-        for x in combinations(group, 2):
-            if x[0].ID not in x[1].mate:
-                return False
-
-    # check if all cats are mates with p_l (they do not have to be mates with each other)
-    if "mates_with_pl" in filter_types:
-        # First test if there is more than one cat
-        if len(group) == 1:
-            return False
-
-        # Check each cat to see if it is mates with the patrol leader
-        for cat in group:
-            if cat.ID == patrol_leader.ID:
-                continue
-            if cat.ID not in patrol_leader.mate:
-                return False
-
-    # Check if all cats are not mates
-    if "not_mates" in filter_types:
-        # opposite of mate check
-        for x in combinations(group, 2):
-            if x[0].ID in x[1].mate:
-                return False
-
-    # Check if the cats are in a parent/child relationship
-    if "parent/child" in filter_types:
-        if patrol_leader:
-            if patrol_leader in group:
-                group.remove(patrol_leader)
-            group.insert(0, patrol_leader)
-        # It should be exactly two cats for a "parent/child" event
-        if len(group) != 2:
-            return False
-        # test for parentage
-        if not group[0].is_parent(group[1]):
-            return False
-
-    if "child/parent" in filter_types:
-        if patrol_leader:
-            if patrol_leader in group:
-                group.remove(patrol_leader)
-            group.insert(0, patrol_leader)
-        # It should be exactly two cats for a "parent/child" event
-        if len(group) != 2:
-            return False
-        # test for parentage
-        if not group[1].is_parent(group[0]):
-            return False
-
-    if "mentor/app" in filter_types:
-        if patrol_leader:
-            if patrol_leader in group:
-                group.remove(patrol_leader)
-            group.insert(0, patrol_leader)
-        # It should be exactly two cats for a "parent/child" event
-        if len(group) != 2:
-            return False
-        # test for parentage
-        if not group[1].ID in group[0].apprentice:
-            return False
-
-    if "app/mentor" in filter_types:
-        if patrol_leader:
-            if patrol_leader in group:
-                group.remove(patrol_leader)
-            group.insert(0, patrol_leader)
-        # It should be exactly two cats for a "parent/child" event
-        if len(group) != 2:
-            return False
-        # test for parentage
-        if not group[0].ID in group[1].apprentice:
-            return False
-
-    # Filtering relationship values
-    break_loop = False
-    for v_type in possible_value_types:
-        # first get all tags for current value types
-        tags = [constraint for constraint in filter_types if v_type in constraint]
-
-        # If there is not a tag for the current value type, check next one
-        if len(tags) == 0:
-            continue
-
-            # there should be only one value constraint for each value type
-        elif len(tags) > 1:
-            print(f"ERROR: event {event_id} has multiple relationship constraints for the value {v_type}.")
-            break_loop = True
-            break
-
-        # try to extract the value/threshold from the text
-        try:
-            threshold = int(tags[0].split('_')[1])
-        except:
-            print(
-                f"ERROR: event {event_id} with the relationship constraint for the value does not {v_type} follow the formatting guidelines.")
-            break_loop = True
-            break
-
-        if threshold > 100:
-            print(
-                f"ERROR: event {event_id} has a relationship constraint for the value {v_type}, which is higher than the max value of a relationship.")
-            break_loop = True
-            break
-
-        if threshold <= 0:
-            print(
-                f"ERROR: event {event_id} has a relationship constraint for the value {v_type}, which is lower than the min value of a relationship or 0.")
-            break_loop = True
-            break
-
-        # each cat has to have relationships with this relationship value above the threshold
-        fulfilled = True
-        for inter_cat in group:
-            rel_above_threshold = []
-            group_ids = [cat.ID for cat in group]
-            relevant_relationships = list(
-                filter(lambda rel: rel.cat_to.ID in group_ids and rel.cat_to.ID != inter_cat.ID,
-                       list(inter_cat.relationships.values())
-                       )
-            )
-
-            # get the relationships depending on the current value type + threshold
-            if v_type == "romantic":
-                rel_above_threshold = [i for i in relevant_relationships if i.romantic_love >= threshold]
-            elif v_type == "platonic":
-                rel_above_threshold = [i for i in relevant_relationships if i.platonic_like >= threshold]
-            elif v_type == "dislike":
-                rel_above_threshold = [i for i in relevant_relationships if i.dislike >= threshold]
-            elif v_type == "comfortable":
-                rel_above_threshold = [i for i in relevant_relationships if i.comfortable >= threshold]
-            elif v_type == "jealousy":
-                rel_above_threshold = [i for i in relevant_relationships if i.jealousy >= threshold]
-            elif v_type == "trust":
-                rel_above_threshold = [i for i in relevant_relationships if i.trust >= threshold]
-            elif v_type == "admiration":
-                rel_above_threshold = [i for i in relevant_relationships if i.admiration >= threshold]
-
-            # if the lengths are not equal, one cat has not the relationship value which is needed to another cat of
-            # the event
-            if len(rel_above_threshold) + 1 != len(group):
-                fulfilled = False
-                break
-
-        if not fulfilled:
-            break_loop = True
-            break
-
-    # if break is used in the loop, the condition are not fulfilled
-    # and this event should not be added to the filtered list
-    if break_loop:
-        return False
-
-    return True
+    return compile_constraints(filter_types, f"event {event_id}").check_group(
+        group, patrol_leader
+    )
 
 
 def gather_cat_objects(
@@ -2240,7 +2051,7 @@ def ceremony_text_adjust(
 
 
 def shorten_text_to_fit(
-        name, length_limit, font_size=None, font_type="resources/fonts/NotoSans-Medium.ttf"
+        name, length_limit, font_size=None, font_type=text_measure.DEFAULT_FONT
 ):
     length_limit = (
         length_limit // 2 if not game.settings["fullscreen"] else length_limit
@@ -2250,15 +2061,14 @@ def shorten_text_to_fit(
     if font_size is None:
         font_size = 30
     font_size = font_size // 2 if not game.settings["fullscreen"] else font_size
-    # Create the font object
-    font = pygame.font.Font(font_type, font_size)
+    # Widths come from the shared measurement cache, so fonts are only opened once
+    ellipsis_width = text_measure.text_width("...", font_type, font_size)
 
     # Add dynamic name lengths by checking the actual width of the text
     total_width = 0
     short_name = ""
     for index, character in enumerate(name):
-        char_width = font.size(character)[0]
-        ellipsis_width = font.size("...")[0]
+        char_width = text_measure.glyph_width(character, font_type, font_size)
 
         # Check if the current character is the last one and its width is less than or equal to ellipsis_width
         if index == len(name) - 1 and char_width <= ellipsis_width:
@@ -2414,103 +2224,25 @@ def generate_sprite(
         else:
             cat_sprite = str(cat.pelt.cat_sprites[age])
 
-    new_sprite = pygame.Surface(
-        (sprites.size, sprites.size), pygame.HWSURFACE | pygame.SRCALPHA
-    )
-
     # generating the sprite
     try:
-        if cat.pelt.name not in ["Tortie", "Calico"]:
-            new_sprite.blit(
-                sprites.sprites[
-                    cat.pelt.get_sprites_name() + cat.pelt.colour + cat_sprite
-                    ],
-                (0, 0),
-            )
-        else:
-            # Base Coat
-            new_sprite.blit(
-                sprites.sprites[cat.pelt.tortiebase + cat.pelt.colour + cat_sprite],
-                (0, 0),
-            )
-
-            # Create the patch image
-            if cat.pelt.tortiepattern == "Single":
-                tortie_pattern = "SingleColour"
-            else:
-                tortie_pattern = cat.pelt.tortiepattern
-
-            patches = sprites.sprites[
-                tortie_pattern + cat.pelt.tortiecolour + cat_sprite
-                ].copy()
-            patches.blit(
-                sprites.sprites["tortiemask" + cat.pelt.pattern + cat_sprite],
-                (0, 0),
-                special_flags=pygame.BLEND_RGBA_MULT,
-            )
-
-            # Add patches onto cat.
-            new_sprite.blit(patches, (0, 0))
-
-        # TINTS
-        if (
-                cat.pelt.tint != "none"
-                and cat.pelt.tint in sprites.cat_tints["tint_colours"]
-        ):
-            # Multiply with alpha does not work as you would expect - it just lowers the alpha of the
-            # entire surface. To get around this, we first blit the tint onto a white background to dull it,
-            # then blit the surface onto the sprite with pygame.BLEND_RGB_MULT
-            tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
-            tint.fill(tuple(sprites.cat_tints["tint_colours"][cat.pelt.tint]))
-            new_sprite.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
-        if cat.pelt.tint != "none" and cat.pelt.tint in sprites.cat_tints["dilute_tint_colours"]:
-            tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
-            tint.fill(tuple(sprites.cat_tints["dilute_tint_colours"][cat.pelt.tint]))
-            new_sprite.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+        # the tinted layers are cached in sprite_layers, so this is mostly plain blits
+        new_sprite = sprite_layers.base_coat(cat.pelt, cat_sprite).copy()
 
         # draw white patches
         if cat.pelt.white_patches is not None:
-            white_patches = sprites.sprites[
-                "white" + cat.pelt.white_patches + cat_sprite
-                ].copy()
-
-            # Apply tint to white patches.
-            if (
-                    cat.pelt.white_patches_tint != "none"
-                    and cat.pelt.white_patches_tint
-                    in sprites.white_patches_tints["tint_colours"]
-            ):
-                tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
-                tint.fill(
-                    tuple(
-                        sprites.white_patches_tints["tint_colours"][
-                            cat.pelt.white_patches_tint
-                        ]
-                    )
-                )
-                white_patches.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
-
-            new_sprite.blit(white_patches, (0, 0))
+            new_sprite.blit(
+                sprite_layers.white(cat.pelt.white_patches, cat.pelt.white_patches_tint, cat_sprite),
+                (0, 0),
+            )
 
         # draw vit & points
 
         if cat.pelt.points:
-            points = sprites.sprites["white" + cat.pelt.points + cat_sprite].copy()
-            if (
-                    cat.pelt.white_patches_tint != "none"
-                    and cat.pelt.white_patches_tint
-                    in sprites.white_patches_tints["tint_colours"]
-            ):
-                tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
-                tint.fill(
-                    tuple(
-                        sprites.white_patches_tints["tint_colours"][
-                            cat.pelt.white_patches_tint
-                        ]
-                    )
-                )
-                points.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
-            new_sprite.blit(points, (0, 0))
+            new_sprite.blit(
+                sprite_layers.white(cat.pelt.points, cat.pelt.white_patches_tint, cat_sprite),
+                (0, 0),
+            )
 
         if cat.pelt.vitiligo:
             new_sprite.blit(
@@ -2519,12 +2251,9 @@ def generate_sprite(
 
         # draw non-boba eyes
         if cat.pelt.eye_colour not in Pelt.riveye_colours:
-            eyes = sprites.sprites["eyes" + cat.pelt.eye_colour + cat_sprite].copy()
-            if cat.pelt.eye_colour2 != None:
-                eyes.blit(
-                    sprites.sprites["eyes2" + cat.pelt.eye_colour2 + cat_sprite], (0, 0)
-                )
-            new_sprite.blit(eyes, (0, 0))
+            new_sprite.blit(
+                sprite_layers.eyes(cat.pelt.eye_colour, cat.pelt.eye_colour2, cat_sprite), (0, 0)
+            )
 
         # draw scars1
         if not scars_hidden:
@@ -2556,12 +2285,9 @@ def generate_sprite(
             
         # draw riv boba eyes
         if cat.pelt.eye_colour in Pelt.riveye_colours:
-            eyes = sprites.sprites["eyes" + cat.pelt.eye_colour + cat_sprite].copy()
-            if cat.pelt.eye_colour2 != None:
-                eyes.blit(
-                    sprites.sprites["eyes2" + cat.pelt.eye_colour2 + cat_sprite], (0, 0)
-                )
-            new_sprite.blit(eyes, (0, 0))
+            new_sprite.blit(
+                sprite_layers.eyes(cat.pelt.eye_colour, cat.pelt.eye_colour2, cat_sprite), (0, 0)
+            )
 
         # draw skin and scars2
         blendmode = pygame.BLEND_RGBA_MIN
@@ -2747,9 +2473,7 @@ def generate_sprite(
         logger.exception("Failed to load sprite")
 
         # Placeholder image
-        new_sprite = image_cache.load_image(
-            f"sprites/error_placeholder.png"
-        ).convert_alpha()
+        new_sprite = image_cache.load_image(f"sprites/error_placeholder.png")
 
     return new_sprite
 
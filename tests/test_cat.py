@@ -1,10 +1,13 @@
 import os
 import unittest
 from copy import deepcopy
+from types import SimpleNamespace
 from unittest.mock import patch
 
-from scripts.cat.cats import Cat
+from scripts.cat.cats import Cat, ExampleCatPool
+from scripts.cat_relations.inheritance import Inheritance
 from scripts.cat_relations.relationship import Relationship
+from scripts.game_structure.game_essentials import game
 
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
@@ -274,6 +277,63 @@ class TestPossibleMateFunction(unittest.TestCase):
         # self.assertTrue(former_appr.is_potential_mate(mentor,True,True))
 
 
+class TestPotentialMateIndex(unittest.TestCase):
+
+    def test_matches_full_scan(self):
+        cats = [Cat(moons=moons) for moons in (1, 1, 6, 6, 12, 20, 20, 35, 60, 65, 96, 120)]
+        cats[5].dead = True
+        cats[8].outside = True
+
+        for cat in cats:
+            for for_love_interest in (False, True):
+                expected = [
+                    other_cat
+                    for other_cat in Cat.all_cats_list
+                    if cat._check_potential_mate(other_cat, for_love_interest, True, False, False)
+                ]
+                self.assertEqual(cat.get_potential_mates(for_love_interest=for_love_interest), expected)
+
+    def test_mentor_change_invalidates(self):
+        app = Cat(moons=12, status="apprentice")
+        mentor = Cat(moons=20, status="warrior")
+        self.assertTrue(app.is_potential_mate(mentor, for_love_interest=True))
+
+        app.update_mentor(mentor.ID)
+        self.assertFalse(app.is_potential_mate(mentor, for_love_interest=True))
+
+    def test_death_invalidates(self):
+        cat1 = Cat(moons=30)
+        cat2 = Cat(moons=30)
+        self.assertIn(cat2, cat1.get_potential_mates())
+
+        cat2.dead = True
+        self.assertFalse(cat1.is_potential_mate(cat2))
+        self.assertNotIn(cat2, cat1.get_potential_mates())
+
+    def test_buckets_updated_per_cat(self):
+        cats = [Cat(moons=moons) for moons in (3, 12, 20, 20, 60, 120)]
+        mate_buckets = Cat.get_mate_buckets()
+
+        cats[2].dead = True
+        cats[3].outside = True
+        cats[1].moons = 13
+        cats[0].moons = 6
+        new_cat = Cat(moons=20)
+        self.assertIs(mate_buckets, Cat.mate_buckets)
+
+        def bucket_cats(buckets):
+            return {
+                bucket: [inter_cat for _, inter_cat in entries]
+                for bucket, entries in buckets.items()
+                if entries
+            }
+
+        kept = bucket_cats(mate_buckets)
+        Cat.invalidate_mate_index()
+        self.assertEqual(bucket_cats(Cat.get_mate_buckets()), kept)
+        self.assertIn(new_cat, kept[(new_cat.age, False, False)])
+
+
 class TestMateFunctions(unittest.TestCase):
 
     def test_set_mate(self):
@@ -398,3 +458,138 @@ class TestUpdateMentor(unittest.TestCase):
         self.assertFalse(app.ID in mentor.apprentice)
         self.assertTrue(app.ID in mentor.former_apprentices)
         self.assertIsNone(app.mentor)
+
+
+class TestLazySprite(unittest.TestCase):
+    @staticmethod
+    def fake_update_sprite(cat):
+        cat.sprite = object()
+
+    @patch("scripts.cat.cats.update_sprite", side_effect=fake_update_sprite)
+    def test_sprite_generated_once(self, update_sprite):
+        test_cat = Cat(moons=20, status="warrior")
+        first = test_cat.sprite
+        self.assertIs(first, test_cat.sprite)
+        self.assertEqual(update_sprite.call_count, 1)
+
+    @patch("scripts.cat.cats.update_sprite", side_effect=fake_update_sprite)
+    def test_sprite_regenerated_on_change(self, update_sprite):
+        test_cat = Cat(moons=20, status="warrior")
+        test_cat.sprite
+        test_cat.pelt.scars.append("ONE")
+        test_cat.sprite
+        test_cat.age = "senior"
+        test_cat.sprite
+        test_cat.status = "elder"
+        test_cat.sprite
+        self.assertEqual(update_sprite.call_count, 4)
+
+    @patch("scripts.cat.cats.update_sprite", side_effect=fake_update_sprite)
+    def test_mark_sprite_stale(self, update_sprite):
+        test_cat = Cat(moons=20, status="warrior")
+        test_cat.sprite
+        test_cat.mark_sprite_stale()
+        test_cat.sprite
+        self.assertEqual(update_sprite.call_count, 2)
+
+    @patch("scripts.cat.cats.update_sprite", side_effect=fake_update_sprite)
+    def test_sprite_regenerated_on_fading_change(self, update_sprite):
+        test_cat = Cat(moons=20, status="warrior")
+        test_cat.dead = True
+        test_cat.pelt.opacity = 30
+        clan = SimpleNamespace(clan_settings={"fading": True})
+        with patch.object(game, "clan", clan):
+            first = test_cat.sprite
+            test_cat.prevent_fading = True
+            second = test_cat.sprite
+            clan.clan_settings["fading"] = False
+            third = test_cat.sprite
+        self.assertIsNot(first, second)
+        self.assertIsNot(second, third)
+
+
+class TestExampleCatPool(unittest.TestCase):
+    @patch("scripts.cat.cats.generate_sprite", side_effect=lambda cat: object())
+    def test_pooled_cats_registered_when_taken(self, generate_sprite):
+        pool = ExampleCatPool()
+        pool._fill()
+        for status, target in pool.targets.items():
+            self.assertEqual(target, len(pool.ready[status]))
+            for pooled_cat in pool.ready[status]:
+                self.assertNotIn(pooled_cat.ID, Cat.all_cats)
+                self.assertNotIn(pooled_cat, Cat.all_cats_list)
+
+        pooled_cat = pool.ready["elder"][0]
+        taken_cat = pool.take("elder")
+        self.assertIs(pooled_cat, taken_cat)
+        self.assertIs(Cat.all_cats[taken_cat.ID], taken_cat)
+        self.assertIn(taken_cat, Cat.all_cats_list)
+
+    def test_taken_cat_gets_new_id_if_taken(self):
+        pool = ExampleCatPool()
+        pooled_cat = Cat(status="warrior", register=False)
+        pool.ready["warrior"].append(pooled_cat)
+        other_cat = Cat(status="warrior", ID=pooled_cat.ID)
+
+        taken_cat = pool.take("warrior")
+        self.assertNotEqual(other_cat.ID, taken_cat.ID)
+        self.assertIs(Cat.all_cats[other_cat.ID], other_cat)
+        self.assertIs(Cat.all_cats[taken_cat.ID], taken_cat)
+
+    def test_empty_pool_makes_cat(self):
+        taken_cat = ExampleCatPool().take("kitten")
+        self.assertEqual("kitten", taken_cat.status)
+        self.assertIs(Cat.all_cats[taken_cat.ID], taken_cat)
+
+    def test_unregistered_cats_leave_mate_index_alone(self):
+        mate_buckets = Cat.get_mate_buckets()
+        pooled_cat = Cat(moons=20, status="warrior", register=False)
+        pooled_cat.moons = 130
+        pooled_cat.dead = True
+        self.assertIs(mate_buckets, Cat.mate_buckets)
+
+
+class TestBatchCreation(unittest.TestCase):
+    @staticmethod
+    def create_litter(batch):
+        """Creates a small family with a new litter, and returns who is related to whom, by creation order."""
+        grandparent = Cat(moons=100, status="elder")
+        parent1 = Cat(moons=40, status="warrior", parent1=grandparent.ID)
+        parent2 = Cat(moons=40, status="warrior")
+        aunt = Cat(moons=40, status="warrior", parent1=grandparent.ID)
+        Cat(moons=40, status="loner").outside = True
+        Cat(moons=40, status="warrior").dead = True
+        for old_cat in list(Cat.all_cats.values()):
+            old_cat.create_inheritance_new_cat()
+
+        litter = [Cat(moons=0, status="newborn", parent1=parent1.ID, parent2=parent2.ID) for _ in range(3)]
+        if batch:
+            Cat.create_relationships_new_cats(litter)
+            Cat.create_inheritance_new_cats(litter)
+        else:
+            for kit in litter:
+                kit.create_relationships_new_cat()
+            for kit in litter:
+                kit.create_inheritance_new_cat()
+
+        order = {cat_id: index for index, cat_id in enumerate(Cat.all_cats)}
+        state = []
+        for the_cat in Cat.all_cats.values():
+            relatives = {}
+            for relation in ("parents", "siblings", "kits", "grand_parents", "grand_kits", "parents_siblings"):
+                relatives[relation] = sorted(order[i] for i in getattr(the_cat.inheritance, relation))
+            state.append((sorted(order[i] for i in the_cat.relationships), relatives))
+        return state
+
+    def test_batch_same_as_sequential(self):
+        with patch.dict(Cat.all_cats, clear=True), patch.dict(Inheritance.all_inheritances, clear=True):
+            sequential = self.create_litter(batch=False)
+        with patch.dict(Cat.all_cats, clear=True), patch.dict(Inheritance.all_inheritances, clear=True):
+            batch = self.create_litter(batch=True)
+
+        self.assertEqual(sequential, batch)
+        # the relatives of the litter know about it as well
+        self.assertEqual([6, 7, 8], batch[0][1]["grand_kits"])
+        self.assertEqual([7, 8], batch[6][1]["siblings"])
+        # no relationships to the loner outside or the dead cat
+        self.assertEqual([0, 1, 2, 3, 7, 8], batch[6][0])
@@ -1,10 +1,17 @@
 import os
+import random
 import unittest
+from unittest.mock import patch
 
 import ujson
 
 from scripts.cat.cats import Cat
+from scripts.cat.history import History
+from scripts.clan import Clan
 from scripts.conditions import medical_cats_condition_fulfilled
+from scripts.events_module.condition_events import Condition_Events
+from scripts.events_module.scar_events import Scar_Events
+from scripts.game_structure.game_essentials import game
 
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
@@ -80,4 +87,148 @@ class TestInjury(unittest.TestCase):
         with open(f"{resource_directory}Injuries.json", 'r') as read_file:
             injuries = ujson.loads(read_file.read())
         return injuries
-    
\ No newline at end of file
+    
+
+class TestCompiledConditionTables(unittest.TestCase):
+    def test_herb_priority_matches_herb_order(self):
+        for table, source in (
+                (Condition_Events.ILLNESS_TABLE, Condition_Events.ILLNESSES),
+                (Condition_Events.INJURY_TABLE, Condition_Events.INJURIES),
+                (Condition_Events.PERMANENT_TABLE, Condition_Events.PERMANENT),
+        ):
+            for name, info in source.items():
+                for herb in info["herbs"]:
+                    self.assertEqual(info["herbs"].index(herb) + 1, table[name].herb_priority[herb])
+
+    def test_strings_match_json(self):
+        for name in Condition_Events.ILLNESSES:
+            compiled = Condition_Events.ILLNESS_TABLE[name]
+            self.assertEqual(Condition_Events.ILLNESS_HEALED_STRINGS.get(name), compiled.healed_strings)
+            self.assertEqual(Condition_Events.ILLNESS_DEATH_STRINGS.get(name), compiled.death_strings)
+            self.assertEqual(Condition_Events.ILLNESS_RISK_STRINGS.get(name, {}), compiled.risk_strings)
+
+    def test_unknown_condition(self):
+        compiled = Condition_Events.INJURY_TABLE["not a real injury"]
+        self.assertIsNone(compiled.herbs)
+        self.assertIsNone(compiled.death_strings)
+
+
+class TestConditionProgression(unittest.TestCase):
+    """Runs condition progression with a fixed seed and compares it to the result of the implementation
+    that walked the condition dicts directly, before the tables were compiled."""
+
+    # (moons, status) for each cat, with the medicine cat first
+    cats = [(40, "medicine cat"), (20, "warrior"), (70, "warrior"), (130, "elder"), (4, "kitten"),
+            (8, "apprentice"), (30, "warrior"), (100, "elder"), (15, "warrior"), (55, "warrior"),
+            (3, "kitten"), (25, "warrior"), (9, "apprentice"), (60, "warrior"), (140, "elder")]
+
+    expected_state = [
+        (False, [], [("severe burn", 30, 4, None, (15,))], []),
+        (False, [], [], [("crooked jaw", 0, 0, ())]),
+        (False, [], [], []),
+        (False, [], [], []),
+        (False, [], [], []),
+        (False, [("malnourished", 0, 99, ())], [("broken bone", 45, 5, None, (5,))], []),
+        (True, [], [], []),
+        (False, [], [], [("lost a leg", 0, 0, (70, 20, 20))]),
+        (True, [], [], []),
+        (False, [("an infected wound", 10, 2, (10,))], [], []),
+        (False, [("an infected wound", 3, 3, (10,))], [("damaged eyes", 30, 6, "infected", (0,))], []),
+        (False, [], [], [("failing eyesight", 0, -2, (50,))]),
+        (True, [], [], []),
+        (False, [], [], []),
+        (False, [("grief stricken", 0, 4, (100, 15))], [], []),
+    ]
+
+    def setUp(self):
+        self.all_cats = Cat.all_cats
+        Cat.all_cats = {}
+        self.clan = game.clan
+        self.switches = dict(game.switches)
+        self.cur_events_list = game.cur_events_list
+        self.herb_events_list = game.herb_events_list
+
+        # risk chances get adjusted on the shared condition dicts, so start from clean ones
+        fresh = {}
+        for attr, file in (("ILLNESSES", "illnesses"), ("INJURIES", "injuries"),
+                           ("PERMANENT", "permanent_conditions")):
+            with open(f"resources/dicts/conditions/{file}.json", "r") as read_file:
+                fresh[attr] = ujson.loads(read_file.read())
+        self.fresh_conditions = patch.multiple("scripts.cat.cats", **fresh)
+        self.fresh_conditions.start()
+        # scars are picked from a set, which makes their order depend on string hashing
+        self.no_scars = patch.object(Scar_Events, "handle_scars", return_value=(None, None))
+        self.no_scars.start()
+
+    def tearDown(self):
+        self.no_scars.stop()
+        self.fresh_conditions.stop()
+        Cat.all_cats = self.all_cats
+        game.clan = self.clan
+        game.switches.clear()
+        game.switches.update(self.switches)
+        game.cur_events_list = self.cur_events_list
+        game.herb_events_list = self.herb_events_list
+
+    def run_moons(self, seed, moons):
+        clan = Clan(name="test", game_mode="expanded", self_run_init_functions=False)
+        game.clan = clan
+        clan.age = 0
+        clan.instructor = Cat(moons=50, status="warrior")
+        clan.instructor.dead = True
+        clan.herbs = {"cobwebs": 40}
+        clan.clan_settings = {"retirement": True}
+        game.cur_events_list = []
+        game.herb_events_list = []
+
+        all_cats = []
+        for age, status in self.cats:
+            cat = Cat(moons=age, status=status)
+            cat.history = History()
+            all_cats.append(cat)
+        clan.medicine_cat = all_cats[0]
+
+        random.seed(seed)
+        illnesses = sorted(Condition_Events.ILLNESSES)
+        injuries = sorted(Condition_Events.INJURIES)
+        permanent = sorted(Condition_Events.PERMANENT)
+        for cat in all_cats:
+            for _ in range(random.randint(0, 2)):
+                cat.get_ill(random.choice(illnesses))
+            for _ in range(random.randint(0, 2)):
+                cat.get_injured(random.choice(injuries))
+            if random.random() < 0.3:
+                name = random.choice(permanent)
+                congenital = Condition_Events.PERMANENT[name]["congenital"] in ["always", "sometimes"]
+                cat.get_permanent_condition(name, born_with=congenital and random.random() < 0.5)
+
+        for _ in range(moons):
+            clan.age += 1
+            game.switches["skip_conditions"] = []
+            for cat in all_cats:
+                if cat.dead:
+                    continue
+                Condition_Events.handle_already_ill(cat)
+                Condition_Events.handle_already_injured(cat)
+                Condition_Events.handle_already_disabled(cat)
+
+        state = []
+        for cat in all_cats:
+            state.append((
+                cat.dead,
+                sorted((name, info["mortality"], info["duration"], tuple(r["chance"] for r in info["risks"]))
+                       for name, info in cat.illnesses.items()),
+                sorted((name, info["mortality"], info["duration"], info["complication"],
+                        tuple(r["chance"] for r in info["risks"]))
+                       for name, info in cat.injuries.items()),
+                sorted((name, info["mortality"], info["moons_until"], tuple(r["chance"] for r in info["risks"]))
+                       for name, info in cat.permanent_condition.items()),
+            ))
+        return state, clan.herbs, len(game.cur_events_list), len(game.herb_events_list)
+
+    def test_matches_previous_implementation(self):
+        state, herbs, events, herb_events = self.run_moons(seed=12, moons=3)
+        self.assertEqual(self.expected_state, state)
+        self.assertEqual({"cobwebs": 17}, herbs)
+        self.assertEqual(11, events)
+        self.assertEqual(44, herb_events)
@@ -0,0 +1,40 @@
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from scripts.cat.cats import Cat, Relationship
+from scripts.cat_relations.constraints import compile_constraints
+
+
+class TestCompileConstraints(unittest.TestCase):
+
+    def test_compiled_once(self):
+        self.assertIs(
+            compile_constraints(["not_mates", "platonic_20"]),
+            compile_constraints(["not_mates", "platonic_20"]),
+        )
+
+    def test_mistakes_are_reported_when_compiled(self):
+        output = StringIO()
+        with redirect_stdout(output):
+            compiled = compile_constraints(["romantic_120"], "interaction test")
+        self.assertIn("ERROR: interaction test", output.getvalue())
+
+        cat_from = Cat()
+        cat_to = Cat()
+        rel = Relationship(cat_from, cat_to)
+        rel.romantic_love = 100
+        self.assertFalse(compiled.check_relationship(rel))
+        self.assertFalse(compiled.check_group([cat_from, cat_to]))
+
+    def test_admiration_and_lower(self):
+        cat_from = Cat()
+        cat_to = Cat()
+        rel = Relationship(cat_from, cat_to)
+        rel.admiration = 50
+        rel.dislike = 10
+
+        self.assertTrue(compile_constraints(["admiration_50"]).check_relationship(rel))
+        self.assertFalse(compile_constraints(["admiration_60"]).check_relationship(rel))
+        self.assertTrue(compile_constraints(["dislike_20_lower"]).check_relationship(rel))
+        self.assertFalse(compile_constraints(["dislike_5_lower"]).check_relationship(rel))
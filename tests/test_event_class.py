@@ -0,0 +1,45 @@
+import unittest
+
+from scripts.event_class import Single_Event, Event_List
+
+
+class TestEventList(unittest.TestCase):
+
+    def setUp(self):
+        self.death = Single_Event("A cat died.", ["birth_death"], ["1", "2"])
+        self.illness = Single_Event("A cat got sick.", "health", "2")
+        self.chat = Single_Event("Two cats talked.", ["interaction", "relation"], ["1", "3"])
+
+    def test_views_follow_appends(self):
+        events = Event_List()
+        events.append(self.death)
+        events.append(self.illness)
+        events += [self.chat]
+
+        self.assertEqual([self.death], events.get_events_of_type("birth_death"))
+        self.assertEqual([self.chat], events.get_events_of_type("relation"))
+        self.assertEqual([], events.get_events_of_type("misc"))
+        self.assertEqual([self.death, self.illness], events.get_events_without_type("interaction"))
+        self.assertEqual([self.death, self.illness], events.get_events_of_cat("2"))
+        self.assertEqual([self.death, self.chat], events.get_events_of_cat("1"))
+
+    def test_views_keep_list_order_after_insert(self):
+        events = Event_List([self.death, self.illness])
+        events.insert(0, self.chat)
+        events.insert(0, Single_Event("Another death.", "birth_death", "2"))
+
+        self.assertEqual(events.get_events_of_cat("2"), [e for e in events if "2" in e.cats_involved])
+        self.assertEqual([events[0], self.death], events.get_events_of_type("birth_death"))
+        self.assertEqual([events[0], self.death, self.illness], events.get_events_without_type("interaction"))
+
+    def test_clear(self):
+        events = Event_List([self.death, self.chat])
+        events.clear()
+        self.assertEqual([], events.get_events_of_cat("1"))
+        self.assertEqual([], events.get_events_without_type("interaction"))
+
+    def test_serializes_like_a_list(self):
+        events = Event_List([self.death, self.illness])
+        loaded = Event_List(Single_Event.from_dict(event.to_dict()) for event in events)
+        self.assertEqual([e.to_dict() for e in events], [e.to_dict() for e in loaded])
+        self.assertEqual(1, len(loaded.get_events_of_type("health")))
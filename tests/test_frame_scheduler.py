@@ -0,0 +1,43 @@
+import time
+import unittest
+
+import pygame
+
+from scripts.game_structure.frame_scheduler import FrameScheduler
+from scripts.game_structure.game_essentials import game
+
+
+class TestFrameScheduler(unittest.TestCase):
+
+    def test_drops_to_idle_rate_without_input(self):
+        scheduler = FrameScheduler()
+        scheduler.wait_for_next_frame()
+        self.assertFalse(scheduler.idle)
+
+        scheduler.last_active = time.perf_counter() - scheduler.idle_after - 1
+        pygame.event.clear()
+        scheduler.wait_for_next_frame()
+        self.assertTrue(scheduler.idle)
+        self.assertTrue(scheduler.get_stats()["idle"])
+
+    def test_input_wakes_it_up(self):
+        scheduler = FrameScheduler()
+        scheduler.last_active = time.perf_counter() - scheduler.idle_after - 1
+        pygame.event.clear()
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_a}))
+
+        scheduler.wait_for_next_frame()
+        events = scheduler.get_events()
+
+        self.assertIn(pygame.KEYDOWN, [event.type for event in events])
+        self.assertFalse(scheduler.idle)
+
+    def test_stays_active_while_busy(self):
+        scheduler = FrameScheduler()
+        scheduler.last_active = time.perf_counter() - scheduler.idle_after - 1
+        game.switches["window_open"] = True
+        try:
+            scheduler.wait_for_next_frame()
+        finally:
+            game.switches["window_open"] = False
+        self.assertFalse(scheduler.idle)
@@ -0,0 +1,34 @@
+import unittest
+
+from scripts.game_structure import image_cache
+from scripts.game_structure.game_essentials import game  # pylint: disable=unused-import
+
+
+class TestImageCache(unittest.TestCase):
+
+    def setUp(self):
+        image_cache.clear()
+        self.budget = image_cache.memory_budget
+
+    def tearDown(self):
+        image_cache.memory_budget = self.budget
+        image_cache.clear()
+
+    def test_scaled_images_are_reused(self):
+        first = image_cache.load_scaled("resources/images/fav_marker.png", (50, 50))
+        second = image_cache.load_scaled("resources/images/fav_marker.png", (50, 50))
+        other_size = image_cache.load_scaled("resources/images/fav_marker.png", (60, 60))
+
+        self.assertIs(first, second)
+        self.assertEqual((50, 50), first.get_size())
+        self.assertEqual((60, 60), other_size.get_size())
+
+    def test_least_recently_used_images_are_dropped(self):
+        image_cache.memory_budget = 50 * 50 * 4 * 2
+        first = image_cache.load_scaled("resources/images/fav_marker.png", (50, 50))
+        image_cache.load_scaled("resources/images/fav_marker.png", (49, 49))
+
+        self.assertLessEqual(image_cache.get_stats()["bytes"], image_cache.memory_budget)
+        self.assertIsNot(
+            first, image_cache.load_scaled("resources/images/fav_marker.png", (50, 50))
+        )
@@ -0,0 +1,37 @@
+import unittest
+
+from scripts.cat.cats import Cat
+from scripts.cat_relations import incoming
+from scripts.cat_relations.relationship import Relationship
+
+
+class TestIncomingRelationships(unittest.TestCase):
+
+    def setUp(self):
+        self.cat = Cat()
+        self.lover = Cat()
+        self.friend = Cat()
+        self.to_cat_from_lover = Relationship(self.lover, self.cat, romantic_love=60)
+        self.to_cat_from_friend = Relationship(self.friend, self.cat, romantic_love=20)
+        self.lover.relationships[self.cat.ID] = self.to_cat_from_lover
+        self.friend.relationships[self.cat.ID] = self.to_cat_from_friend
+
+    def test_threshold_query(self):
+        self.assertEqual(
+            [self.to_cat_from_lover],
+            incoming.get_incoming(self.cat, "romantic_love", minimum=56),
+        )
+
+        # the index follows the values as they change
+        self.to_cat_from_friend.romantic_love += 40
+        self.to_cat_from_lover.romantic_love -= 30
+        self.assertEqual(
+            [self.to_cat_from_friend],
+            incoming.get_incoming(self.cat, "romantic_love", minimum=56),
+        )
+
+    def test_replaced_relationships_are_left_out(self):
+        self.lover.relationships[self.cat.ID] = Relationship(self.lover, self.cat)
+
+        self.assertNotIn(self.to_cat_from_lover, incoming.get_incoming(self.cat))
+        self.assertEqual(2, len(incoming.get_incoming(self.cat)))
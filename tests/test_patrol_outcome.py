@@ -0,0 +1,49 @@
+import unittest
+
+from scripts.cat.cats import Cat
+from scripts.clan import Clan
+from scripts.patrol.patrol import Patrol
+from scripts.patrol.patrol_outcome import PatrolOutcome
+
+
+class TestPrepareAllowedOutcomes(unittest.TestCase):
+    def setUp(self):
+        self.patrol_cat = Cat(moons=20, status="warrior")
+        self.patrol_cat.personality.trait = "troublesome"
+        self.patrol = Patrol()
+        self.patrol.add_patrol_cats([self.patrol_cat], Clan())
+        self.regular = PatrolOutcome(text="regular")
+
+    def test_stat_cat_set_on_copy(self):
+        special = PatrolOutcome(text="special", stat_trait=["troublesome"])
+
+        allowed = PatrolOutcome.prepare_allowed_outcomes([self.regular, special], self.patrol)
+
+        self.assertEqual(1, len(allowed))
+        self.assertEqual("special", allowed[0].text)
+        self.assertIs(self.patrol_cat, allowed[0].stat_cat)
+        # the outcome itself is shared between patrols, and stays untouched
+        self.assertIsNot(special, allowed[0])
+        self.assertIsNone(special.stat_cat)
+
+    def test_stat_cat_status(self):
+        special = PatrolOutcome(text="special", stat_trait=["troublesome"], can_have_stat=["app"])
+
+        allowed = PatrolOutcome.prepare_allowed_outcomes([self.regular, special], self.patrol)
+
+        self.assertEqual([self.regular], allowed)
+
+
+class TestCompiledOutcome(unittest.TestCase):
+    def test_prey_size(self):
+        self.assertEqual("medium", PatrolOutcome(prey=["medium"]).prey_size)
+        self.assertIsNone(PatrolOutcome(prey=["plenty"]).prey_size)
+
+    def test_injury_blocks(self):
+        outcome = PatrolOutcome(injury=[{"cats": ["p_l"], "injuries": ["cold_injury", "sprain", "non_lethal"]}])
+
+        _, possible_injuries, lethal = outcome.injury_blocks[0]
+        self.assertIn("sprain", possible_injuries)
+        self.assertIn("frostbite", possible_injuries)
+        self.assertNotIn("non_lethal", possible_injuries)
+        self.assertFalse(lethal)
@@ -3,6 +3,7 @@ import unittest
 from unittest.mock import patch
 
 from scripts.cat.cats import Cat
+from scripts.cat_relations.family_groups import FamilyGroups
 from scripts.cat_relations.relationship import Relationship
 from scripts.clan import Clan
 from scripts.events_module.relationship.pregnancy_events import Pregnancy_Events
@@ -72,6 +73,51 @@ class SameSexAdoptions(unittest.TestCase):
         self.assertTrue(kits_are_adopted)
 
 
+class BiggestFamily(unittest.TestCase):
+    def test_birth_joins_families(self):
+        # given
+        groups = FamilyGroups()
+        mother = Cat(gender='female')
+        father = Cat(gender='male')
+        loner = Cat()
+        groups.build({cat.ID: cat for cat in (mother, father, loner)})
+        self.assertEqual(groups.biggest_family_size(), 1)
+
+        # when
+        kit = Cat(parent1=mother.ID, parent2=father.ID)
+        groups.add_cat(kit)
+
+        # then
+        self.assertEqual(groups.biggest_family_size(), 3)
+        self.assertTrue(groups.in_biggest_family(mother.ID))
+        self.assertTrue(groups.in_biggest_family(father.ID))
+        self.assertFalse(groups.in_biggest_family(loner.ID))
+
+    def test_adoption_and_fading(self):
+        # given
+        groups = FamilyGroups()
+        parent = Cat()
+        kit = Cat(parent1=parent.ID)
+        adoptive_parent = Cat()
+        groups.build({cat.ID: cat for cat in (parent, kit, adoptive_parent)})
+
+        # when
+        kit.adoptive_parents.append(adoptive_parent.ID)
+        groups.add_cat(kit)
+        groups.add_cat(kit)
+
+        # then
+        self.assertEqual(groups.biggest_family_size(), 3)
+
+        # when - the faded kit still connects the family, but isn't counted anymore
+        groups.remove_cat(kit.ID)
+
+        # then
+        self.assertEqual(groups.biggest_family_size(), 2)
+        self.assertTrue(groups.in_biggest_family(parent.ID))
+        self.assertTrue(groups.in_biggest_family(adoptive_parent.ID))
+
+
 class Pregnancy(unittest.TestCase):
     @patch('scripts.events_module.relationship.pregnancy_events.Pregnancy_Events.check_if_can_have_kits')
     def test_single_cat_female(self, check_if_can_have_kits):
@@ -0,0 +1,30 @@
+import io
+import unittest
+
+from scripts.housekeeping.stream_duplexer import QueuedStreamDuplexer
+
+
+class TestQueuedStreamDuplexer(unittest.TestCase):
+
+    def test_writes_to_both_streams(self):
+        first, second = io.StringIO(), io.StringIO()
+        duplexer = QueuedStreamDuplexer(first, second)
+        print("hello", file=duplexer)
+        print("there", end="", file=duplexer)
+        duplexer.drain()
+
+        self.assertEqual("hello\nthere", first.getvalue())
+        self.assertEqual("hello\nthere", second.getvalue())
+
+    def test_repeated_lines_are_left_out(self):
+        first, second = io.StringIO(), io.StringIO()
+        duplexer = QueuedStreamDuplexer(first, second, dedupe=True, repeat_limit=3)
+        for _ in range(10):
+            print("WARNING: something is off", file=duplexer)
+        print("something else", file=duplexer)
+        duplexer.drain()
+
+        lines = second.getvalue().splitlines()
+        self.assertEqual(3, lines.count("WARNING: something is off"))
+        self.assertIn("something else", lines)
+        self.assertIn("[left out 7 more of: WARNING: something is off]", lines)
@@ -0,0 +1,57 @@
+import threading
+import unittest
+
+from scripts.housekeeping.task_graph import TaskGraph
+
+
+class TestTaskGraph(unittest.TestCase):
+
+    def test_waits_for_dependencies(self):
+        order = []
+        graph = TaskGraph()
+        graph.add_task("read", lambda: order.append("read"))
+        graph.add_task("parse", lambda: order.append("parse"), after=["read"])
+        graph.add_task("build", lambda: order.append("build"), after=["parse", "read"])
+        graph.run()
+
+        self.assertEqual(["read", "parse", "build"], order)
+        self.assertEqual(3, len(graph.timeline()))
+
+    def test_independent_tasks_overlap(self):
+        # each task only finishes once the other one has started
+        first_started = threading.Event()
+        second_started = threading.Event()
+
+        def first():
+            first_started.set()
+            self.assertTrue(second_started.wait(5))
+
+        def second():
+            second_started.set()
+            self.assertTrue(first_started.wait(5))
+
+        graph = TaskGraph(max_workers=2)
+        graph.add_task("first", first)
+        graph.add_task("second", second)
+        graph.run()
+
+    def test_failure_skips_dependent_tasks(self):
+        ran = []
+
+        def broken():
+            raise KeyError("ID")
+
+        graph = TaskGraph()
+        graph.add_task("broken", broken)
+        graph.add_task("after broken", lambda: ran.append("after broken"), after=["broken"])
+        graph.add_task("independent", lambda: ran.append("independent"))
+
+        with self.assertRaises(KeyError):
+            graph.run()
+        self.assertEqual(["independent"], ran)
+        self.assertEqual(["after broken"], graph.skipped)
+
+    def test_unknown_dependency(self):
+        graph = TaskGraph()
+        with self.assertRaises(ValueError):
+            graph.add_task("parse", lambda: None, after=["read"])
@@ -1,14 +1,25 @@
 import os
+import random
 import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pygame
 
 from scripts.cat.cats import Cat
+from scripts.cat.pelts import Pelt
+from scripts.cat.sprites import sprites
 from scripts.cat_relations.relationship import Relationship
 from scripts.utility import (
     get_highest_romantic_relation,
     get_personality_compatibility,
     get_amount_of_cats_with_relation_value_towards,
-    get_alive_clan_queens
+    get_alive_clan_queens,
+    shorten_text_to_fit,
+    generate_sprite
 )
+from scripts.game_structure import text_measure
+from scripts.game_structure.game_essentials import game
 
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
@@ -337,3 +348,140 @@ class TestGetQueens(unittest.TestCase):
         # then
         living_cats = [self.test_cat1, self.test_cat2, self.test_cat3, self.test_cat4, self.test_cat5, self.test_cat6]
         self.assertEqual([self.test_cat2.ID], list(get_alive_clan_queens(living_cats)[0].keys()))
+
+
+class TestShortenTextToFit(unittest.TestCase):
+
+    def test_short_name_unchanged(self):
+        self.assertEqual("Firepaw", shorten_text_to_fit("Firepaw", 500, 30))
+
+    def test_long_name_truncated(self):
+        name = "Brambleberryfrostwhisker" * 3
+        short_name = shorten_text_to_fit(name, 200, 30)
+        self.assertTrue(short_name.endswith("..."))
+        self.assertLess(len(short_name), len(name))
+
+    def test_fonts_are_reused(self):
+        shorten_text_to_fit("Sandstorm", 200, 30)
+        fonts = dict(text_measure._fonts)
+        shorten_text_to_fit("Graystripe", 200, 30)
+        self.assertEqual(fonts, text_measure._fonts)
+
+
+def _tinted(surface, colour, flag):
+    tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
+    tint.fill(tuple(colour))
+    surface.blit(tint, (0, 0), special_flags=flag)
+
+
+def _old_generate_sprite(cat, cat_sprite):
+    """generate_sprite as it was before the tinted layers were cached, without the accessories."""
+    pelt = cat.pelt
+    new_sprite = pygame.Surface((sprites.size, sprites.size), pygame.HWSURFACE | pygame.SRCALPHA)
+
+    if pelt.name not in ["Tortie", "Calico"]:
+        new_sprite.blit(sprites.sprites[pelt.get_sprites_name() + pelt.colour + cat_sprite], (0, 0))
+    else:
+        new_sprite.blit(sprites.sprites[pelt.tortiebase + pelt.colour + cat_sprite], (0, 0))
+        tortie_pattern = "SingleColour" if pelt.tortiepattern == "Single" else pelt.tortiepattern
+        patches = sprites.sprites[tortie_pattern + pelt.tortiecolour + cat_sprite].copy()
+        patches.blit(
+            sprites.sprites["tortiemask" + pelt.pattern + cat_sprite], (0, 0), special_flags=pygame.BLEND_RGBA_MULT
+        )
+        new_sprite.blit(patches, (0, 0))
+
+    if pelt.tint != "none" and pelt.tint in sprites.cat_tints["tint_colours"]:
+        _tinted(new_sprite, sprites.cat_tints["tint_colours"][pelt.tint], pygame.BLEND_RGB_MULT)
+    if pelt.tint != "none" and pelt.tint in sprites.cat_tints["dilute_tint_colours"]:
+        _tinted(new_sprite, sprites.cat_tints["dilute_tint_colours"][pelt.tint], pygame.BLEND_RGB_ADD)
+
+    for white in (pelt.white_patches, pelt.points):
+        if not white:
+            continue
+        white_sprite = sprites.sprites["white" + white + cat_sprite].copy()
+        if pelt.white_patches_tint != "none" and pelt.white_patches_tint in sprites.white_patches_tints["tint_colours"]:
+            _tinted(
+                white_sprite,
+                sprites.white_patches_tints["tint_colours"][pelt.white_patches_tint],
+                pygame.BLEND_RGB_MULT,
+            )
+        new_sprite.blit(white_sprite, (0, 0))
+
+    if pelt.vitiligo:
+        new_sprite.blit(sprites.sprites["white" + pelt.vitiligo + cat_sprite], (0, 0))
+
+    eyes = sprites.sprites["eyes" + pelt.eye_colour + cat_sprite].copy()
+    if pelt.eye_colour2 is not None:
+        eyes.blit(sprites.sprites["eyes2" + pelt.eye_colour2 + cat_sprite], (0, 0))
+    if pelt.eye_colour not in Pelt.riveye_colours:
+        new_sprite.blit(eyes, (0, 0))
+
+    for scar in pelt.scars:
+        if scar in pelt.scars1 or scar in pelt.scars3:
+            new_sprite.blit(sprites.sprites["scars" + scar + cat_sprite], (0, 0))
+
+    if game.settings["shaders"] and not cat.dead:
+        new_sprite.blit(sprites.sprites["shaders" + cat_sprite], (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+        new_sprite.blit(sprites.sprites["lighting" + cat_sprite], (0, 0))
+
+    if not cat.dead:
+        new_sprite.blit(sprites.sprites["lines" + cat_sprite], (0, 0))
+    elif cat.df:
+        new_sprite.blit(sprites.sprites["lineartdf" + cat_sprite], (0, 0))
+    else:
+        new_sprite.blit(sprites.sprites["lineartdead" + cat_sprite], (0, 0))
+
+    if pelt.eye_colour in Pelt.riveye_colours:
+        new_sprite.blit(eyes, (0, 0))
+
+    new_sprite.blit(sprites.sprites["skin" + pelt.skin + cat_sprite], (0, 0))
+    for scar in pelt.scars:
+        if scar in pelt.scars2:
+            new_sprite.blit(
+                sprites.sprites["scars" + scar + cat_sprite], (0, 0), special_flags=pygame.BLEND_RGBA_MIN
+            )
+
+    if pelt.opacity <= 97 and cat.dead:
+        stage = "0"
+        if 80 >= pelt.opacity > 45:
+            stage = "1"
+        elif pelt.opacity <= 45:
+            stage = "2"
+        new_sprite.blit(
+            sprites.sprites["fademask" + stage + cat_sprite], (0, 0), special_flags=pygame.BLEND_RGBA_MULT
+        )
+        temp = sprites.sprites[("fadedf" if cat.df else "fadestarclan") + stage + cat_sprite].copy()
+        temp.blit(new_sprite, (0, 0))
+        new_sprite = temp
+
+    if pelt.reverse:
+        new_sprite = pygame.transform.flip(new_sprite, True, False)
+    return new_sprite
+
+
+class TestGenerateSprite(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.set_mode((1, 1))
+        sprites.load_all()
+
+    def test_same_as_old_renderer(self):
+        rng = random.Random(7)
+        cats = []
+        for i in range(120):
+            cat = Cat(moons=rng.choice([3, 8, 20, 60, 130]))
+            cat.dead = i % 3 == 0
+            cat.df = i % 6 == 0
+            cat.pelt.opacity = rng.choice([100, 90, 60, 30])
+            cat.pelt.accessories = []
+            cat.pelt.paralyzed = False
+            cats.append(cat)
+
+        with patch.object(game, "clan", SimpleNamespace(clan_settings={"fading": True})):
+            for cat in cats:
+                cat_sprite = str(cat.pelt.cat_sprites["senior" if cat.age == "elder" else cat.age])
+                self.assertEqual(
+                    pygame.image.tobytes(_old_generate_sprite(cat, cat_sprite), "RGBA"),
+                    pygame.image.tobytes(generate_sprite(cat, no_not_working=True), "RGBA"),
+                )
@@ -0,0 +1,41 @@
+import random
+import unittest
+from collections import Counter
+
+from scripts.game_structure.weighted_choice import AliasTable, weighted_choice
+
+
+class TestAliasTable(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(42)
+
+    def test_odds_follow_weights(self):
+        table = AliasTable(["minor", "major", "severe"], [6, 3, 1])
+        counts = Counter(table.choice() for _ in range(20000))
+        self.assertAlmostEqual(counts["minor"] / 20000, 0.6, delta=0.02)
+        self.assertAlmostEqual(counts["major"] / 20000, 0.3, delta=0.02)
+        self.assertAlmostEqual(counts["severe"] / 20000, 0.1, delta=0.02)
+
+    def test_zero_weight_never_picked(self):
+        table = AliasTable(["a", "b"], [0, 5])
+        self.assertEqual({"b"}, {table.choice() for _ in range(500)})
+
+    def test_empty_pool(self):
+        with self.assertRaises(ValueError):
+            AliasTable([])
+
+    def test_choice_where_keeps_odds(self):
+        table = AliasTable(list(range(10)), [1, 1, 1, 1, 1, 1, 1, 1, 1, 3])
+        counts = Counter(table.choice_where(lambda x: x in (0, 9)) for _ in range(8000))
+        self.assertEqual({0, 9}, set(counts))
+        self.assertAlmostEqual(counts[9] / 8000, 0.75, delta=0.03)
+
+    def test_choice_where_rare_and_missing(self):
+        table = AliasTable(list(range(1000)))
+        self.assertEqual(500, table.choice_where(lambda x: x == 500))
+        self.assertIsNone(table.choice_where(lambda x: x < 0))
+
+    def test_weighted_choice(self):
+        self.assertEqual("b", weighted_choice(["a", "b"], [0, 1]))
+        self.assertIn(weighted_choice(["a", "b"], [20, 20]), ["a", "b"])